@@ -1,17 +1,37 @@
 from .lib.datetime.tools.datetime import get_date, get_time
-from .lib.datetime.tools.wiat import wait
+from .lib.datetime.tools.wiat import wait, wait_until
 from .base.base_mcp import create_mcp
 
 
 from .base.base_mcp import create_mcp
-from .lib.logging import read_logs, logger
+from .lib.cache import cached_tool, invalidates, invalidate_cache
+from .lib.executors import blocking, run_on_caller_loop
+from .lib.logging import read_errors, read_logs, tool_stats, logger
+from .lib.progress import report_progress, streams_progress
 from .lib.scheduler.tools.celery import (
+    get_services_status,
     start_scheduler_services,
     stop_scheduler_services,
 )
+from .lib.scheduler.tools.tasks import (
+    cancel_recurring_schedule,
+    get_scheduled_results,
+    list_upcoming_runs,
+    revoke_scheduled_tasks,
+)
 
 
-__all__ = ["create_mcp", "logger"]
+__all__ = [
+    "create_mcp",
+    "blocking",
+    "run_on_caller_loop",
+    "cached_tool",
+    "invalidates",
+    "invalidate_cache",
+    "streams_progress",
+    "report_progress",
+    "logger",
+]
 
 
 def hello() -> str:
@@ -25,10 +45,18 @@ def run_server():
         "base",
         tools=[
             read_logs,
+            tool_stats,
+            read_errors,
             start_scheduler_services,
             stop_scheduler_services,
+            get_services_status,
+            revoke_scheduled_tasks,
+            list_upcoming_runs,
+            cancel_recurring_schedule,
+            get_scheduled_results,
             get_time,
             wait,
+            wait_until,
         ],
         parallel_tools=[get_date],
     )
@@ -1,13 +1,18 @@
 from mcp.server.fastmcp import FastMCP
-from typing import Callable, List
+from typing import Any, Callable, Dict, List, Tuple, Union
 
+from ..lib.cache import cache, uses_cache
 from ..lib.exceptions import exception_handler
-from ..lib.logging import logger, tool_logger
+from ..lib.executors import is_blocking, offload
+from ..lib.logging import install_db_logging, logger, tool_logger
 from ..lib.parallelize import parallelize
+from ..lib.progress import is_streaming, relay_progress
 
 
 def create_mcp(
-    name: str, tools: List[Callable], parallel_tools: List[Callable] = None
+    name: str,
+    tools: List[Callable],
+    parallel_tools: List[Union[Callable, Tuple[Callable, Dict[str, Any]]]] = None,
 ) -> FastMCP:
     """Creates and configures a FastMCP instance with specified tools and extended functionality.
 
@@ -23,20 +28,41 @@ def create_mcp(
         - Adding authentication or authorization checks
         - Performance monitoring and metrics collection
 
+    Log records of the server go to the log database from here on (see
+    ``install_db_logging`` in ``lib/logging.py``).
+
+    Sync tools, and async tools marked with ``@blocking``, are run in a bounded
+    executor (see ``lib/executors.py``) so they do not stall the event loop.
+    Sync tools can therefore run concurrently and must be thread-safe.
+    Results of tools marked with ``@cached_tool`` are cached, and tools marked
+    with ``@invalidates`` drop those caches (see ``lib/cache.py``). Progress
+    events of tools marked with ``@streams_progress`` are relayed to the client
+    (see ``lib/progress.py``).
+
     To add additional global functionality, create a new decorator and apply it in this function.
 
     Args:
         name: The name for the FastMCP instance.
         fns: A list of functions to be registered as tools with the MCP instance.
         parallel_fns: A list of functions to be registered as parallelized tools.
+            An entry can also be a ``(fn, limits)`` tuple, where limits are keyword
+            arguments for ``parallelize`` (max_concurrency, timeout, rate_limit),
+            so each parallel tool can declare its own limits.
 
     Returns:
         A configured FastMCP instance with extended functionality.
     """
+    install_db_logging()
     mcp = FastMCP(name)
 
     # Register regular tools
     for fn in tools:
+        if is_blocking(fn):
+            fn = offload(fn)
+        if is_streaming(fn):
+            fn = relay_progress(fn)
+        if uses_cache(fn):
+            fn = cache(fn, namespace=name)
         decorated_fn = exception_handler(fn)
         decorated_fn = tool_logger(decorated_fn)
         # TODO: Extend scheudler and parallizer decorators, these should be passed in
@@ -45,10 +71,17 @@ def create_mcp(
         mcp.tool()(decorated_fn)
 
     if parallel_tools:
-        for fn in parallel_tools:
+        for entry in parallel_tools:
+            fn, limits = entry if isinstance(entry, tuple) else (entry, {})
+            if is_blocking(fn):
+                fn = offload(fn)
+            if is_streaming(fn):
+                fn = relay_progress(fn)
+            if uses_cache(fn):
+                fn = cache(fn, namespace=name)
             decorated_fn = exception_handler(fn)
             decorated_fn = tool_logger(decorated_fn)
-            parallelized_fn = parallelize(decorated_fn)
+            parallelized_fn = parallelize(decorated_fn, **limits)
             mcp.tool()(parallelized_fn)
 
     return mcp
@@ -7,6 +7,11 @@ import os  # Added for os.getenv and os.environ.setdefault
 class RedisSettings(BaseSettings):
     URL: str = "redis://localhost:6379/0"
     BACKUP_PATH: Optional[str] = None
+    # Connection pool used by RedisClient / AsyncRedisClient
+    MAX_CONNECTIONS: int = 50
+    SOCKET_TIMEOUT: Optional[float] = 5.0
+    SOCKET_CONNECT_TIMEOUT: Optional[float] = 5.0
+    HEALTH_CHECK_INTERVAL: int = 30
 
     model_config = ConfigDict(
         env_file=".env",
@@ -29,6 +34,37 @@ class CelerySettings(BaseSettings):
     TIMEZONE: str = "UTC"
     ENABLE_UTC: bool = True
     BACKUP_PATH: Optional[str] = None
+    # Queues selectable per scheduled_tool: I/O-bound (async) tools run on a
+    # thread pool worker, CPU-bound tools on an autoscaled prefork worker.
+    IO_QUEUE: str = "io"
+    CPU_QUEUE: str = "cpu"
+    IO_POOL: str = "threads"
+    IO_CONCURRENCY: int = 50
+    # Scale the CPU worker between AUTOSCALE_MIN and its concurrency based on
+    # reserved tasks plus the broker queue depth, checked at most every
+    # AUTOSCALE_DEPTH_INTERVAL seconds. Waiting tasks only get the processes
+    # needed to finish them within AUTOSCALE_TARGET_LATENCY seconds at the
+    # measured task rate (0 gives every waiting task a process).
+    AUTOSCALE: bool = True
+    AUTOSCALE_MIN: int = 1
+    AUTOSCALE_DEPTH_INTERVAL: float = 2.0
+    AUTOSCALE_TARGET_LATENCY: float = 10.0
+    # Runs scheduled further ahead than DELAYED_THRESHOLD seconds wait in a
+    # Redis sorted set instead of worker memory, and are handed to workers by a
+    # beat task polling every DELAYED_POLL_INTERVAL seconds. Runs claimed by a
+    # poll that has not confirmed publishing them within DELAYED_CLAIM_TIMEOUT
+    # seconds are claimed again.
+    DELAYED_KEY: str = "saaga:delayed"
+    DELAYED_THRESHOLD: float = 300
+    DELAYED_POLL_INTERVAL: float = 1.0
+    DELAYED_BATCH_SIZE: int = 1000
+    DELAYED_CLAIM_TIMEOUT: float = 60
+    # Results larger than RESULT_COMPRESS_THRESHOLD bytes of JSON are stored
+    # zlib-compressed, results larger than RESULT_SPILL_THRESHOLD bytes are
+    # written to RESULT_SPILL_DIR and only referenced from Redis (0 disables).
+    RESULT_COMPRESS_THRESHOLD: int = 64 * 1024
+    RESULT_SPILL_THRESHOLD: int = 1024 * 1024
+    RESULT_SPILL_DIR: str = ".db/results"
 
     def get_broker_url(self) -> str:
         # Fetches the actual broker URL from an env var that will be set dynamically
@@ -76,6 +112,44 @@ class FlowerSettings(BaseSettings):
 
 class Settings(BaseSettings):
     sqldb_path: str = ".db/saaga-mcp-base.sqlite3"
+    # Batched log sink: records are flushed when log_batch_size is reached or
+    # every log_flush_interval seconds, whichever comes first.
+    log_batch_size: int = 500
+    log_flush_interval: float = 0.5
+    # Longest the log readers wait for buffered records to be written
+    log_flush_timeout: float = 5
+    log_queue_max_size: int = 10000
+    # What to do when the log queue is full: "block" (backpressure) or "drop"
+    log_overflow_policy: str = "block"
+    # Log retention, applied by the log writer thread. 0 disables a limit.
+    log_max_rows: int = 1_000_000
+    log_max_age_days: float = 30
+    log_retention_interval: float = 300
+    # Tool errors (see lib/exceptions.py): arguments are shortened to
+    # log_arg_max_length characters in debug logs, and a traceback is logged
+    # once per error_log_interval seconds per fingerprint. Every occurrence is
+    # counted in the error_groups table.
+    log_arg_max_length: int = 200
+    error_log_interval: float = 60
+    # Defaults for tools registered through create_mcp(parallel_tools=...).
+    # 0 / None disable the limit.
+    parallel_max_concurrency: int = 32
+    parallel_item_timeout: Optional[float] = None
+    # Default executor sizes for blocking tools (see lib/executors.py)
+    tool_thread_pool_size: int = 8
+    tool_process_pool_size: int = 2
+    # Result cache for tools marked with @cached_tool (see lib/cache.py)
+    tool_cache_ttl: float = 300
+    tool_cache_local_size: int = 1024
+    # Seconds to serve from the local cache only after Redis is unreachable
+    tool_cache_redis_retry_interval: float = 30
+    # Scheduler service supervisor (see lib/scheduler/core/supervisor.py)
+    scheduler_startup_timeout: float = 30
+    scheduler_probe_interval: float = 0.2
+    scheduler_restart_backoff: float = 1
+    scheduler_restart_max_backoff: float = 60
+    # Consecutive failed restarts before a service is given up. 0 retries forever.
+    scheduler_max_restarts: int = 10
 
     model_config = ConfigDict(
         env_file=".env",  # Expects .env in the directory where the main script is run
@@ -0,0 +1,358 @@
+"""
+Result cache for read-only MCP tools.
+
+Tools marked with `cached_tool` are wrapped by `create_mcp` with `cache`, which
+serves repeated calls with the same arguments from a local in-process LRU and,
+behind it, from Redis (shared between server processes and surviving
+restarts). Concurrent calls for the same key are coalesced so that only one of
+them runs the tool (single-flight). Redis is optional: when it is unreachable
+the cache degrades to the local LRU.
+
+Keys are namespaced by the server name given to `create_mcp`, so servers
+sharing a Redis instance never serve each other's results. The request
+Context FastMCP passes to a tool is not part of its key.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import time
+import typing
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union, cast
+
+from mcp.server.fastmcp import Context
+
+from ..config.env import settings
+from .logging import logger
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+KEY_PREFIX = "saaga:cache"
+# Namespace of tools cached outside create_mcp
+DEFAULT_NAMESPACE = "default"
+
+# Tool name -> cache options, for tools wrapped with `cache`
+_cached_tools: Dict[str, Dict[str, Any]] = {}
+# Skip Redis until this monotonic time after a connection failure
+_redis_retry_at = 0.0
+
+
+class _LocalLRU:
+    """Bounded in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+
+_local = _LocalLRU(settings.tool_cache_local_size)
+# Cache key -> future of the call currently computing it
+_in_flight: Dict[str, asyncio.Future] = {}
+
+
+def cached_tool(
+    func: T = None,
+    *,
+    ttl: float = None,
+    key: Optional[Union[str, Callable[..., str]]] = None,
+) -> T:
+    """Mark a read-only tool so create_mcp caches its results.
+
+    Only successful results are cached; a call that raises is never stored.
+
+    Args:
+        func: The tool function to mark.
+        ttl: Seconds a result stays cached. Defaults to settings.tool_cache_ttl.
+        key: How to build the cache key from the call arguments. Either a format
+            string using argument names (e.g. "{user_id}") or a callable taking
+            the tool's arguments. Defaults to a hash of all arguments.
+
+    Example:
+        ```python
+        @cached_tool(ttl=600, key="{user_id}")
+        async def list_calendars(user_id: str) -> str:
+            ...
+        ```
+    """
+    if func is None:
+        return cast(T, functools.partial(cached_tool, ttl=ttl, key=key))
+
+    func._cache_options = {"ttl": ttl, "key": key}
+    return func
+
+
+def invalidates(*tools: str) -> Callable[[T], T]:
+    """Mark a write tool so create_mcp drops the cache of other tools on success.
+
+    Args:
+        *tools: Names of the cached tools whose results the decorated tool changes
+
+    Example:
+        ```python
+        @invalidates("list_calendars")
+        async def create_calendar(user_id: str, name: str) -> str:
+            ...
+        ```
+    """
+
+    def decorator(func: T) -> T:
+        func._invalidates = tools
+        return func
+
+    return decorator
+
+
+def uses_cache(func: Callable) -> bool:
+    """Whether create_mcp should wrap the tool with `cache`."""
+    return hasattr(func, "_cache_options") or hasattr(func, "_invalidates")
+
+
+def _tool_prefix(namespace: str, tool: str) -> str:
+    return f"{KEY_PREFIX}:{namespace}:{tool}:"
+
+
+def _context_parameters(func: Callable) -> Tuple[str, ...]:
+    """Names of the parameters FastMCP fills with the request Context."""
+    try:
+        hints = typing.get_type_hints(inspect.unwrap(func))
+    except Exception:
+        return ()
+    return tuple(
+        name
+        for name, hint in hints.items()
+        if isinstance(typing.get_origin(hint) or hint, type)
+        and issubclass(typing.get_origin(hint) or hint, Context)
+    )
+
+
+def _cache_key(options: Dict[str, Any], tool: str, args: tuple, kwargs: dict) -> str:
+    """Build the cache key for one call."""
+    bound = options["signature"].bind(*args, **kwargs)
+    bound.apply_defaults()
+    # A new Context per request would make every key different
+    arguments = {
+        name: value
+        for name, value in bound.arguments.items()
+        if name not in options["context_parameters"]
+    }
+    key = options["key"]
+    if callable(key):
+        suffix = str(key(**arguments))
+    elif key is not None:
+        suffix = key.format(**arguments)
+    else:
+        payload = json.dumps(arguments, sort_keys=True, default=str)
+        suffix = hashlib.sha256(payload.encode()).hexdigest()
+    return _tool_prefix(options["namespace"], tool) + suffix
+
+
+def _redis():
+    """The async Redis client, or None while Redis is known to be unreachable."""
+    if time.monotonic() < _redis_retry_at:
+        return None
+    from .scheduler.core.redis_client import async_redis_client
+
+    return async_redis_client
+
+
+def _redis_failed(error: Exception) -> None:
+    global _redis_retry_at
+    _redis_retry_at = time.monotonic() + settings.tool_cache_redis_retry_interval
+    logger.warning(f"Tool cache falling back to local cache, Redis failed: {error}")
+
+
+async def _redis_get(key: str) -> Tuple[bool, Any]:
+    client = _redis()
+    if client is None:
+        return False, None
+    try:
+        raw = await client.get(key)
+    except Exception as e:
+        _redis_failed(e)
+        return False, None
+    if raw is None:
+        return False, None
+    return True, json.loads(raw)
+
+
+async def _redis_set(key: str, value: Any, ttl: float) -> None:
+    client = _redis()
+    if client is None:
+        return
+    try:
+        payload = json.dumps(value)
+    except (TypeError, ValueError):
+        # Not JSON serializable, keep it in the local cache only
+        return
+    try:
+        await client.set(key, payload, ex=max(1, int(ttl)))
+    except Exception as e:
+        _redis_failed(e)
+
+
+def cache(func: T, namespace: str = DEFAULT_NAMESPACE) -> T:
+    """Decorator applying the `cached_tool` and `invalidates` marks of a tool.
+
+    Args:
+        func: The async tool function to decorate
+        namespace: Namespace of the cache keys, the server name in create_mcp
+
+    Returns:
+        An async function. Cached tools get `invalidate` and `invalidate_all`
+        attributes.
+    """
+    if hasattr(func, "_invalidates"):
+        func = _invalidate_after(func, func._invalidates, namespace)
+    if not hasattr(func, "_cache_options"):
+        return func
+
+    ttl = func._cache_options.get("ttl") or settings.tool_cache_ttl
+    tool = func.__name__
+    options = {
+        "ttl": ttl,
+        "key": func._cache_options.get("key"),
+        "namespace": namespace,
+        "signature": inspect.signature(func),
+        "context_parameters": _context_parameters(func),
+    }
+    _cached_tools[tool] = options
+
+    async def compute(cache_key: str, args: tuple, kwargs: dict) -> Any:
+        found, value = await _redis_get(cache_key)
+        if found:
+            _local.set(cache_key, value, ttl)
+            return value
+        value = await func(*args, **kwargs)
+        _local.set(cache_key, value, ttl)
+        await _redis_set(cache_key, value, ttl)
+        return value
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        cache_key = _cache_key(options, tool, args, kwargs)
+        found, value = _local.get(cache_key)
+        if found:
+            return value
+
+        # Single flight: concurrent calls with the same key wait for the first
+        while cache_key in _in_flight:
+            future = _in_flight[cache_key]
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The first call was cancelled, compute it again
+
+        future = asyncio.get_running_loop().create_future()
+        _in_flight[cache_key] = future
+        try:
+            value = await compute(cache_key, args, kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged by asyncio
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            _in_flight.pop(cache_key, None)
+
+    async def invalidate(*args, **kwargs) -> int:
+        return await invalidate_cache(tool, *args, **kwargs)
+
+    async def invalidate_all() -> int:
+        return await invalidate_cache(tool)
+
+    wrapper.invalidate = invalidate
+    wrapper.invalidate_all = invalidate_all
+    return cast(T, wrapper)
+
+
+async def invalidate_cache(tool: str, *args, **kwargs) -> int:
+    """Drop cached results of a tool.
+
+    With arguments, only the result for those arguments is dropped; without,
+    every cached result of the tool is.
+
+    Args:
+        tool: Name of the cached tool
+        *args, **kwargs: Arguments of the call whose result should be dropped
+
+    Returns:
+        Number of cache entries removed
+    """
+    options = _cached_tools.get(tool)
+    if options is None:
+        raise ValueError(f"Tool '{tool}' is not cached")
+    return await _invalidate(options["namespace"], tool, args, kwargs)
+
+
+async def _invalidate(namespace: str, tool: str, args: tuple, kwargs: dict) -> int:
+    if args or kwargs:
+        options = _cached_tools.get(tool)
+        if options is None or options["namespace"] != namespace:
+            raise ValueError(f"Tool '{tool}' is not cached")
+        prefix = _cache_key(options, tool, args, kwargs)
+    else:
+        prefix = _tool_prefix(namespace, tool)
+
+    removed = _local.delete_prefix(prefix)
+    client = _redis()
+    if client is None:
+        return removed
+    try:
+        if args or kwargs:
+            removed = max(removed, await client.delete(prefix))
+        else:
+            keys = [k async for k in client.client.scan_iter(match=f"{prefix}*")]
+            if keys:
+                removed = max(removed, await client.client.delete(*keys))
+    except Exception as e:
+        _redis_failed(e)
+    return removed
+
+
+def _invalidate_after(func: T, tools: Tuple[str, ...], namespace: str) -> T:
+    """Decorator that drops the cache of tools in namespace after func succeeds."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        result = await func(*args, **kwargs)
+        for tool in tools:
+            await _invalidate(namespace, tool, (), {})
+        return result
+
+    return cast(T, wrapper)
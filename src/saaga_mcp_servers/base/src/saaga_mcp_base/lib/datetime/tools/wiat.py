@@ -1,13 +1,50 @@
+import asyncio
+import json
 import time
+from typing import Any, Dict, Optional, Tuple
 
+from mcp.server.fastmcp import Context
 
-async def wait(minutes: float) -> str:
+from ...logging import logger
+from ...progress import notify_progress
+
+# Tool results that count as "nothing yet" for wait_until
+_EMPTY_RESULTS = {"", "[]", "{}", "null", "None", "false", "False"}
+
+
+async def _sleep_with_progress(
+    seconds: float,
+    progress_interval: float,
+    ctx: Optional[Context],
+    started: float,
+    total: Optional[float] = None,
+) -> None:
+    """Sleep without blocking the loop, reporting elapsed seconds to the client."""
+    deadline = time.monotonic() + seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        step = min(remaining, progress_interval) if progress_interval > 0 else remaining
+        await asyncio.sleep(step)
+        if progress_interval > 0:
+            await notify_progress(ctx, time.monotonic() - started, total)
+
+
+async def wait(
+    minutes: float, progress_interval_seconds: float = 30, ctx: Context = None
+) -> str:
     """
     Wait for the specified number of minutes.
     This is for having an agent wait to check some information.
 
+    The wait does not block other tool calls and stops as soon as the client
+    cancels the request.
+
     Args:
         minutes: Number of minutes to wait (can be a decimal for partial minutes)
+        progress_interval_seconds: How often to send a progress notification with
+            the elapsed seconds. 0 disables progress notifications.
 
     Returns:
         A message indicating how long the function waited
@@ -16,6 +53,129 @@ async def wait(minutes: float) -> str:
         return "No waiting needed - minutes must be positive"
 
     seconds = minutes * 60
-    time.sleep(seconds)
+    started = time.monotonic()
+    try:
+        await _sleep_with_progress(
+            seconds, progress_interval_seconds, ctx, started, total=seconds
+        )
+    except asyncio.CancelledError:
+        logger.info(f"wait cancelled after {time.monotonic() - started:.1f} seconds")
+        raise
 
     return f"Waited for {minutes} minutes ({seconds} seconds)"
+
+
+def _result_text(result: Any) -> str:
+    """Flatten a FastMCP call_tool result into text."""
+    if isinstance(result, tuple):
+        # (content, structured_content) on newer MCP versions
+        result = result[0]
+    if isinstance(result, (list, tuple)):
+        return "".join(getattr(block, "text", "") for block in result)
+    if isinstance(result, dict):
+        return json.dumps(result, default=str)
+    return str(result)
+
+
+def _read_result(result: Any) -> Tuple[str, Optional[str]]:
+    """Text of a call_tool result, and its error message if the call failed."""
+    if getattr(result, "isError", False):
+        text = _result_text(result.content)
+        return text, text or "Tool call failed"
+    text = _result_text(result)
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return text, None
+    # Exceptions caught by exception_handler are returned as a status dict
+    if isinstance(payload, dict) and payload.get("Status") == "Exception":
+        return text, payload.get("Message") or payload.get("ExceptionType")
+    return text, None
+
+
+async def wait_until(
+    tool: str,
+    arguments: Optional[Dict[str, Any]] = None,
+    contains: Optional[str] = None,
+    timeout_minutes: float = 10,
+    initial_interval_seconds: float = 5,
+    max_interval_seconds: float = 300,
+    backoff_factor: float = 2.0,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """
+    Wait until another tool on this server returns a result matching a condition.
+
+    The tool is polled with exponential backoff between attempts, e.g. to wait
+    for an email query to return a reply. Waiting does not block other tool
+    calls, and a progress notification is sent after every attempt.
+
+    Args:
+        tool: Name of the tool on this server to poll
+        arguments: Arguments to call the tool with
+        contains: Condition is met when the tool's result contains this text. If
+            omitted, the condition is met when the result is not empty
+        timeout_minutes: Give up after this many minutes
+        initial_interval_seconds: Delay before the second attempt
+        max_interval_seconds: Upper bound for the delay between attempts
+        backoff_factor: Multiplier applied to the delay after each attempt
+
+    Returns:
+        Dictionary with the status ("condition_met", "timeout" or "error"),
+        number of attempts, elapsed seconds and the last result of the polled
+        tool. A polled tool that fails stops the wait with status "error" and
+        its error message.
+    """
+    if ctx is None:
+        raise ValueError("wait_until can only be called through the MCP server")
+    if tool == "wait_until":
+        raise ValueError("wait_until cannot poll itself")
+
+    timeout = timeout_minutes * 60
+    started = time.monotonic()
+    interval = initial_interval_seconds
+    attempts = 0
+    text = ""
+    error = None
+
+    while True:
+        attempts += 1
+        try:
+            text, error = _read_result(
+                await ctx.fastmcp.call_tool(tool, arguments or {})
+            )
+        except Exception as e:
+            text, error = "", str(e)
+        elapsed = time.monotonic() - started
+
+        if error is not None:
+            status = "error"
+            break
+        if contains is not None:
+            met = contains in text
+        else:
+            met = text.strip() not in _EMPTY_RESULTS
+        if met:
+            status = "condition_met"
+            break
+
+        await notify_progress(ctx, elapsed, timeout)
+        if elapsed >= timeout:
+            status = "timeout"
+            break
+
+        logger.info(
+            f"wait_until: {tool} attempt {attempts} not met, retrying in {interval}s"
+        )
+        await asyncio.sleep(min(interval, timeout - elapsed))
+        interval = min(interval * backoff_factor, max_interval_seconds)
+
+    outcome = {
+        "status": status,
+        "attempts": attempts,
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+        "result": text,
+    }
+    if error is not None:
+        outcome["error"] = error
+    return outcome
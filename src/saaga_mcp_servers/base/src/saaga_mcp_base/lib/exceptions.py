@@ -4,18 +4,64 @@ Exception handling for MCP tools.
 This module provides exception handling decorators for MCP tools used by the SaagaLint server.
 These decorators capture traceback information from exceptions and format it for chat history,
 ensuring that errors are properly logged and presented to users.
+
+Repeated errors are grouped by a fingerprint of the exception type and the code
+path that raised it. Every occurrence is counted in the error_groups table (see
+``read_errors``), but a fingerprint's traceback is only logged once per
+``settings.error_log_interval`` seconds, so error storms don't flood the logs.
 """
 
 import functools
-
+import hashlib
+import reprlib
+import threading
+import time
 import traceback
+from datetime import datetime, timezone
 from typing import Any, Callable, Dict, TypeVar, cast
 
-from .logging import logger
+from ..config.env import settings
+from .logging import ToolError, get_db_sink, logger
 
 
 T = TypeVar("T", bound=Callable[..., Any])
 
+# Stored error messages are cut to this many characters
+_MAX_MESSAGE_LENGTH = 2000
+
+_arg_repr = reprlib.Repr()
+_arg_repr.maxstring = _arg_repr.maxother = settings.log_arg_max_length
+_arg_repr.maxlevel = 3
+
+# Fingerprint -> monotonic time its traceback was last logged
+_last_logged: Dict[str, float] = {}
+_last_logged_lock = threading.Lock()
+
+
+def fingerprint(exc: BaseException) -> str:
+    """Identify an error by its type and the frames it was raised through.
+
+    Line numbers are included but the message is not, so the same failure with
+    different arguments (ids, paths) shares a fingerprint.
+    """
+    frames = traceback.extract_tb(exc.__traceback__)
+    key = "|".join(
+        [type(exc).__qualname__]
+        + [f"{frame.filename}:{frame.name}:{frame.lineno}" for frame in frames]
+    )
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def _should_log(error_id: str) -> bool:
+    """Whether the traceback of this fingerprint is due to be logged again."""
+    now = time.monotonic()
+    with _last_logged_lock:
+        last = _last_logged.get(error_id)
+        if last is not None and now - last < settings.error_log_interval:
+            return False
+        _last_logged[error_id] = now
+        return True
+
 
 def exception_handler(func: T) -> T:
     """Decorator that catches and formats exceptions from MCP tool calls.
@@ -53,20 +99,36 @@ def exception_handler(func: T) -> T:
             exception details if an exception occurred.
         """
         try:
-            logger.debug(
-                f"Calling async function {func.__name__} with "
-                f"args={args}, kwargs={kwargs}"
+            # Arguments are only formatted if a sink accepts DEBUG records
+            logger.opt(lazy=True).debug(
+                "Calling async function {} with args={}, kwargs={}",
+                lambda: func.__name__,
+                lambda: _arg_repr.repr(args),
+                lambda: _arg_repr.repr(kwargs),
             )
             return await func(*args, **kwargs)
         except Exception as e:
             tb_str = traceback.format_exc()
-            logger.exception(tb_str)
+            error_id = fingerprint(e)
+            get_db_sink().record_error(
+                ToolError(
+                    fingerprint=error_id,
+                    tool=func.__name__,
+                    exception_type=type(e).__name__,
+                    message=str(e)[:_MAX_MESSAGE_LENGTH],
+                    traceback=tb_str,
+                    timestamp=datetime.now(timezone.utc).isoformat(),
+                )
+            )
+            if _should_log(error_id):
+                logger.error(f"Error {error_id} in {func.__name__}:\n{tb_str}")
             # Include exception details in the return dictionary
             error_return = {
                 "Status": "Exception",
                 "Message": str(e),
                 "ExceptionType": type(e).__name__,
                 "Traceback": tb_str,
+                "Fingerprint": error_id,
             }
             return error_return
 
@@ -0,0 +1,276 @@
+"""
+Executors for running blocking MCP tools off the event loop.
+
+The stdio server handles every request on a single event loop, so a tool that
+blocks (a sync function, or an async function that calls blocking APIs) stalls
+all concurrent requests. `create_mcp` wraps such tools with `offload`, which
+runs them in a named, bounded executor. Tools are assigned to a pool with the
+`blocking` decorator so that one slow tool cannot starve the others.
+
+Sync tools are offloaded without being marked, so calls to the same sync tool
+can run concurrently in different worker threads. A sync tool that is not
+thread-safe should be given a pool of its own with ``max_workers=1``.
+
+Async tools marked ``@blocking`` run on an event loop of their worker thread,
+which is kept for the life of the thread, so loop-bound objects a tool creates
+(clients, connections) remain usable in later calls on that thread. Objects
+bound to the server's loop, such as the MCP request context, must not be
+awaited on the worker loop; pass such coroutines to `run_on_caller_loop`.
+
+Offloaded calls measure the CPU time they use in their worker and add it to
+the CpuTimer of the tool call (see `cpu_timer`), which tool_logger records.
+"""
+
+import asyncio
+import atexit
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from ..config.env import settings
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+DEFAULT_POOL = "default"
+
+_executors: Dict[str, Executor] = {}
+_executors_lock = threading.Lock()
+
+# Event loop of the current worker thread, for async blocking tools
+_worker = threading.local()
+_worker_loops: List[asyncio.AbstractEventLoop] = []
+
+# Event loop that awaits the offloaded call, in worker threads
+_caller_loop: contextvars.ContextVar = contextvars.ContextVar(
+    "saaga_caller_loop", default=None
+)
+
+
+class CpuTimer:
+    """CPU time used by the offloaded work of one tool call."""
+
+    def __init__(self):
+        self.seconds = 0.0
+        # Whether any work was offloaded, i.e. whether seconds means anything
+        self.measured = False
+
+    def add(self, seconds: float) -> None:
+        self.seconds += seconds
+        self.measured = True
+
+
+# Timer of the tool call running in the current context, set by tool_logger
+_cpu_timer: contextvars.ContextVar = contextvars.ContextVar(
+    "saaga_cpu_timer", default=None
+)
+
+
+def cpu_timer() -> Tuple[CpuTimer, contextvars.Token]:
+    """Start timing the offloaded work of the current context.
+
+    Returns the timer and the token to reset the context with.
+    """
+    timer = CpuTimer()
+    return timer, _cpu_timer.set(timer)
+
+
+def reset_cpu_timer(token: contextvars.Token) -> None:
+    _cpu_timer.reset(token)
+
+
+def blocking(
+    func: T = None,
+    *,
+    pool: str = DEFAULT_POOL,
+    max_workers: Optional[int] = None,
+    cpu_bound: bool = False,
+) -> T:
+    """Mark a tool as blocking so create_mcp runs it in an executor.
+
+    Sync tools are offloaded automatically; this decorator is needed for async
+    tools that block the event loop, or to give a tool its own pool.
+
+    Args:
+        func: The tool function to mark.
+        pool: Name of the executor the tool runs in. Tools sharing a name share
+            the pool.
+        max_workers: Size of the pool, used when the pool is first created.
+            Defaults to settings.tool_thread_pool_size (or
+            settings.tool_process_pool_size for CPU-bound pools).
+        cpu_bound: Run the tool in a process pool instead of a thread pool. The
+            tool and its arguments must be picklable.
+
+    Example:
+        ```python
+        @blocking(pool="reports", max_workers=2)
+        async def build_report(...):
+            ...
+        ```
+    """
+    if func is None:
+        return cast(
+            T,
+            functools.partial(
+                blocking, pool=pool, max_workers=max_workers, cpu_bound=cpu_bound
+            ),
+        )
+
+    func._blocking_pool = (pool, max_workers, cpu_bound)
+    return func
+
+
+def is_blocking(func: Callable) -> bool:
+    """Whether create_mcp should run the tool in an executor.
+
+    True for tools marked with `blocking` and for every sync tool.
+    """
+    return hasattr(func, "_blocking_pool") or not inspect.iscoroutinefunction(func)
+
+
+def get_executor(
+    pool: str = DEFAULT_POOL, max_workers: Optional[int] = None, cpu_bound: bool = False
+) -> Executor:
+    """Get or lazily create the named executor."""
+    with _executors_lock:
+        executor = _executors.get(pool)
+        if executor is None:
+            if cpu_bound:
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers or settings.tool_process_pool_size
+                )
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=max_workers or settings.tool_thread_pool_size,
+                    thread_name_prefix=f"saaga-tool-{pool}",
+                )
+            _executors[pool] = executor
+        return executor
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Shut down every executor created by get_executor."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+    if wait:
+        # Their threads are gone, so nothing runs the worker loops any more
+        with _executors_lock:
+            loops = list(_worker_loops)
+            _worker_loops.clear()
+        for loop in loops:
+            loop.close()
+
+
+atexit.register(shutdown_executors)
+
+
+def _worker_loop() -> asyncio.AbstractEventLoop:
+    """Event loop of the current worker thread, created on first use."""
+    loop = getattr(_worker, "loop", None)
+    if loop is None:
+        loop = _worker.loop = asyncio.new_event_loop()
+        with _executors_lock:
+            _worker_loops.append(loop)
+    return loop
+
+
+def is_worker_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    """Whether loop runs an async blocking tool in a worker thread or process.
+
+    Such a loop only runs while the tool is being called, so work scheduled on
+    it in the background may not run until the next call.
+    """
+    return getattr(_worker, "loop", None) is loop
+
+
+async def run_on_caller_loop(awaitable: Awaitable) -> Any:
+    """Await awaitable on the event loop that called the offloaded tool.
+
+    For async blocking tools that need objects bound to the server's loop, e.g.
+    ``await run_on_caller_loop(ctx.report_progress(1, 10))``.
+
+    Raises:
+        RuntimeError: Outside an offloaded tool, or in a process pool.
+    """
+    loop = _caller_loop.get()
+    if loop is None:
+        raise RuntimeError("Not running in a thread-offloaded tool")
+    future = asyncio.run_coroutine_threadsafe(_await(awaitable), loop)
+    return await asyncio.wrap_future(future)
+
+
+async def _await(awaitable: Awaitable) -> Any:
+    return await awaitable
+
+
+def _call(
+    func: Callable, args: tuple, kwargs: dict, clock: Callable[[], float]
+) -> Tuple[Any, float]:
+    """Run a tool to completion in the current (worker) thread or process.
+
+    Returns the result and the CPU seconds the call used according to clock.
+    """
+    start = clock()
+    if inspect.iscoroutinefunction(func):
+        result = _worker_loop().run_until_complete(func(*args, **kwargs))
+    else:
+        result = func(*args, **kwargs)
+    return result, clock() - start
+
+
+def offload(func: T) -> T:
+    """Decorator that runs a blocking tool in its executor and awaits the result.
+
+    Calls in a thread pool run in a copy of the caller's context, so logger
+    bindings made by tool_logger still apply to logs emitted from the worker
+    thread. Calls in a process pool get a fresh context.
+
+    Args:
+        func: The tool function to decorate
+
+    Returns:
+        An async function that can be awaited by the other tool decorators
+    """
+    pool, max_workers, cpu_bound = getattr(
+        func, "_blocking_pool", (DEFAULT_POOL, None, False)
+    )
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        executor = get_executor(pool, max_workers, cpu_bound)
+        loop = asyncio.get_running_loop()
+        if cpu_bound:
+            # The worker process runs one call at a time
+            call = functools.partial(_call, func, args, kwargs, time.process_time)
+        else:
+            token = _caller_loop.set(loop)
+            try:
+                context = contextvars.copy_context()
+            finally:
+                _caller_loop.reset(token)
+            call = functools.partial(
+                context.run, _call, func, args, kwargs, time.thread_time
+            )
+        result, cpu_seconds = await loop.run_in_executor(executor, call)
+        timer = _cpu_timer.get()
+        if timer is not None:
+            timer.add(cpu_seconds)
+        return result
+
+    return cast(T, wrapper)
@@ -1,23 +1,45 @@
 """
-Logger configuration for the QA package.
+Logger configuration and log readers for MCP servers built on saaga_mcp_base.
 
-This module provides a simplified logger using PrettyJSONSink to write human-readable
-JSON logs to qa.log.
+Once install_db_logging has run, loguru records go to a SQLite database
+(settings.sqldb_path) through BatchedDbSink. create_mcp and the Celery app call
+it, so importing this package leaves loguru's handlers alone. The sink queues
+each record, and a background thread writes the queue in batches, along with
+the tool_calls and error_groups rows recorded by tool_logger and
+exception_handler. The database and the writer thread are created when the
+first record arrives. read_logs, tool_stats, read_errors and the tool block
+readers flush the sink before querying the database.
 """
 
+import asyncio
+import atexit
+import math
+import queue
 import sqlite3
 import sys
 import threading
-from typing import List, Dict, Any, Callable, TypeVar, cast
+import time
+from datetime import datetime, timedelta, timezone
+from contextlib import closing
+from typing import (
+    List,
+    Dict,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    cast,
+)
 import functools
 from pathlib import Path
 
 from loguru import logger
 
 from ..config.env import settings
-
-# Configure and remove default logger
-logger.remove()
+from .executors import cpu_timer, reset_cpu_timer
 
 # Create thread-local storage for database connections
 local = threading.local()
@@ -40,20 +62,37 @@ def enable_stdout_logging(level="INFO"):
         logger.info(f"Stdout logging enabled at {level} level")
 
 
+# meta key recording that _backfill_tool_blocks has run
+_TOOL_BLOCKS_BACKFILLED = "tool_blocks_backfilled"
+
+
 def get_connection(db_path: str = None):
-    """Get or create a thread-local SQLite connection."""
+    """Get or create this thread's SQLite connection to a log database.
+
+    Each thread keeps one connection per database path.
+    """
     if db_path is None:
         db_path = settings.sqldb_path
 
-    # Ensure the directory for the database exists using pathlib
-    db_path_obj = Path(db_path)
-    db_dir = db_path_obj.parent
-    if db_dir:
-        db_dir.mkdir(parents=True, exist_ok=True)
+    connections = getattr(local, "connections", None)
+    if connections is None:
+        connections = local.connections = {}
+    key = str(Path(db_path).resolve())
+    conn = connections.get(key)
 
-    if not hasattr(local, "conn") or local.conn is None:
-        local.conn = sqlite3.connect(db_path)
-        cursor = local.conn.cursor()
+    if conn is None:
+        # Ensure the directory for the database exists using pathlib
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        # Only takes effect for new databases (so it must come before the WAL
+        # switch writes the header); lets retention give pages back with
+        # PRAGMA incremental_vacuum instead of a full VACUUM
+        cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        # WAL lets readers run concurrently with the log writer, and NORMAL
+        # only syncs on checkpoints instead of on every commit
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
         # Create logs table if it doesn't exist
         cursor.execute(
             """
@@ -71,102 +110,678 @@ def get_connection(db_path: str = None):
         )
         """
         )
-        local.conn.commit()
-    return local.conn
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_tool_id ON logs (tool, id)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_logs_level_id ON logs (level, id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs (timestamp)"
+        )
+        # Contiguous runs of logs from the same tool, maintained by the log
+        # writer as rows are inserted (see _update_tool_blocks)
+        cursor.execute(
+            """
+        CREATE TABLE IF NOT EXISTS tool_blocks (
+            block_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            tool TEXT,
+            start_id INTEGER,
+            end_id INTEGER,
+            start_time TEXT,
+            end_time TEXT,
+            count INTEGER
+        )
+        """
+        )
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_tool_blocks_start_id "
+            "ON tool_blocks (start_id)"
+        )
+        # One-off migrations that have been applied to this database
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        _backfill_tool_blocks(cursor)
+        # One row per tool invocation, recorded by tool_logger
+        cursor.execute(
+            """
+        CREATE TABLE IF NOT EXISTS tool_calls (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            tool TEXT,
+            timestamp TEXT,
+            wall_time_ms REAL,
+            cpu_time_ms REAL,
+            exception_type TEXT,
+            result_size INTEGER
+        )
+        """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tool_calls_timestamp "
+            "ON tool_calls (timestamp)"
+        )
+        # One row per distinct error, counted by exception_handler
+        cursor.execute(
+            """
+        CREATE TABLE IF NOT EXISTS error_groups (
+            fingerprint TEXT PRIMARY KEY,
+            tool TEXT,
+            exception_type TEXT,
+            message TEXT,
+            traceback TEXT,
+            count INTEGER,
+            first_seen TEXT,
+            last_seen TEXT
+        )
+        """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_error_groups_last_seen "
+            "ON error_groups (last_seen)"
+        )
+        conn.commit()
+        connections[key] = conn
+    return conn
 
 
-def setup_db_logging(
-    db_path: str = None, enable_stdout: bool = False, stdout_level: str = "INFO"
-):
-    """Set up database logging with thread-safe connections."""
-    if db_path is None:
-        db_path = settings.sqldb_path
-    # Initialize the main connection to create the table
+def _backfill_tool_blocks(cursor):
+    """Build tool_blocks for databases that predate it.
+
+    This is the only place the blocks are derived with window functions over
+    the whole logs table. It runs once per database, which is recorded in the
+    meta table, so later connections only look up that flag.
+    """
+    cursor.execute("SELECT 1 FROM meta WHERE key = ?", (_TOOL_BLOCKS_BACKFILLED,))
+    if cursor.fetchone():
+        return
+    conn = cursor.connection
+    with conn:
+        # Take the write lock first so a connection opened concurrently from
+        # another thread waits instead of building the blocks a second time
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("SELECT 1 FROM meta WHERE key = ?", (_TOOL_BLOCKS_BACKFILLED,))
+        if cursor.fetchone():
+            return
+        cursor.execute("SELECT 1 FROM tool_blocks LIMIT 1")
+        has_blocks = cursor.fetchone() is not None
+        cursor.execute("SELECT 1 FROM logs WHERE tool IS NOT NULL LIMIT 1")
+        if not has_blocks and cursor.fetchone():
+            cursor.execute(
+                """
+            INSERT INTO tool_blocks (tool, start_id, end_id, start_time, end_time, count)
+            SELECT tool, MIN(id), MAX(id), MIN(timestamp), MAX(timestamp), COUNT(*)
+            FROM (
+                SELECT id, tool, timestamp,
+                       row_number() OVER (ORDER BY id) -
+                       row_number() OVER (PARTITION BY tool ORDER BY id) AS grp
+                FROM logs
+                WHERE tool IS NOT NULL
+            )
+            GROUP BY tool, grp
+            ORDER BY MIN(id)
+            """
+            )
+        cursor.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            (_TOOL_BLOCKS_BACKFILLED, datetime.now(timezone.utc).isoformat()),
+        )
+
+
+def _update_tool_blocks(cursor, rows, first_id: int):
+    """Extend tool_blocks with freshly inserted log rows.
+
+    Must run in the same transaction as the insert of ``rows``, whose ids are
+    ``first_id`` onwards. Rows without a tool do not break a block, matching how
+    blocks were previously derived from the logs table.
+    """
+    cursor.execute(
+        "SELECT block_id, tool FROM tool_blocks ORDER BY block_id DESC LIMIT 1"
+    )
+    last_block = cursor.fetchone()
+
+    # Extension of the most recent persisted block: [end_id, end_time, added]
+    extension = None
+    new_blocks = []  # [tool, start_id, end_id, start_time, end_time, count]
+    for offset, row in enumerate(rows):
+        tool, timestamp = row[0], row[3]
+        if tool is None:
+            continue
+        row_id = first_id + offset
+        if new_blocks and new_blocks[-1][0] == tool:
+            block = new_blocks[-1]
+            block[2], block[4], block[5] = row_id, timestamp, block[5] + 1
+        elif not new_blocks and last_block and last_block[1] == tool:
+            added = extension[2] if extension else 0
+            extension = [row_id, timestamp, added + 1]
+        else:
+            new_blocks.append([tool, row_id, row_id, timestamp, timestamp, 1])
+
+    if extension:
+        cursor.execute(
+            "UPDATE tool_blocks SET end_id = ?, end_time = ?, count = count + ? "
+            "WHERE block_id = ?",
+            (*extension, last_block[0]),
+        )
+    if new_blocks:
+        cursor.executemany(
+            "INSERT INTO tool_blocks "
+            "(tool, start_id, end_id, start_time, end_time, count) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            new_blocks,
+        )
+
+
+def prune_logs(
+    db_path: str = None,
+    max_rows: int = None,
+    max_age_days: float = None,
+    chunk_size: int = 50000,
+) -> int:
+    """Apply the retention policy to the logs and tool_calls tables.
+
+    Rows beyond the newest ``max_rows`` and rows older than ``max_age_days`` are
+    deleted oldest first, in chunks of ``chunk_size`` so a single run never holds
+    the write lock for long. Both cut-offs are resolved through the primary key
+    or the timestamp index, so the cost depends on the number of rows removed,
+    not the size of the table. Freed pages are returned to the filesystem with
+    ``PRAGMA incremental_vacuum`` (databases created before auto_vacuum was
+    enabled need a one-off ``VACUUM`` for this to have an effect).
+
+    Args:
+        db_path: Path to the log database. Defaults to path from settings.
+        max_rows: Number of most recent rows to keep. 0 disables the limit.
+            Defaults to settings.log_max_rows.
+        max_age_days: Maximum age of a row in days. 0 disables the limit.
+            Defaults to settings.log_max_age_days.
+        chunk_size: Maximum number of rows deleted per transaction.
+
+    Returns:
+        Number of log rows deleted
+    """
+    if max_rows is None:
+        max_rows = settings.log_max_rows
+    if max_age_days is None:
+        max_age_days = settings.log_max_age_days
+
     conn = get_connection(db_path)
+    cursor = conn.cursor()
+    # Every table stores UTC timestamps, so one cut-off applies to all of them
+    cutoff_time = (
+        datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    ).isoformat()
+
+    # tool_calls is much smaller than logs and follows the same policy.
+    # error_groups only has one row per distinct error and is pruned by age.
+    with conn:
+        if max_rows:
+            cursor.execute(
+                "DELETE FROM tool_calls WHERE id <= "
+                "(SELECT MAX(id) FROM tool_calls) - ?",
+                (max_rows,),
+            )
+        if max_age_days:
+            cursor.execute("DELETE FROM tool_calls WHERE timestamp < ?", (cutoff_time,))
+            cursor.execute(
+                "DELETE FROM error_groups WHERE last_seen < ?", (cutoff_time,)
+            )
+
+    # Highest id that falls outside the retention window
+    cutoff_id = 0
+    if max_rows:
+        cursor.execute("SELECT MAX(id) FROM logs")
+        max_id = cursor.fetchone()[0] or 0
+        cutoff_id = max(cutoff_id, max_id - max_rows)
+    if max_age_days:
+        cursor.execute("SELECT MAX(id) FROM logs WHERE timestamp < ?", (cutoff_time,))
+        cutoff_id = max(cutoff_id, cursor.fetchone()[0] or 0)
+
+    deleted = 0
+    while cutoff_id > 0:
+        with conn:
+            cursor.execute(
+                "DELETE FROM logs WHERE id IN "
+                "(SELECT id FROM logs WHERE id <= ? ORDER BY id LIMIT ?)",
+                (cutoff_id, chunk_size),
+            )
+        deleted += max(cursor.rowcount, 0)
+        # A short chunk means nothing up to the cut-off is left
+        if cursor.rowcount < chunk_size:
+            break
+
+    if deleted:
+        with conn:
+            # Drop blocks that were pruned entirely and trim the one that
+            # straddles the cut-off
+            cursor.execute("DELETE FROM tool_blocks WHERE end_id <= ?", (cutoff_id,))
+            cursor.execute(
+                "SELECT block_id, tool, end_id FROM tool_blocks WHERE start_id <= ?",
+                (cutoff_id,),
+            )
+            for block_id, tool, end_id in cursor.fetchall():
+                cursor.execute(
+                    "SELECT MIN(id), MIN(timestamp), COUNT(*) FROM logs "
+                    "WHERE tool = ? AND id BETWEEN ? AND ?",
+                    (tool, cutoff_id + 1, end_id),
+                )
+                start_id, start_time, count = cursor.fetchone()
+                cursor.execute(
+                    "UPDATE tool_blocks SET start_id = ?, start_time = ?, count = ? "
+                    "WHERE block_id = ?",
+                    (start_id, start_time, count, block_id),
+                )
+        cursor.execute("PRAGMA incremental_vacuum")
+        cursor.fetchall()
+    return deleted
+
+
+_INSERT_LOG_SQL = (
+    "INSERT INTO logs (tool, prev_tool, is_continuous, timestamp, level, message, "
+    "function, file, line) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_INSERT_TOOL_CALL_SQL = (
+    "INSERT INTO tool_calls (tool, timestamp, wall_time_ms, cpu_time_ms, "
+    "exception_type, result_size) VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+# Occurrences of the same error in a batch are folded into one upsert
+_UPSERT_ERROR_SQL = (
+    "INSERT INTO error_groups (fingerprint, tool, exception_type, message, "
+    "traceback, count, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (fingerprint) DO UPDATE SET count = count + excluded.count, "
+    "message = excluded.message, last_seen = excluded.last_seen"
+)
+
+
+class ToolCall(NamedTuple):
+    """Outcome and timing of a single tool invocation (a tool_calls row)."""
+
+    tool: str
+    timestamp: str
+    wall_time_ms: float
+    # Only measured for offloaded tools
+    cpu_time_ms: Optional[float]
+    exception_type: Optional[str]
+    result_size: Optional[int]
+
+
+class ToolError(NamedTuple):
+    """One occurrence of a tool error, aggregated into error_groups."""
+
+    fingerprint: str
+    tool: str
+    exception_type: str
+    message: str
+    traceback: str
+    timestamp: str
+
+
+def _group_errors(errors) -> List[tuple]:
+    """Fold occurrences of the same error into error_groups upsert rows."""
+    groups: Dict[str, list] = {}
+    for error in errors:
+        group = groups.get(error.fingerprint)
+        if group is None:
+            groups[error.fingerprint] = [
+                error.fingerprint,
+                error.tool,
+                error.exception_type,
+                error.message,
+                error.traceback,
+                1,
+                error.timestamp,
+                error.timestamp,
+            ]
+        else:
+            group[3] = error.message
+            group[5] += 1
+            group[7] = error.timestamp
+    return [tuple(group) for group in groups.values()]
+
+
+class _Flush:
+    """Queue marker that makes the writer thread write its current batch right
+    away. ``done`` is set once every record enqueued before it is written."""
+
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+# Sentinel pushed onto the queue to make the writer thread write its current
+# batch and stop
+_STOP = object()
+
+
+class BatchedDbSink:
+    """Queue-backed loguru sink that writes log records to SQLite in batches.
+
+    The sink itself only builds a row tuple and puts it on a bounded queue, so
+    logging from a tool never touches the database on the calling thread. The
+    ``prev_tool``/``is_continuous`` columns are derived from in-memory state
+    instead of a ``SELECT`` per record. A background writer thread drains the
+    queue and inserts rows with ``executemany`` in one transaction per flush,
+    flushing when ``batch_size`` rows are pending or ``flush_interval`` seconds
+    have passed. ``ToolCall`` records from ``record_tool_call`` travel through
+    the same queue into the tool_calls table. The same thread applies the
+    retention policy (see
+    ``prune_logs``) every ``settings.log_retention_interval`` seconds.
+
+    Args:
+        db_path: Path to the log database.
+        batch_size: Maximum number of rows written per transaction.
+        flush_interval: Maximum number of seconds a record waits before being written.
+        max_queue_size: Maximum number of records buffered in memory.
+        overflow_policy: "block" to apply backpressure to the logging thread when
+            the queue is full, or "drop" to discard new records (counted in
+            ``dropped``).
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 10000,
+        overflow_policy: str = "block",
+    ):
+        if overflow_policy not in ("block", "drop"):
+            raise ValueError(
+                f"overflow_policy must be 'block' or 'drop', got {overflow_policy!r}"
+            )
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
 
-    # Define a function that will process each log and insert it into the database
-    def db_sink(message):
-        # Get thread-local connection
-        thread_conn = get_connection(db_path)
-        cursor = thread_conn.cursor()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._closed = False
+        self._next_retention = time.monotonic()
+        # Seed the in-memory state from the last persisted row so continuity
+        # is preserved across restarts
+        self._prev_tool = self._load_last_tool()
+
+        self._thread = threading.Thread(
+            target=self._run, name="saaga-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _load_last_tool(self):
+        cursor = get_connection(self.db_path).cursor()
+        cursor.execute("SELECT tool FROM logs ORDER BY id DESC LIMIT 1")
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def __call__(self, message):
+        """Enqueue a loguru message. Loguru serializes calls to a sink."""
+        if self._closed:
+            return
 
         record = message.record
         current_tool = record["extra"].get("tool", None)
+        prev_tool = self._prev_tool
+        row = (
+            current_tool,
+            prev_tool,
+            current_tool == prev_tool and current_tool is not None,
+            record["time"].astimezone(timezone.utc).isoformat(),
+            record["level"].name,
+            record["message"],
+            record["function"],
+            record["file"].path,
+            record["line"],
+        )
 
+        # Only advance the continuity state for rows that will be persisted
+        if self._enqueue(row):
+            self._prev_tool = current_tool
+
+    def record_tool_call(self, call: ToolCall):
+        """Enqueue a tool invocation record for the tool_calls table."""
+        if not self._closed:
+            self._enqueue(call)
+
+    def record_error(self, error: ToolError):
+        """Enqueue a tool error occurrence for the error_groups table."""
+        if not self._closed:
+            self._enqueue(error)
+
+    def _enqueue(self, item) -> bool:
+        if self.overflow_policy == "block":
+            self._queue.put(item)
+            return True
         try:
-            # Get the previous tool entry
-            cursor.execute("SELECT tool FROM logs ORDER BY id DESC LIMIT 1")
-            prev_row = cursor.fetchone()
-            prev_tool = prev_row[0] if prev_row else None
-            is_continuous = current_tool == prev_tool and current_tool is not None
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
 
-            cursor.execute(
-                "INSERT INTO logs (tool, prev_tool, is_continuous, timestamp, level, message, function, file, line) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    current_tool,
-                    prev_tool,
-                    is_continuous,
-                    record["time"].isoformat(),
-                    record["level"].name,
-                    record["message"],
-                    record["function"],
-                    record["file"].path,
-                    record["line"],
-                ),
-            )
-            thread_conn.commit()
+    def _run(self):
+        """Writer thread: collect rows into batches and write them."""
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = []
+            flush = None
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, _Flush):
+                    flush = item
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+            if flush is not None:
+                flush.done.set()
+
+            if time.monotonic() >= self._next_retention:
+                self._next_retention = (
+                    time.monotonic() + settings.log_retention_interval
+                )
+                self._apply_retention()
+
+    def _write(self, batch):
+        log_rows = [
+            item for item in batch if not isinstance(item, (ToolCall, ToolError))
+        ]
+        tool_calls = [item for item in batch if isinstance(item, ToolCall)]
+        errors = _group_errors(item for item in batch if isinstance(item, ToolError))
+        try:
+            conn = get_connection(self.db_path)
+            with conn:
+                cursor = conn.cursor()
+                if log_rows:
+                    cursor.executemany(_INSERT_LOG_SQL, log_rows)
+                    # This thread holds the write lock for the whole
+                    # transaction, so the AUTOINCREMENT ids are contiguous
+                    cursor.execute("SELECT last_insert_rowid()")
+                    last_id = cursor.fetchone()[0]
+                    _update_tool_blocks(cursor, log_rows, last_id - len(log_rows) + 1)
+                if tool_calls:
+                    cursor.executemany(_INSERT_TOOL_CALL_SQL, tool_calls)
+                if errors:
+                    cursor.executemany(_UPSERT_ERROR_SQL, errors)
         except Exception as e:
             # Log to stderr if database logging fails
-            import sys
+            print(
+                f"Error writing {len(batch)} records to log database: {str(e)}",
+                file=sys.stderr,
+            )
 
-            print(f"Error writing to log database: {str(e)}", file=sys.stderr)
+    def _apply_retention(self):
+        try:
+            prune_logs(self.db_path)
+        except Exception as e:
+            print(f"Error applying log retention: {str(e)}", file=sys.stderr)
 
-    # Add the sink to logger
-    logger.add(db_sink, level="INFO")
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record enqueued so far has been written.
 
-    # Optionally enable stdout logging
-    if enable_stdout:
-        enable_stdout_logging(stdout_level)
+        Records enqueued after the call are not waited for, so this returns
+        even while other threads keep logging.
 
-    return conn
+        Args:
+            timeout: Maximum number of seconds to wait, settings.log_flush_timeout
+                by default.
 
+        Returns:
+            False if the records were not all written within the timeout.
+        """
+        if not self._thread.is_alive():
+            return True
+        if timeout is None:
+            timeout = settings.log_flush_timeout
+        deadline = time.monotonic() + timeout
+        marker = _Flush()
+        try:
+            # The queue can be full under the "block" policy
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(max(0.0, deadline - time.monotonic()))
 
-async def read_logs(
-    n: int = 15, db_path: str = None, level: str = "INFO", tool: str = None
-) -> List[Dict]:
+    def close(self):
+        """Flush pending records and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+
+# The database sink, created by get_db_sink on first use
+db_sink: BatchedDbSink = None
+_db_sink_lock = threading.Lock()
+# Loguru handler id of the database sink
+_db_handler_id: Optional[int] = None
+
+
+def get_db_sink(db_path: str = None) -> BatchedDbSink:
+    """Return the database sink, opening the log database on first use."""
+    global db_sink
+    if db_sink is None:
+        with _db_sink_lock:
+            if db_sink is None:
+                sink = BatchedDbSink(
+                    db_path or settings.sqldb_path,
+                    batch_size=settings.log_batch_size,
+                    flush_interval=settings.log_flush_interval,
+                    max_queue_size=settings.log_queue_max_size,
+                    overflow_policy=settings.log_overflow_policy,
+                )
+                atexit.register(sink.close)
+                db_sink = sink
+    return db_sink
+
+
+def _lazy_db_sink(message):
+    """Loguru sink that sets up the database sink when the first record arrives.
+
+    Installing it therefore neither opens the log database nor starts the
+    writer thread.
     """
-    Read the last n log entries from the log database, grouped by contiguous tool blocks.
+    get_db_sink()(message)
 
-    Args:
-        n: Number of log entries to read
-        db_path: Path to the log database. Defaults to path from settings.
-        level: Filter logs by level (INFO, WARNING, ERROR, etc.)
-        tool: Filter logs by tool name
 
-    Returns:
-        List of log entries as dictionaries, grouped by contiguous tool blocks
+def _remove_default_handler() -> None:
+    """Remove loguru's default stderr handler, if it is still installed."""
+    try:
+        logger.remove(0)
+    except ValueError:
+        pass
+
+
+def install_db_logging() -> None:
+    """Send log records to the log database from now on.
+
+    Also removes loguru's default stderr handler. Handlers added by the
+    application are kept, and calling it again does nothing.
     """
+    global _db_handler_id
+    with _db_sink_lock:
+        if _db_handler_id is not None:
+            return
+        _remove_default_handler()
+        _db_handler_id = logger.add(_lazy_db_sink, level="INFO")
+
+
+def setup_db_logging(
+    db_path: str = None, enable_stdout: bool = False, stdout_level: str = "INFO"
+):
+    """Set up batched database logging now instead of on the first record.
+
+    Records are written by a background thread (see ``BatchedDbSink``) and any
+    pending records are flushed when the interpreter exits.
+    """
+    global db_sink, _db_handler_id
     if db_path is None:
         db_path = settings.sqldb_path
-    try:
-        # Create a new connection for this specific read operation
-        conn = sqlite3.connect(db_path)
+    # Initialize the main connection to create the table
+    conn = get_connection(db_path)
+
+    with _db_sink_lock:
+        if db_sink is not None and db_sink.db_path != db_path:
+            db_sink.close()
+            db_sink = None
+    sink = get_db_sink(db_path)
+
+    # Replace the handler installed by install_db_logging
+    if _db_handler_id is not None:
+        logger.remove(_db_handler_id)
+    else:
+        _remove_default_handler()
+    _db_handler_id = logger.add(sink, level="INFO")
+
+    # Optionally enable stdout logging
+    if enable_stdout:
+        enable_stdout_logging(stdout_level)
+
+    return conn
+
+
+def _read_logs(n: int, db_path: str, level: str, tool: str) -> List[Dict]:
+    """Synchronous body of read_logs, run in a worker thread."""
+    # Make sure the tables exist and records still buffered in the sink are
+    # visible
+    get_db_sink().flush()
+
+    # Create a new connection for this specific read operation
+    with closing(sqlite3.connect(db_path)) as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
-        # Query for contiguous blocks of the same tool
+        # Each entry is tagged with the tool block it belongs to, looked up
+        # through the tool_blocks start_id index
         query = """
-        WITH tool_blocks AS (
-            SELECT *, 
-                   row_number() OVER (ORDER BY id) - 
-                   row_number() OVER (PARTITION BY tool ORDER BY id) AS block_id
-            FROM logs
-            WHERE tool IS NOT NULL
-        )
-        SELECT * FROM tool_blocks
+        SELECT logs.*,
+               (SELECT block_id FROM tool_blocks
+                WHERE start_id <= logs.id
+                ORDER BY start_id DESC LIMIT 1) AS block_id
+        FROM logs
         """
         params = []
-        where_clauses = []
+        where_clauses = ["tool IS NOT NULL"]
 
         if level:
             where_clauses.append("level = ?")
@@ -176,31 +791,121 @@ async def read_logs(
             where_clauses.append("tool = ?")
             params.append(tool)
 
-        if where_clauses:
-            query += " WHERE " + " AND ".join(where_clauses)
+        query += " WHERE " + " AND ".join(where_clauses)
 
         query += " ORDER BY id DESC LIMIT ?"
         params.append(n)
 
         cursor.execute(query, params)
-        rows = cursor.fetchall()
 
         # Convert rows to dictionaries
-        logs = [dict(row) for row in rows]
+        return [dict(row) for row in cursor.fetchall()]
 
-        conn.close()
-        return logs
+
+async def read_logs(
+    n: int = 15, db_path: str = None, level: str = "INFO", tool: str = None
+) -> List[Dict]:
+    """
+    Read the last n log entries from the log database, grouped by contiguous tool blocks.
+
+    Args:
+        n: Number of log entries to read
+        db_path: Path to the log database. Defaults to path from settings.
+        level: Filter logs by level (INFO, WARNING, ERROR, etc.)
+        tool: Filter logs by tool name
+
+    Returns:
+        List of log entries as dictionaries, grouped by contiguous tool blocks
+    """
+    if db_path is None:
+        db_path = settings.sqldb_path
+    try:
+        return await asyncio.to_thread(_read_logs, n, db_path, level, tool)
     except Exception as e:
         logger.error(f"Error reading logs: {str(e)}")
         return []
 
 
+def _iter_tool_blocks(db_path: str, limit: int) -> Iterator[Dict]:
+    """Yield the most recent tool blocks, newest first, with their log entries.
+
+    The entries of all blocks are read with a single range query in descending
+    id order and distributed over the blocks in one pass, so each block can be
+    yielded as soon as its oldest entry has been read. The connection is not
+    bound to a thread so the generator can be advanced from worker threads.
+    """
+    get_db_sink().flush()
+
+    with closing(sqlite3.connect(db_path, check_same_thread=False)) as conn:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        # Walk tool_blocks from the newest block back until `limit` log entries
+        # are covered
+        cursor.execute(
+            """
+        SELECT block_id AS segment_id, tool, count, start_id, end_id,
+               start_time, end_time
+        FROM tool_blocks
+        ORDER BY block_id DESC
+        """
+        )
+        blocks = []
+        remaining = limit
+        for row in cursor:
+            if remaining <= 0:
+                break
+            blocks.append(dict(row))
+            remaining -= row["count"]
+
+        if not blocks:
+            return
+
+        if remaining < 0:
+            # Only the newest entries of the oldest block fit within the limit
+            block = blocks[-1]
+            block["count"] += remaining
+            cursor.execute(
+                """
+            SELECT id, timestamp FROM logs
+            WHERE tool = ? AND id BETWEEN ? AND ?
+            ORDER BY id DESC LIMIT 1 OFFSET ?
+            """,
+                (block["tool"], block["start_id"], block["end_id"], block["count"] - 1),
+            )
+            block["start_id"], block["start_time"] = cursor.fetchone()
+
+        # One range query covering every block, newest entry first
+        cursor.execute(
+            """
+        SELECT * FROM logs
+        WHERE id BETWEEN ? AND ?
+        ORDER BY id DESC
+        """,
+            (blocks[-1]["start_id"], blocks[0]["end_id"]),
+        )
+        row = cursor.fetchone()
+        for block in blocks:
+            block_logs = []
+            while row is not None and row["id"] >= block["start_id"]:
+                # Entries between two blocks belong to neither
+                if row["id"] <= block["end_id"]:
+                    block_logs.append(dict(row))
+                row = cursor.fetchone()
+            block_logs.reverse()
+            block["logs"] = block_logs
+            yield block
+
+
 async def get_contiguous_tool_blocks(
     db_path: str = None, limit: int = 100
 ) -> List[Dict]:
     """
     Get blocks of contiguous logs from the same tool.
 
+    Use stream_contiguous_tool_blocks to receive blocks as they are assembled
+    instead of materialising them all.
+
     Args:
         db_path: Path to the log database. Defaults to path from settings.
         limit: Maximum number of log entries to retrieve
@@ -211,67 +916,212 @@ async def get_contiguous_tool_blocks(
     if db_path is None:
         db_path = settings.sqldb_path
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        return await asyncio.to_thread(lambda: list(_iter_tool_blocks(db_path, limit)))
+    except Exception as e:
+        logger.error(f"Error getting contiguous tool blocks: {str(e)}")
+        return []
 
-        # Query to identify and group contiguous tool blocks
-        query = """
-        WITH tool_segments AS (
-            SELECT *,
-                   tool != IFNULL(LAG(tool) OVER (ORDER BY id), '') AS new_segment
-            FROM logs
-            WHERE tool IS NOT NULL
-            ORDER BY id DESC
-            LIMIT ?
-        ),
-        segments AS (
-            SELECT *,
-                   SUM(new_segment) OVER (ORDER BY id) AS segment_id
-            FROM tool_segments
-        )
-        SELECT segment_id, tool, COUNT(*) AS count, 
-               MIN(id) AS start_id, MAX(id) AS end_id,
-               MIN(timestamp) AS start_time, MAX(timestamp) AS end_time
-        FROM segments
-        GROUP BY segment_id, tool
-        ORDER BY segment_id DESC
-        """
 
-        cursor.execute(query, (limit,))
-        rows = cursor.fetchall()
+async def stream_contiguous_tool_blocks(
+    db_path: str = None, limit: int = 100
+) -> AsyncIterator[Dict]:
+    """
+    Stream blocks of contiguous logs from the same tool, newest first.
 
-        # Convert rows to dictionaries
-        blocks = [dict(row) for row in rows]
+    Same blocks as get_contiguous_tool_blocks, but each block is yielded as soon
+    as it has been assembled. Database work runs in a worker thread.
 
-        # For each block, get the actual log entries
-        for block in blocks:
-            query = """
-            SELECT * FROM logs 
-            WHERE id BETWEEN ? AND ?
-            ORDER BY id
-            """
-            cursor.execute(query, (block["start_id"], block["end_id"]))
-            block_logs = [dict(row) for row in cursor.fetchall()]
-            block["logs"] = block_logs
+    Args:
+        db_path: Path to the log database. Defaults to path from settings.
+        limit: Maximum number of log entries to retrieve
 
-        conn.close()
-        return blocks
+    Yields:
+        Log blocks, where each block contains logs from the same tool
+    """
+    if db_path is None:
+        db_path = settings.sqldb_path
+    blocks = _iter_tool_blocks(db_path, limit)
+    try:
+        while True:
+            block = await asyncio.to_thread(next, blocks, None)
+            if block is None:
+                break
+            yield block
     except Exception as e:
         logger.error(f"Error getting contiguous tool blocks: {str(e)}")
+    finally:
+        await asyncio.to_thread(blocks.close)
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+def _tool_stats(window_minutes: float, db_path: str, tool: str) -> List[Dict]:
+    """Synchronous body of tool_stats, run in a worker thread."""
+    get_db_sink().flush()
+
+    since = (datetime.now(timezone.utc) - timedelta(minutes=window_minutes)).isoformat()
+    query = (
+        "SELECT tool, wall_time_ms, cpu_time_ms, exception_type, result_size "
+        "FROM tool_calls WHERE timestamp >= ?"
+    )
+    params = [since]
+    if tool:
+        query += " AND tool = ?"
+        params.append(tool)
+
+    calls: Dict[str, List[tuple]] = {}
+    with closing(sqlite3.connect(db_path)) as conn:
+        for row in conn.execute(query, params):
+            calls.setdefault(row[0], []).append(row[1:])
+
+    stats = []
+    for name, rows in sorted(calls.items()):
+        wall = sorted(r[0] for r in rows)
+        errors: Dict[str, int] = {}
+        for r in rows:
+            if r[2]:
+                errors[r[2]] = errors.get(r[2], 0) + 1
+        cpu = [r[1] for r in rows if r[1] is not None]
+        sizes = [r[3] for r in rows if r[3] is not None]
+        stats.append(
+            {
+                "tool": name,
+                "calls": len(rows),
+                "errors": sum(errors.values()),
+                "exception_types": errors,
+                "p50_ms": round(_percentile(wall, 50), 3),
+                "p95_ms": round(_percentile(wall, 95), 3),
+                "p99_ms": round(_percentile(wall, 99), 3),
+                "max_ms": round(wall[-1], 3),
+                "mean_cpu_ms": (round(sum(cpu) / len(cpu), 3) if cpu else None),
+                "mean_result_size": (round(sum(sizes) / len(sizes)) if sizes else None),
+            }
+        )
+    return stats
+
+
+async def tool_stats(
+    window_minutes: float = 60, tool: str = None, db_path: str = None
+) -> List[Dict]:
+    """
+    Report latency percentiles and outcomes per tool over a recent time window.
+
+    Args:
+        window_minutes: Only include calls made in the last window_minutes minutes
+        tool: Only report on this tool
+        db_path: Path to the log database. Defaults to path from settings.
+
+    Returns:
+        One entry per tool with call and error counts, p50/p95/p99/max wall time
+        in milliseconds, mean CPU time (of offloaded tools only) and mean result
+        size
+    """
+    if db_path is None:
+        db_path = settings.sqldb_path
+    try:
+        return await asyncio.to_thread(_tool_stats, window_minutes, db_path, tool)
+    except Exception as e:
+        logger.error(f"Error computing tool stats: {str(e)}")
         return []
 
 
-setup_db_logging(settings.sqldb_path)
-# Log startup message
-logger.info("Logger initialized with Sqlite3 (thread-safe)")
+def _read_errors(limit: int, db_path: str, tool: str) -> List[Dict]:
+    """Synchronous body of read_errors, run in a worker thread."""
+    get_db_sink().flush()
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.row_factory = sqlite3.Row
+        query = "SELECT * FROM error_groups"
+        params = []
+        if tool:
+            query += " WHERE tool = ?"
+            params.append(tool)
+        query += " ORDER BY last_seen DESC LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in conn.execute(query, params)]
+
+
+async def read_errors(
+    limit: int = 20, tool: str = None, db_path: str = None
+) -> List[Dict]:
+    """
+    List distinct tool errors, most recently seen first.
+
+    Identical errors (same exception type raised from the same code path) are
+    grouped under one fingerprint, so an error raised many times is one entry.
+
+    Args:
+        limit: Maximum number of errors to return
+        tool: Only list errors of this tool
+        db_path: Path to the log database. Defaults to path from settings.
+
+    Returns:
+        One entry per error with its fingerprint, tool, exception type, latest
+        message, traceback, occurrence count and first/last seen times
+    """
+    if db_path is None:
+        db_path = settings.sqldb_path
+    try:
+        return await asyncio.to_thread(_read_errors, limit, db_path, tool)
+    except Exception as e:
+        logger.error(f"Error reading errors: {str(e)}")
+        return []
+
 
 T = TypeVar("T", bound=Callable[..., Any])
 
 
+# Values _result_size looks at before giving up on a result
+RESULT_SIZE_MAX_ITEMS = 1000
+
+
+def _result_size(result: Any) -> Optional[int]:
+    """Approximate JSON size of a tool result in characters.
+
+    This runs on the event loop after every tool call, so the result is walked
+    instead of serialized. Results with more than RESULT_SIZE_MAX_ITEMS values,
+    or with values that are not JSON types, are not sized.
+    """
+    if isinstance(result, (str, bytes)):
+        return len(result)
+    size = 0
+    pending = [result]
+    for _ in range(RESULT_SIZE_MAX_ITEMS):
+        if not pending:
+            return size
+        value = pending.pop()
+        if isinstance(value, (str, bytes)):
+            size += len(value) + 2
+        elif isinstance(value, dict):
+            # Braces, plus a colon and a comma per item
+            size += 2 * len(value) + 1
+            pending.extend(value.keys())
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            size += len(value) + 1
+            pending.extend(value)
+        elif value is None or isinstance(value, (bool, int, float)):
+            size += len(str(value))
+        else:
+            return None
+    return size if not pending else None
+
+
 def tool_logger(func: T) -> T:
     """Decorator that binds the function name as a tool to the loguru logger.
 
+    Each invocation is also recorded in the tool_calls table with its wall time,
+    CPU time, exception type and result size. CPU time is measured in the
+    worker thread or process of offloaded tools (see lib/executors.py). It is
+    NULL for tools that run on the event loop, where the thread's CPU time
+    would include every other coroutine. Errors converted to an error
+    dictionary by exception_handler are recorded with their original exception
+    type.
+
     Args:
         func: The function to decorate
 
@@ -279,10 +1129,42 @@ def tool_logger(func: T) -> T:
         Decorated function with logger binding
     """
 
+    # Resolved on the first call, so decorating does not open the log database
+    sink: Optional[BatchedDbSink] = None
+
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        # Simply use the contextualize method for the duration of the function call
-        with logger.contextualize(tool=func.__name__):
-            return await func(*args, **kwargs)
+        nonlocal sink
+        exception_type = None
+        result = None
+        timer, timer_token = cpu_timer()
+        start_wall = time.perf_counter()
+        try:
+            # Simply use the contextualize method for the duration of the function call
+            with logger.contextualize(tool=func.__name__):
+                result = await func(*args, **kwargs)
+            if isinstance(result, dict) and result.get("Status") == "Exception":
+                exception_type = result.get("ExceptionType")
+            return result
+        except BaseException as e:
+            exception_type = type(e).__name__
+            raise
+        finally:
+            wall_time_ms = (time.perf_counter() - start_wall) * 1000
+            reset_cpu_timer(timer_token)
+            if sink is None:
+                sink = get_db_sink()
+            sink.record_tool_call(
+                ToolCall(
+                    tool=func.__name__,
+                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    wall_time_ms=wall_time_ms,
+                    cpu_time_ms=timer.seconds * 1000 if timer.measured else None,
+                    exception_type=exception_type,
+                    result_size=(
+                        _result_size(result) if exception_type is None else None
+                    ),
+                )
+            )
 
     return cast(T, wrapper)
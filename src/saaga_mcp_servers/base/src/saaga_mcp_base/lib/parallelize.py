@@ -1,7 +1,21 @@
 import asyncio
 import functools
 import inspect
-from typing import Any, Callable, Coroutine, Dict, List, TypeVar, cast, get_type_hints
+from time import monotonic
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+    get_type_hints,
+)
+
+from ..config.env import settings
 
 T = TypeVar("T", bound=Callable[..., Coroutine[Any, Any, Any]])
 
@@ -77,8 +91,13 @@ def _build_parallelized_docstring(func: Callable) -> str:
                                           for a single call to `{func_name}`.
 
     Returns:
-        List[Any]: A list containing the results of each call to `{func_name}`,
-                   in the same order as the input `kwargs_list`.
+        List[Dict[str, Any]]: One status object per call to `{func_name}`, in the
+                   same order as the input `kwargs_list`. Successful calls are
+                   `{{"Status": "Success", "Result": ...}}`; failed calls are
+                   `{{"Status": "Exception", "Message": ..., "ExceptionType": ...}}`
+                   and calls that exceeded the per-item timeout are
+                   `{{"Status": "Timeout", "Message": ...}}`. A failing item
+                   does not affect the others.
     """
 
 def _set_parallelized_signature_and_annotations(
@@ -106,34 +125,160 @@ def _set_parallelized_signature_and_annotations(
     }
 
 
-def parallelize(func: T) -> Callable[[List[Dict[str, Any]]], Coroutine[Any, Any, List[Any]]]:
+class _RateLimiter:
+    """Spaces out acquisitions so that at most `rate` happen per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def _call_item(
+    func: Callable, kwargs: Dict[str, Any], timeout: Optional[float]
+) -> Dict[str, Any]:
+    """Run a single call and wrap its outcome in a status object."""
+    try:
+        if timeout:
+            result = await asyncio.wait_for(func(**kwargs), timeout)
+        else:
+            result = await func(**kwargs)
+    except asyncio.TimeoutError:
+        return {"Status": "Timeout", "Message": f"Call exceeded {timeout} seconds"}
+    except Exception as e:
+        return {
+            "Status": "Exception",
+            "Message": str(e),
+            "ExceptionType": type(e).__name__,
+        }
+    # exception_handler already turned the failure into a status object
+    if isinstance(result, dict) and result.get("Status") == "Exception":
+        return result
+    return {"Status": "Success", "Result": result}
+
+
+async def _stream_items(
+    func: Callable,
+    kwargs_list: List[Dict[str, Any]],
+    max_concurrency: Optional[int],
+    timeout: Optional[float],
+    rate_limit: Optional[float],
+) -> AsyncIterator[Dict[str, Any]]:
+    """Run `func` over `kwargs_list` and yield status objects in input order.
+
+    At most `max_concurrency` worker tasks pull items from the list, so the
+    number of coroutines alive at once is bounded regardless of the list size.
+    A status object is yielded as soon as it and every item before it are done.
+    """
+    total = len(kwargs_list)
+    if total == 0:
+        return
+
+    limiter = _RateLimiter(rate_limit) if rate_limit else None
+    pending = iter(range(total))
+    completed: asyncio.Queue = asyncio.Queue()
+
+    async def worker() -> None:
+        for index in pending:
+            if limiter:
+                await limiter.acquire()
+            item = await _call_item(func, kwargs_list[index], timeout)
+            completed.put_nowait((index, item))
+
+    worker_count = min(total, max_concurrency) if max_concurrency else total
+    workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+    try:
+        ready: Dict[int, Dict[str, Any]] = {}
+        next_index = 0
+        while next_index < total:
+            index, item = await completed.get()
+            ready[index] = item
+            while next_index in ready:
+                yield ready.pop(next_index)
+                next_index += 1
+    finally:
+        # Stop outstanding work if the consumer goes away early
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _validate_kwargs_list(kwargs_list: Any) -> None:
+    if not isinstance(kwargs_list, list):
+        raise TypeError(f"Input must be a list of dicts, got {type(kwargs_list)}")
+    if not all(isinstance(kwargs, dict) for kwargs in kwargs_list):
+        raise TypeError("All items in kwargs_list must be dictionaries.")
+
+
+def parallelize(
+    func: T = None,
+    *,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    rate_limit: Optional[float] = None,
+) -> Callable[[List[Dict[str, Any]]], Coroutine[Any, Any, List[Dict[str, Any]]]]:
     """
     Decorator to parallelize an async function.
 
     The decorated function will accept a list of keyword argument dictionaries.
     It will then run the original function concurrently for each set of kwargs
-    using asyncio.gather and return a list of results.
+    and return a list with one status object per call (see
+    `_build_parallelized_docstring`), in input order. An exception or timeout
+    in one call is reported in its status object instead of failing the batch.
 
     The docstring and signature of the decorated function will be updated to reflect
-    this new calling convention.
+    this new calling convention. The decorated function also exposes a `stream`
+    attribute: an async generator taking the same `kwargs_list` that yields the
+    status objects in input order as soon as they are available.
+
+    Can be used bare (`parallelize(func)`) or with limits
+    (`parallelize(max_concurrency=5, rate_limit=2)(func)`).
+
+    Args:
+        func: The async function to parallelize.
+        max_concurrency: Maximum number of calls in flight at once. Defaults to
+            settings.parallel_max_concurrency; 0 means unbounded.
+        timeout: Per-call timeout in seconds. Defaults to
+            settings.parallel_item_timeout; None or 0 disables it.
+        rate_limit: Maximum number of calls started per second. None disables it.
     """
+    if func is None:
+        return functools.partial(
+            parallelize,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            rate_limit=rate_limit,
+        )
+
+    if max_concurrency is None:
+        max_concurrency = settings.parallel_max_concurrency
+    if timeout is None:
+        timeout = settings.parallel_item_timeout
+
+    async def stream(
+        kwargs_list: List[Dict[str, Any]],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        _validate_kwargs_list(kwargs_list)
+        async for item in _stream_items(
+            func, kwargs_list, max_concurrency, timeout, rate_limit
+        ):
+            yield item
 
     @functools.wraps(func)
-    async def wrapper(kwargs_list: List[Dict[str, Any]]) -> List[Any]:
+    async def wrapper(kwargs_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Wrapper function that executes the original function in parallel.
         This docstring will be replaced by _build_parallelized_docstring.
         """
-        if not isinstance(kwargs_list, list):
-            raise TypeError(
-                f"Input must be a list of dicts, got {type(kwargs_list)}"
-            )
-        if not all(isinstance(kwargs, dict) for kwargs in kwargs_list):
-            raise TypeError("All items in kwargs_list must be dictionaries.")
-
-        tasks = [func(**kwargs) for kwargs in kwargs_list]
-        results = await asyncio.gather(*tasks)
-        return results
+        return [item async for item in stream(kwargs_list)]
 
     # Update the docstring and signature for the wrapper function
     wrapper.__doc__ = _build_parallelized_docstring(func)
@@ -141,7 +286,11 @@ def parallelize(func: T) -> Callable[[List[Dict[str, Any]]], Coroutine[Any, Any,
         wrapper_func=wrapper,
         param_name="kwargs_list",
         param_annotation=List[Dict[str, Any]],
-        return_annotation=List[Any]
+        return_annotation=List[Dict[str, Any]],
+    )
+    wrapper.stream = stream
+
+    return cast(
+        Callable[[List[Dict[str, Any]]], Coroutine[Any, Any, List[Dict[str, Any]]]],
+        wrapper,
     )
-    
-    return cast(Callable[[List[Dict[str, Any]]], Coroutine[Any, Any, List[Any]]], wrapper)
@@ -0,0 +1,287 @@
+"""
+Progress events for long-running MCP tools.
+
+A tool marked with `streams_progress` gets a Redis channel for each call.
+Inside the tool (or any thread it offloads to), `report_progress` publishes
+events to that channel, and `create_mcp` wraps the tool with `relay_progress`,
+which subscribes to the channel and forwards every event to the client as an
+MCP progress notification. Messages and partial results are forwarded as log
+notifications, so clients can render results as they arrive.
+
+Code running in another process (a process pool or a Celery worker) can
+publish to the same channel by passing the name returned by
+`progress_channel()` to `report_progress(channel=...)`.
+
+Events reported on the server's event loop are published by a task using the
+async Redis client, in the order they were reported, so a slow Redis does not
+stall the loop. Events reported from other threads, including the event loops
+of offloaded async tools, are published with a blocking call from that thread. When Redis is unreachable, events from the server process are
+relayed through an in-process queue instead.
+"""
+
+import asyncio
+import collections
+import contextvars
+import functools
+import json
+import uuid
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar, cast
+
+from mcp.server.fastmcp import Context
+from mcp.server.lowlevel.server import request_ctx
+
+from .executors import is_worker_loop
+from .logging import logger
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+CHANNEL_PREFIX = "saaga:progress"
+
+# Marks the end of a call's events
+_DONE = "__done__"
+
+# (channel name, sink) of the tool call running in the current context
+_current: contextvars.ContextVar = contextvars.ContextVar(
+    "saaga_progress", default=None
+)
+
+
+def streams_progress(func: T) -> T:
+    """Mark a tool so create_mcp relays its progress events to the client."""
+    func._streams_progress = True
+    return func
+
+
+def is_streaming(func: Callable) -> bool:
+    """Whether create_mcp should wrap the tool with `relay_progress`."""
+    return getattr(func, "_streams_progress", False)
+
+
+def progress_channel() -> Optional[str]:
+    """Name of the progress channel of the current tool call, if any."""
+    current = _current.get()
+    return current[0] if current else None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class _Publisher:
+    """Publishes the messages queued for a channel on an event loop, in order.
+
+    The task ends once the queue is empty, and a new publisher is started for
+    the next message.
+    """
+
+    def __init__(self, key: Tuple[asyncio.AbstractEventLoop, str]):
+        self.key = key
+        self.queue: Deque[str] = collections.deque()
+        self.task = key[0].create_task(self._run())
+
+    async def _run(self) -> None:
+        from .scheduler.core.redis_client import async_redis_client
+
+        try:
+            while self.queue:
+                data = self.queue.popleft()
+                try:
+                    await async_redis_client.publish(self.key[1], data)
+                except Exception as e:
+                    logger.warning(f"Dropped progress event: {e}")
+        finally:
+            _publishers.pop(self.key, None)
+
+
+# Running publishers by (event loop, channel), which also keeps their tasks alive
+_publishers: Dict[Tuple[asyncio.AbstractEventLoop, str], _Publisher] = {}
+
+
+def _publish_data(channel: str, data: str) -> None:
+    loop = _running_loop()
+    # A worker loop may not run again before the call ends
+    if loop is None or is_worker_loop(loop):
+        from .scheduler.core.redis_client import redis_client
+
+        redis_client.publish(channel, data)
+        return
+    key = (loop, channel)
+    publisher = _publishers.get(key)
+    if publisher is None:
+        publisher = _publishers[key] = _Publisher(key)
+    publisher.queue.append(data)
+
+
+def _publish(channel: str, event: Dict[str, Any]) -> None:
+    _publish_data(channel, json.dumps(event, default=str))
+
+
+def report_progress(
+    progress: float,
+    total: Optional[float] = None,
+    message: Optional[str] = None,
+    partial: Any = None,
+    channel: Optional[str] = None,
+) -> None:
+    """
+    Publish a progress event for the current tool call.
+
+    Does nothing when called outside a tool marked with `streams_progress`
+    and no channel is given, so tools can report unconditionally. Never blocks
+    an event loop: on a loop the event is published in the background.
+
+    Args:
+        progress: Progress so far, e.g. items processed
+        total: Total amount of work, if known
+        message: Human readable status
+        partial: A partial result (must be JSON serializable)
+        channel: Channel to publish to, for code running outside the tool's
+            context (see `progress_channel`)
+    """
+    event = {"progress": progress, "total": total}
+    if message is not None:
+        event["message"] = message
+    if partial is not None:
+        event["partial"] = partial
+
+    if channel is not None:
+        _publish(channel, event)
+        return
+    current = _current.get()
+    if current is None:
+        return
+    _, sink = current
+    try:
+        sink(event)
+    except Exception as e:
+        # Progress is best effort, it must never fail the tool
+        logger.warning(f"Dropped progress event: {e}")
+
+
+def _request_context() -> Optional[Context]:
+    """Context of the MCP request being handled, if any."""
+    request_context = request_ctx.get(None)
+    if request_context is None:
+        return None
+    return Context(request_context=request_context)
+
+
+async def notify_progress(
+    ctx: Optional[Context], progress: float, total: Optional[float]
+) -> None:
+    """Send a progress notification if the tool was called through a request."""
+    if ctx is None:
+        return
+    try:
+        await ctx.report_progress(progress, total)
+    except ValueError:
+        # Called directly rather than through the MCP server
+        pass
+
+
+async def _forward(ctx: Optional[Context], event: Dict[str, Any]) -> None:
+    await notify_progress(ctx, event.get("progress", 0), event.get("total"))
+    if ctx is None:
+        return
+    text = event.get("message")
+    if "partial" in event:
+        partial = json.dumps(event["partial"], default=str)
+        text = f"{text}\n{partial}" if text else partial
+    if text:
+        try:
+            await ctx.info(text)
+        except ValueError:
+            pass
+
+
+async def _relay_pubsub(pubsub, ctx: Optional[Context]) -> None:
+    async for message in pubsub.listen():
+        if message.get("type") != "message":
+            continue
+        data = message["data"]
+        if isinstance(data, bytes):
+            data = data.decode()
+        if data == _DONE:
+            return
+        try:
+            await _forward(ctx, json.loads(data))
+        except Exception as e:
+            logger.warning(f"Could not relay progress event: {e}")
+
+
+async def _relay_queue(queue: asyncio.Queue, ctx: Optional[Context]) -> None:
+    while True:
+        event = await queue.get()
+        if event is _DONE:
+            return
+        try:
+            await _forward(ctx, event)
+        except Exception as e:
+            logger.warning(f"Could not relay progress event: {e}")
+
+
+async def _subscribe(channel: str):
+    """Subscribe to channel, or return None when Redis is unreachable."""
+    from .scheduler.core.redis_client import async_redis_client
+
+    pubsub = async_redis_client.client.pubsub()
+    try:
+        await pubsub.subscribe(channel)
+    except Exception as e:
+        logger.warning(f"Relaying progress in-process, Redis failed: {e}")
+        await pubsub.aclose()
+        return None
+    return pubsub
+
+
+def relay_progress(func: T) -> T:
+    """Decorator that relays a tool's progress events as MCP notifications.
+
+    Args:
+        func: The async tool function to decorate
+
+    Returns:
+        An async function that runs the tool with a progress channel
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        ctx = _request_context()
+        channel = f"{CHANNEL_PREFIX}:{uuid.uuid4().hex}"
+        pubsub = await _subscribe(channel)
+
+        if pubsub is not None:
+            sink = functools.partial(_publish, channel)
+            relay = asyncio.create_task(_relay_pubsub(pubsub, ctx))
+        else:
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue = asyncio.Queue()
+
+            def sink(event: Dict[str, Any]) -> None:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+
+            relay = asyncio.create_task(_relay_queue(queue, ctx))
+
+        token = _current.set((channel, sink))
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _current.reset(token)
+            # Events published before the end marker are relayed first
+            try:
+                if pubsub is not None:
+                    _publish_data(channel, _DONE)
+                else:
+                    sink(_DONE)
+                await asyncio.wait_for(relay, timeout=5)
+            except Exception as e:
+                relay.cancel()
+                logger.warning(f"Stopped relaying progress of {channel}: {e}")
+            finally:
+                if pubsub is not None:
+                    await pubsub.aclose()
+
+    return cast(T, wrapper)
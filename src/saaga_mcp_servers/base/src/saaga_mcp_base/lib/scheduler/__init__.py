@@ -1,22 +1,26 @@
 """
 Scheduler package for task management using Celery, Redis, and Flower.
-"""
-
-# Import core components
-from saaga_mcp_base.lib.scheduler.core import (
-    RedisClient,
-    redis_client,
-    app,
-    scheduled_tool,
-)
 
-# Import tasks
+The core components are imported on first access, so importing the scheduler
+tools (e.g. to register them with an MCP server) does not load Celery or
+Redis until a tool is called.
+"""
 
+import importlib
 
 # Export all important components
 __all__ = [
     "RedisClient",
+    "AsyncRedisClient",
     "redis_client",
+    "async_redis_client",
     "app",
     "scheduled_tool",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        core = importlib.import_module("saaga_mcp_base.lib.scheduler.core")
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,8 +2,20 @@
 Core functionality for the scheduler service.
 """
 
-from .redis_client import RedisClient, redis_client
+from .redis_client import (
+    AsyncRedisClient,
+    RedisClient,
+    async_redis_client,
+    redis_client,
+)
 from .celery_app import app
 from .decorators import scheduled_tool
 
-__all__ = ["RedisClient", "redis_client", "app", "scheduled_tool"]
+__all__ = [
+    "RedisClient",
+    "AsyncRedisClient",
+    "redis_client",
+    "async_redis_client",
+    "app",
+    "scheduled_tool",
+]
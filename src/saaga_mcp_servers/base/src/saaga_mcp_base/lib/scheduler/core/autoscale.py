@@ -0,0 +1,126 @@
+"""
+Queue-depth driven autoscaler for Celery prefork workers.
+
+Celery's default autoscaler sizes the pool by the number of tasks the worker
+has already reserved, which is capped by the prefetch limit and includes
+tasks waiting for their ETA. This autoscaler sizes it by the tasks that are
+running or ready to run, plus the messages still waiting in the broker for the
+queues the worker consumes from. It is enabled for every worker started with
+`--autoscale` through the `worker_autoscaler` setting in celery_app.py.
+
+Queue depth alone says nothing about how long the backlog takes: a thousand
+millisecond tasks are done by one process before a hundred one-minute tasks
+have started. The autoscaler therefore also tracks how many tasks a busy
+process finishes per second (a moving average), and only adds the processes
+needed to work off the backlog within `CELERY_AUTOSCALE_TARGET_LATENCY`
+seconds. Until a rate is known, every waiting task gets a process.
+"""
+
+from math import ceil
+from time import monotonic
+
+from celery.utils.log import get_logger
+from celery.worker import state
+from celery.worker.autoscale import Autoscaler
+
+from saaga_mcp_base.config.env import CELERY
+
+logger = get_logger(__name__)
+
+# Weight of the newest sample in the moving average of the task rate
+RATE_SMOOTHING = 0.2
+
+
+class QueueDepthAutoscaler(Autoscaler):
+    """Autoscaler that also counts messages waiting in the broker and how
+    fast they are worked off."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._depth = 0
+        self._depth_checked_at = 0.0
+        # Tasks finished per second by one busy process, None until measured
+        self.task_rate = None
+        self._finished = state.all_total_count[0]
+        self._busy = 0
+        self._rate_checked_at = monotonic()
+
+    def _queue_names(self):
+        if self.worker is None:
+            return []
+        return list(self.worker.app.amqp.queues.consume_from)
+
+    def queue_depth(self) -> int:
+        """Messages waiting in the broker, refreshed at most every interval."""
+        now = monotonic()
+        if now - self._depth_checked_at < CELERY.AUTOSCALE_DEPTH_INTERVAL:
+            return self._depth
+        self._depth_checked_at = now
+
+        depth = 0
+        try:
+            with self.worker.app.connection_for_read() as connection:
+                channel = connection.default_channel
+                for name in self._queue_names():
+                    depth += channel.queue_declare(
+                        queue=name, passive=True
+                    ).message_count
+        except Exception as exc:
+            # Keep scaling on reserved tasks alone while the broker is unreachable
+            logger.warning("Could not read queue depth: %r", exc)
+            depth = 0
+        self._depth = depth
+        return depth
+
+    def sample_rate(self) -> None:
+        """Update the moving average of tasks finished per busy process."""
+        now = monotonic()
+        elapsed = now - self._rate_checked_at
+        finished = state.all_total_count[0]
+        done = finished - self._finished
+        busy = len(state.active_requests)
+        # Processes busy at either end of the interval; tasks that started and
+        # finished in between kept at least one process busy.
+        workers = max(self._busy, busy, 1 if done else 0)
+        if elapsed > 0 and workers:
+            rate = done / (elapsed * workers)
+            if self.task_rate is None:
+                self.task_rate = rate
+            else:
+                self.task_rate += RATE_SMOOTHING * (rate - self.task_rate)
+        self._rate_checked_at = now
+        self._finished = finished
+        self._busy = busy
+
+    def processes_for(self, backlog: int) -> int:
+        """Processes needed to work off backlog within the target latency."""
+        target = CELERY.AUTOSCALE_TARGET_LATENCY
+        if not backlog or not target or not self.task_rate:
+            return backlog
+        # Each process finishes task_rate * target tasks within the target
+        return min(backlog, ceil(backlog / (self.task_rate * target)))
+
+    def _maybe_scale(self, req=None):
+        # Sampled on the periodic tick only (req is None), not for every task
+        # message, so the interval is long enough to measure a rate. qty is
+        # read several times per call.
+        if req is None:
+            self.sample_rate()
+        return super()._maybe_scale(req)
+
+    @property
+    def qty(self):
+        active = state.active_requests
+        # Tasks waiting for their ETA do not need a process yet
+        ready = sum(
+            1
+            for request in state.reserved_requests
+            if request not in active and not request.eta
+        )
+        return len(active) + self.processes_for(ready + self.queue_depth())
+
+    def info(self):
+        info = super().info()
+        info["queue_depth"] = self._depth
+        info["task_rate"] = self.task_rate
+        return info
@@ -3,15 +3,21 @@ Celery application configuration.
 """
 
 from celery import Celery
+from celery.signals import worker_init
 import os
 from saaga_mcp_base.config.env import CELERY, REDIS
+from saaga_mcp_base.lib.logging import install_db_logging
+
+# Registers the worker signals that manage the per-process event loop
+from . import event_loop  # noqa: F401
 
 # Create Celery app
 app = Celery(
     CELERY.APP_NAME,
     broker=CELERY.get_broker_url(),
     backend=CELERY.get_backend_url(),
-    # mybe i need include her
+    # Modules whose tasks every worker must register
+    include=["saaga_mcp_base.lib.scheduler.core.delayed"],
 )
 
 # TODO: This might have to be renabled.
@@ -33,8 +39,34 @@ app.conf.update(
     timezone=CELERY.TIMEZONE,
     enable_utc=CELERY.ENABLE_UTC,
     broker_connection_retry_on_startup=True,
+    # Beat keeps its schedule in Redis, so recurring schedules of scheduled
+    # tools can be added and removed at runtime (see recurrence.py)
+    beat_scheduler="redbeat.RedBeatScheduler",
+    redbeat_redis_url=REDIS.URL,
+    # Used by workers started with --autoscale
+    worker_autoscaler="saaga_mcp_base.lib.scheduler.core.autoscale:QueueDepthAutoscaler",
 )
 
+# Hand runs from the delayed-task store to the workers when they come due
+app.conf.beat_schedule = {
+    "dispatch-delayed-tasks": {
+        "task": "saaga_mcp_base.lib.scheduler.core.delayed.dispatch_due_tasks",
+        "schedule": CELERY.DELAYED_POLL_INTERVAL,
+        # Polls queued while no worker is running are useless later
+        "options": {
+            "expires": 2 * CELERY.DELAYED_POLL_INTERVAL,
+            "queue": CELERY.IO_QUEUE,
+        },
+    },
+}
+
+
+@worker_init.connect
+def _log_to_database(**kwargs):
+    # Tools run by workers log to the same database as the server's
+    install_db_logging()
+
+
 # # Optional: Configure periodic tasks
 # app.conf.beat_schedule = {
 #     # Example periodic task:
@@ -9,15 +9,19 @@ The module also contains helper functions for updating function signatures and d
 to maintain proper documentation and type hints when adding parameters.
 """
 
+import asyncio
 import functools
 import inspect
 import sys
 import os
 import importlib
-from datetime import datetime
-from typing import Callable, Optional, Any, Union, Dict, get_type_hints
-import asyncio
+from datetime import datetime, timezone
+from typing import Callable, Optional, Any, Union, Dict, List, get_type_hints
+from saaga_mcp_base.config.env import CELERY
+from . import delayed, recurrence as recurring
+from .results import compact_result
 from .celery_app import app
+from .event_loop import run_coroutine
 
 
 def _update_docstring(func: Callable, param_name: str, param_doc: str) -> None:
@@ -126,7 +130,31 @@ def _update_signature(
     return new_sig
 
 
-def scheduled_tool(func: Callable) -> Callable:
+def _parse_schedule_time(value: str) -> datetime:
+    """Parse an ISO 8601 schedule time into an aware UTC datetime.
+
+    Times with a UTC offset (or "Z") are honoured; naive times are taken as the
+    server's local time.
+    """
+    try:
+        if value.endswith(("Z", "z")):
+            value = value[:-1] + "+00:00"
+        schedule_time = datetime.fromisoformat(value)
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError("datetime string must be in ISO format (YYYY-MM-DDTHH:MM:SS)")
+    # astimezone() assumes local time for naive datetimes
+    return schedule_time.astimezone(timezone.utc)
+
+
+def _task_queue(func: Callable, queue: Optional[str]) -> str:
+    """Resolve the Celery queue a scheduled tool's task is routed to."""
+    if queue is None:
+        # Coroutine tools are assumed to be I/O-bound, sync tools CPU-bound
+        queue = "io" if inspect.iscoroutinefunction(func) else "cpu"
+    return {"io": CELERY.IO_QUEUE, "cpu": CELERY.CPU_QUEUE}.get(queue, queue)
+
+
+def scheduled_tool(func: Callable = None, *, queue: Optional[str] = None) -> Callable:
     """
     Decorator that wraps an MCP tool function and adds scheduling capability.
 
@@ -134,16 +162,37 @@ def scheduled_tool(func: Callable) -> Callable:
     When this parameter is provided, the function execution is scheduled for that time
     using Celery's delay method. The datetime parameter should be a string in ISO format.
 
+    The wrapper also exposes `schedule_batch`, an async companion (registrable as
+    its own MCP tool, named `<tool>_batch`) that schedules many runs at once.
+
+    Scheduled runs are routed to the "io" queue (thread pool worker) for
+    coroutine tools and to the "cpu" queue (autoscaled prefork worker) for sync
+    tools. Pass `queue` to choose explicitly, e.g. `@scheduled_tool(queue="cpu")`.
+
+    An optional 'recurrence' parameter (cron expression or interval such as
+    "every 5 minutes") runs the function repeatedly instead, through the
+    Redis-backed beat scheduler (see recurrence.py).
+
+    Runs are scheduled with a UTC `eta`. Runs further ahead than
+    CELERY.DELAYED_THRESHOLD wait in the Redis delayed-task store (see
+    delayed.py) instead of worker memory.
+
     Schedule Time Format:
     - Use ISO 8601 format: 'YYYY-MM-DDTHH:MM:SS'
       Example: '2023-12-31T23:59:59' for December 31, 2023 at 11:59:59 PM
+    - A UTC offset ('2023-12-31T23:59:59+02:00' or '...Z') is honoured; times
+      without one are in the server's local time
 
     Args:
         func: The MCP tool function to wrap
+        queue: "io", "cpu", or the name of any other Celery queue
 
     Returns:
         Callable: The wrapped function with scheduling capability and an added datetime parameter
     """
+    if func is None:
+        return functools.partial(scheduled_tool, queue=queue)
+
     # Get the current module path
     curr_module = sys.modules[__name__]
     module_path = curr_module.__name__
@@ -156,19 +205,21 @@ def scheduled_tool(func: Callable) -> Callable:
     _update_docstring(func, "datetime", datetime_doc)
     # Update the signature with the datetime parameter
     new_sig = _update_signature(func, "datetime", Optional[str], None)
+    recurrence_doc = "Optional[str] - When provided, runs the function repeatedly on\n                 this schedule instead of now: a cron expression ('*/5 * * * *', UTC)\n                 or an interval ('every 5 minutes', '30s', '2h')"
+    _update_docstring(func, "recurrence", recurrence_doc)
+    new_sig = _update_signature(func, "recurrence", Optional[str], None)
 
     # Create a Celery task for the function
-    @app.task(name=task_name)
+    @app.task(name=task_name, queue=_task_queue(func, queue))
     def celery_task(*args, **kwargs):
         """Celery task that executes the wrapped function."""
         print(f"Executing scheduled task: {task_name}")
         if inspect.iscoroutinefunction(func):
-            # For coroutine functions, we need to run them in an event loop
-
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(func(*args, **kwargs))
+            # Coroutine functions run on the worker process' persistent event loop
+            result = run_coroutine(func(*args, **kwargs))
         else:
-            return func(*args, **kwargs)
+            result = func(*args, **kwargs)
+        return compact_result(result, celery_task.request.id)
 
     @functools.wraps(func)
     async def wrapper(*args, **kwargs) -> Any:
@@ -177,28 +228,27 @@ def scheduled_tool(func: Callable) -> Callable:
         """
         # Extract datetime parameter if present
         schedule_time = kwargs.pop("datetime", None)
+        recurrence = kwargs.pop("recurrence", None)
 
-        if schedule_time:
-            # Convert string to datetime
-            try:
-                schedule_time = datetime.fromisoformat(schedule_time)
-            except ValueError:
-                raise ValueError(
-                    "datetime string must be in ISO format (YYYY-MM-DDTHH:MM:SS)"
-                )
-
-            # Calculate delay in seconds from now
-            now = datetime.now()
-            delay_seconds = max(0, (schedule_time - now).total_seconds())
-
-            # Schedule the task with Celery
-            result = celery_task.apply_async(
-                args=args, kwargs=kwargs, countdown=delay_seconds
+        if recurrence:
+            if schedule_time:
+                raise ValueError("Provide either datetime or recurrence, not both")
+            result = await asyncio.to_thread(
+                recurring.add_recurring, celery_task, args, kwargs, recurrence
+            )
+            return {"status": "recurring", **result}
+        elif schedule_time:
+            # Convert string to an aware UTC datetime
+            schedule_time = _parse_schedule_time(schedule_time)
+
+            # Schedule the task with Celery, or in the delayed-task store
+            task_id = await asyncio.to_thread(
+                delayed.schedule, celery_task, args, kwargs, schedule_time
             )
 
             return {
                 "status": "scheduled",
-                "task_id": result.id,
+                "task_id": task_id,
                 "scheduled_time": schedule_time.isoformat(),
             }
         else:
@@ -208,10 +258,45 @@ def scheduled_tool(func: Callable) -> Callable:
             else:
                 return func(*args, **kwargs)
 
+    async def schedule_batch(
+        schedules: List[Dict[str, Any]], chunk_size: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Schedule many runs in one batch.
+
+        Args:
+            schedules: List of {"kwargs": {...}, "datetime": "YYYY-MM-DDTHH:MM:SS"}
+                       entries, one per run. (kwargs, datetime) pairs are accepted too.
+            chunk_size: Number of runs published per Celery group or Redis pipeline
+
+        Returns:
+            Dictionary with the number of scheduled runs and their task ids, in
+            the same order as schedules
+        """
+        runs = []
+        for item in schedules:
+            if isinstance(item, (list, tuple)):
+                kwargs, schedule_time = item
+            else:
+                kwargs, schedule_time = item.get("kwargs"), item.get("datetime")
+            runs.append(((), kwargs or {}, _parse_schedule_time(schedule_time)))
+
+        task_ids = await asyncio.to_thread(
+            delayed.schedule_many, celery_task, runs, chunk_size
+        )
+        return {"status": "scheduled", "count": len(task_ids), "task_ids": task_ids}
+
+    schedule_batch.__name__ = f"{func.__name__}_batch"
+    schedule_batch.__qualname__ = schedule_batch.__name__
+    schedule_batch.__doc__ = (
+        f"Batch companion of `{func.__name__}`.\n" + schedule_batch.__doc__
+    )
+
     # Copy the updated signature to the wrapper as well
     wrapper.__signature__ = new_sig
 
-    # Store the task reference on the wrapped function
+    # Store the task reference and batch companion on the wrapped function
     wrapper.celery_task = celery_task
+    wrapper.schedule_batch = schedule_batch
 
     return wrapper
@@ -0,0 +1,274 @@
+"""
+Redis sorted-set store for far-future scheduled tasks.
+
+A task published with an ETA is delivered to a worker right away and held in
+the worker's memory until it is due, so many far-future schedules bloat every
+worker's prefetch. Runs due within CELERY.DELAYED_THRESHOLD seconds are still
+published directly with `eta=`. Later runs are stored in Redis instead:
+
+- a sorted set (CELERY.DELAYED_KEY) of task ids scored by their UTC timestamp
+- a hash (CELERY.DELAYED_KEY + ":tasks") of task id -> task name, arguments
+  and queue
+- a sorted set (CELERY.DELAYED_KEY + ":inflight") of claimed task ids scored by
+  the time their claim expires
+
+The `dispatch_due_tasks` task, run by beat every CELERY.DELAYED_POLL_INTERVAL
+seconds on the io queue, atomically claims the runs that come due before the
+next poll, publishes them with their exact ETA, keeping the task id returned
+when the run was scheduled, and only then removes them. Runs it fails to
+publish go back to the schedule, and claims left behind by a dispatcher that
+died are claimed again once they expire, so every run is published at least
+once.
+"""
+
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from celery import Task, group
+
+from saaga_mcp_base.config.env import CELERY
+from saaga_mcp_base.lib.scheduler.core.celery_app import app
+from saaga_mcp_base.lib.scheduler.core.redis_client import redis_client
+
+TASKS_KEY = f"{CELERY.DELAYED_KEY}:tasks"
+INFLIGHT_KEY = f"{CELERY.DELAYED_KEY}:inflight"
+
+# Claims up to ARGV[2] runs and returns [id, payload, score]*: first claims
+# that expired before ARGV[3] (scored ARGV[3], they are overdue), then runs due
+# before ARGV[1]. Claims expire at ARGV[4].
+_CLAIM_DUE = """
+local limit = tonumber(ARGV[2])
+local out = {}
+local stale = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', ARGV[3], 'LIMIT', 0, limit)
+for _, id in ipairs(stale) do
+    redis.call('ZADD', KEYS[3], ARGV[4], id)
+    out[#out + 1] = id
+    out[#out + 1] = redis.call('HGET', KEYS[2], id) or ''
+    out[#out + 1] = ARGV[3]
+end
+if #stale >= limit then return out end
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, limit - #stale)
+for i = 1, #ids, 2 do
+    local id = ids[i]
+    out[#out + 1] = id
+    out[#out + 1] = redis.call('HGET', KEYS[2], id) or ''
+    out[#out + 1] = ids[i + 1]
+    redis.call('ZREM', KEYS[1], id)
+    redis.call('ZADD', KEYS[3], ARGV[4], id)
+end
+return out
+"""
+_claim_due_script = None
+
+# One scheduled run: (args, kwargs, UTC eta)
+Run = Tuple[Sequence[Any], Dict[str, Any], datetime]
+
+
+def schedule_many(task: Task, runs: List[Run], chunk_size: int = 500) -> List[str]:
+    """
+    Schedule runs of a task, storing far-future runs in Redis.
+
+    Args:
+        task: The Celery task to run
+        runs: (args, kwargs, eta) per run. eta must be timezone-aware.
+        chunk_size: Runs per Celery group or Redis pipeline
+
+    Returns:
+        The task ids of the runs, in the same order as runs
+    """
+    task_ids = [uuid.uuid4().hex for _ in runs]
+    horizon = time.time() + CELERY.DELAYED_THRESHOLD
+    direct = []
+    stored = []
+    for task_id, (args, kwargs, eta) in zip(task_ids, runs):
+        if eta.timestamp() <= horizon:
+            direct.append(
+                task.signature(args=args, kwargs=kwargs, eta=eta, task_id=task_id)
+            )
+        else:
+            stored.append((task_id, args, kwargs, eta))
+
+    # A group publishes all of its tasks through a single producer and broker
+    # connection instead of acquiring one per apply_async call
+    for start in range(0, len(direct), chunk_size):
+        group(direct[start : start + chunk_size]).apply_async()
+
+    for start in range(0, len(stored), chunk_size):
+        _store(
+            (
+                task_id,
+                {
+                    "task": task.name,
+                    "args": list(args),
+                    "kwargs": kwargs,
+                    "queue": task.queue,
+                },
+                eta.timestamp(),
+            )
+            for task_id, args, kwargs, eta in stored[start : start + chunk_size]
+        )
+
+    return task_ids
+
+
+def _store(runs) -> None:
+    """Add (task id, payload, timestamp) runs to the store in one pipeline."""
+    with redis_client.pipeline(transaction=False) as pipe:
+        for task_id, payload, score in runs:
+            pipe.hset(TASKS_KEY, task_id, json.dumps(payload))
+            pipe.zadd(CELERY.DELAYED_KEY, {task_id: score})
+        pipe.execute()
+
+
+def schedule(
+    task: Task,
+    args: Sequence[Any] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+    eta: datetime = None,
+) -> str:
+    """
+    Schedule one run of a task (see `schedule_many`).
+
+    Returns:
+        The task id of the run
+    """
+    eta = eta or datetime.now(timezone.utc)
+    return schedule_many(task, [(args, kwargs or {}, eta)])[0]
+
+
+def cancel(task_ids: List[str]) -> int:
+    """
+    Remove runs from the store before they are dispatched.
+
+    Args:
+        task_ids: Task ids returned when the runs were scheduled
+
+    Returns:
+        Number of stored runs removed
+    """
+    if not task_ids:
+        return 0
+    with redis_client.pipeline() as pipe:
+        pipe.zrem(CELERY.DELAYED_KEY, *task_ids)
+        pipe.zrem(INFLIGHT_KEY, *task_ids)
+        pipe.hdel(TASKS_KEY, *task_ids)
+        removed, claimed, _ = pipe.execute()
+    return removed + claimed
+
+
+def upcoming(limit: int = 50) -> List[Dict[str, Any]]:
+    """
+    The next runs waiting in the store, earliest first.
+
+    Args:
+        limit: Maximum number of runs to return
+
+    Returns:
+        List of {"task_id", "task", "eta", "kwargs"} dictionaries
+    """
+    entries = redis_client.client.zrange(
+        CELERY.DELAYED_KEY, 0, limit - 1, withscores=True
+    )
+    if not entries:
+        return []
+    task_ids = [task_id.decode() for task_id, _ in entries]
+    payloads = redis_client.client.hmget(TASKS_KEY, task_ids)
+    runs = []
+    for task_id, (_, score), payload in zip(task_ids, entries, payloads):
+        payload = json.loads(payload) if payload else {}
+        runs.append(
+            {
+                "task_id": task_id,
+                "task": payload.get("task"),
+                "eta": datetime.fromtimestamp(score, timezone.utc).isoformat(),
+                "kwargs": payload.get("kwargs"),
+            }
+        )
+    return runs
+
+
+def claim_due(until: float, limit: int) -> List[Tuple[str, Dict[str, Any], float]]:
+    """Atomically claim runs due before the `until` timestamp.
+
+    Claimed runs stay in the store until `ack` removes them, or `release`
+    puts them back. Claims that are neither expire after
+    CELERY.DELAYED_CLAIM_TIMEOUT seconds and are then returned again.
+    """
+    global _claim_due_script
+    if _claim_due_script is None:
+        _claim_due_script = redis_client.client.register_script(_CLAIM_DUE)
+    now = time.time()
+    flat = _claim_due_script(
+        keys=[CELERY.DELAYED_KEY, TASKS_KEY, INFLIGHT_KEY],
+        args=[until, limit, now, now + CELERY.DELAYED_CLAIM_TIMEOUT],
+        client=redis_client.client,
+    )
+    runs = []
+    orphans = []
+    for i in range(0, len(flat), 3):
+        task_id, payload, score = flat[i : i + 3]
+        if payload:
+            runs.append((task_id.decode(), json.loads(payload), float(score)))
+        else:
+            # Nothing left to publish
+            orphans.append(task_id.decode())
+    if orphans:
+        ack(orphans)
+    return runs
+
+
+def ack(task_ids: List[str]) -> None:
+    """Remove claimed runs that have been published."""
+    if not task_ids:
+        return
+    with redis_client.pipeline() as pipe:
+        pipe.zrem(INFLIGHT_KEY, *task_ids)
+        pipe.hdel(TASKS_KEY, *task_ids)
+        pipe.execute()
+
+
+def release(runs: List[Tuple[str, Dict[str, Any], float]]) -> None:
+    """Put claimed runs back in the schedule, at their original time."""
+    if not runs:
+        return
+    with redis_client.pipeline() as pipe:
+        pipe.zrem(INFLIGHT_KEY, *(task_id for task_id, _, _ in runs))
+        pipe.zadd(CELERY.DELAYED_KEY, {task_id: score for task_id, _, score in runs})
+        pipe.execute()
+
+
+@app.task(
+    name=f"{__name__}.dispatch_due_tasks", ignore_result=True, queue=CELERY.IO_QUEUE
+)
+def dispatch_due_tasks() -> int:
+    """Publish stored runs that come due before the next poll."""
+    lookahead = 2 * CELERY.DELAYED_POLL_INTERVAL
+    dispatched = 0
+    while True:
+        runs = claim_due(time.time() + lookahead, CELERY.DELAYED_BATCH_SIZE)
+        if not runs:
+            return dispatched
+        sent = 0
+        try:
+            with app.producer_or_acquire() as producer:
+                for task_id, payload, score in runs:
+                    app.send_task(
+                        payload["task"],
+                        args=payload.get("args") or (),
+                        kwargs=payload.get("kwargs") or {},
+                        task_id=task_id,
+                        queue=payload.get("queue"),
+                        eta=datetime.fromtimestamp(score, timezone.utc),
+                        producer=producer,
+                    )
+                    sent += 1
+        finally:
+            ack([task_id for task_id, _, _ in runs[:sent]])
+            # The next poll retries what was not published
+            release(runs[sent:])
+        dispatched += len(runs)
+        if len(runs) < CELERY.DELAYED_BATCH_SIZE:
+            return dispatched
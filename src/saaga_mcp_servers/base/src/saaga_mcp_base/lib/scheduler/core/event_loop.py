@@ -0,0 +1,93 @@
+"""
+Persistent event loop for running coroutine tools inside Celery workers.
+
+Each worker process owns one event loop running in a background thread. It is
+started from the `worker_process_init` signal (prefork pool) or lazily on first
+use (solo/threads pools), and stopped on `worker_process_shutdown`. Celery
+tasks submit their coroutine to this loop and wait for the result, so loop
+state (connections, clients, caches) survives across tasks. With a `threads`
+pool, every worker thread submits to the same loop, which lets many scheduled
+coroutine tools run concurrently inside one worker process.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def start_worker_loop() -> asyncio.AbstractEventLoop:
+    """Start the worker's event loop thread if it is not running yet."""
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed() or not _thread.is_alive():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_loop.run_forever, name="saaga-worker-loop", daemon=True
+            )
+            _thread.start()
+        return _loop
+
+
+async def _cancel_pending_tasks() -> None:
+    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.get_running_loop().shutdown_asyncgens()
+
+
+def stop_worker_loop(timeout: float = 10) -> None:
+    """Cancel tasks still pending on the worker's event loop and stop it."""
+    global _loop, _thread
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop = _thread = None
+    if loop is None or not thread.is_alive():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop).result(timeout)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+    if not loop.is_running():
+        loop.close()
+
+
+def run_coroutine(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None):
+    """Run a coroutine on the worker's event loop and block until it finishes.
+
+    Args:
+        coro: The coroutine to run
+        timeout: Seconds to wait for the result before cancelling the coroutine
+
+    Returns:
+        The coroutine's result
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, start_worker_loop())
+    try:
+        return future.result(timeout)
+    except BaseException:
+        # Timeout, or the Celery task itself was interrupted
+        future.cancel()
+        raise
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs):
+    # A forked child must not reuse the parent's loop thread, which does not
+    # exist in the child
+    global _loop, _thread
+    _loop = _thread = None
+    start_worker_loop()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs):
+    stop_worker_loop()
@@ -8,31 +8,84 @@ import subprocess
 import sys
 import time
 from typing import List, Optional
-from saaga_mcp_base.config.env import REDIS, FLOWER
+import redis
+from saaga_mcp_base.config.env import CELERY, REDIS, FLOWER
 from urllib.parse import urlparse
 
 # TODO: I think all the start functions should be factored out to seperate files
 
 
-def start_redis(port: int = None, daemonize: bool = True) -> Optional[subprocess.Popen]:
+def redis_url_port() -> int:
+    """Port of REDIS.URL, or the default Redis port."""
+    try:
+        # Parse the Redis URL to extract the port
+        parsed_url = urlparse(REDIS.URL)
+        return parsed_url.port or 6379
+    except Exception:
+        return 6379
+
+
+def redis_ping(port: int, timeout: float = 0.5) -> bool:
+    """
+    Check whether the local Redis server on port answers PING.
+
+    Args:
+        port: Redis port
+        timeout: Socket timeout in seconds
+
+    Returns:
+        bool: True if Redis replied
+    """
+    client = redis.Redis(
+        host="localhost",
+        port=port,
+        socket_timeout=timeout,
+        socket_connect_timeout=timeout,
+    )
+    try:
+        return bool(client.ping())
+    except redis.RedisError:
+        return False
+    finally:
+        client.close()
+
+
+def wait_for_redis(port: int, timeout: float = 10) -> bool:
+    """
+    Wait until the local Redis server on port answers PING.
+
+    Args:
+        port: Redis port
+        timeout: Seconds to wait
+
+    Returns:
+        bool: True if Redis became ready in time
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if redis_ping(port):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def start_redis(
+    port: int = None, daemonize: bool = True, wait_ready: bool = True
+) -> Optional[subprocess.Popen]:
     """
     Start a Redis server.
 
     Args:
         port: Redis port (defaults to port from REDIS.URL if None)
         daemonize: Run Redis as a daemon
+        wait_ready: Wait until Redis answers PING before returning (non-daemonized)
 
     Returns:
         Optional[subprocess.Popen]: Process object if not daemonized
     """
     # Extract port from REDIS.URL if not provided
     if port is None:
-        try:
-            # Parse the Redis URL to extract the port
-            parsed_url = urlparse(REDIS.URL)
-            port = parsed_url.port or 6379
-        except Exception:
-            port = 6379
+        port = redis_url_port()
 
     print(f"Starting Redis on port {port}...")
 
@@ -43,19 +96,29 @@ def start_redis(port: int = None, daemonize: bool = True) -> Optional[subprocess
         return None
     else:
         process = subprocess.Popen(cmd)
-        time.sleep(1)  # Give Redis time to start
+        if wait_ready and not wait_for_redis(port):
+            print(f"Redis did not answer PING on port {port}")
         return process
 
 
 def start_celery_worker(
-    concurrency: int = 4, loglevel: str = "INFO"
+    concurrency: int = 4,
+    loglevel: str = "INFO",
+    queues: Optional[List[str]] = None,
+    pool: Optional[str] = None,
+    autoscale_min: Optional[int] = None,
+    node_name: Optional[str] = None,
 ) -> subprocess.Popen:
     """
     Start a Celery worker.
 
     Args:
-        concurrency: Number of worker processes
+        concurrency: Number of worker processes (the maximum when autoscaling)
         loglevel: Log level
+        queues: Queues to consume from (defaults to all queues)
+        pool: Pool implementation, e.g. "prefork" or "threads"
+        autoscale_min: Autoscale the pool between this and concurrency processes
+        node_name: Worker node name, e.g. "cpu@%h"
 
     Returns:
         subprocess.Popen: Process object
@@ -67,14 +130,69 @@ def start_celery_worker(
         "-A",
         "saaga_mcp_base.lib.scheduler.core.celery_app",
         "worker",
-        "--concurrency",
-        str(concurrency),
         "--loglevel",
         loglevel,
     ]
+    if autoscale_min is not None:
+        cmd += ["--autoscale", f"{concurrency},{autoscale_min}"]
+    else:
+        cmd += ["--concurrency", str(concurrency)]
+    if queues:
+        cmd += ["--queues", ",".join(queues)]
+    if pool:
+        cmd += ["--pool", pool]
+    if node_name:
+        cmd += ["--hostname", node_name]
     return subprocess.Popen(cmd)
 
 
+def start_celery_cpu_worker(
+    concurrency: int = 4, autoscale: bool = CELERY.AUTOSCALE
+) -> subprocess.Popen:
+    """
+    Start the prefork worker for CPU-bound scheduled tools.
+
+    It also consumes the default "celery" queue for tasks without a queue.
+
+    Args:
+        concurrency: Number of worker processes (the maximum when autoscaling)
+        autoscale: Scale between CELERY.AUTOSCALE_MIN and concurrency processes
+
+    Returns:
+        subprocess.Popen: Process object
+    """
+    return start_celery_worker(
+        concurrency=concurrency,
+        queues=[CELERY.CPU_QUEUE, "celery"],
+        pool="prefork",
+        autoscale_min=min(CELERY.AUTOSCALE_MIN, concurrency) if autoscale else None,
+        node_name=f"{CELERY.CPU_QUEUE}@%h",
+    )
+
+
+def start_celery_io_worker(
+    concurrency: int = CELERY.IO_CONCURRENCY,
+) -> subprocess.Popen:
+    """
+    Start the worker for I/O-bound scheduled tools.
+
+    Uses the CELERY.IO_POOL pool ("threads" by default, or "gevent"), so many
+    tools wait on I/O concurrently in one process.
+
+    Args:
+        concurrency: Number of threads or greenlets
+
+    Returns:
+        subprocess.Popen: Process object
+    """
+    return start_celery_worker(
+        concurrency=concurrency,
+        queues=[CELERY.IO_QUEUE],
+        pool=CELERY.IO_POOL,
+        node_name=f"{CELERY.IO_QUEUE}@%h",
+    )
+
+
 def start_celery_beat() -> subprocess.Popen:
     """
     Start Celery beat for scheduled tasks.
@@ -149,7 +267,12 @@ def main(args=None):
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Start scheduler components")
     parser.add_argument("--redis", action="store_true", help="Start Redis")
-    parser.add_argument("--worker", action="store_true", help="Start Celery worker")
+    parser.add_argument(
+        "--worker", action="store_true", help="Start the CPU Celery worker"
+    )
+    parser.add_argument(
+        "--io-worker", action="store_true", help="Start the I/O Celery worker"
+    )
     parser.add_argument("--beat", action="store_true", help="Start Celery beat")
     parser.add_argument("--flower", action="store_true", help="Start Flower")
     parser.add_argument("--all", action="store_true", help="Start all components")
@@ -172,6 +295,11 @@ def main(args=None):
         "--flower-port", type=int, default=default_flower_port, help="Flower port"
     )
     parser.add_argument("--concurrency", type=int, default=4, help="Worker concurrency")
+    parser.add_argument(
+        "--no-autoscale",
+        action="store_true",
+        help="Run the CPU worker with a fixed concurrency",
+    )
 
     # For testing, we can pass in args directly
     parsed_args = parser.parse_args(args)
@@ -183,6 +311,7 @@ def main(args=None):
         start_all = parsed_args.all
         start_redis_server = start_all or parsed_args.redis
         start_worker = start_all or parsed_args.worker
+        start_io_worker = start_all or parsed_args.io_worker
         start_beat = start_all or parsed_args.beat
         start_flower_server = start_all or parsed_args.flower
 
@@ -193,9 +322,16 @@ def main(args=None):
                 processes.append(redis_process)
 
         if start_worker:
-            worker_process = start_celery_worker(concurrency=parsed_args.concurrency)
+            worker_process = start_celery_cpu_worker(
+                concurrency=parsed_args.concurrency,
+                autoscale=CELERY.AUTOSCALE and not parsed_args.no_autoscale,
+            )
             processes.append(worker_process)
 
+        if start_io_worker:
+            io_worker_process = start_celery_io_worker()
+            processes.append(io_worker_process)
+
         if start_beat:
             beat_process = start_celery_beat()
             processes.append(beat_process)
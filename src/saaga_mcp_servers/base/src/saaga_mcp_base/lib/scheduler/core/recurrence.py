@@ -0,0 +1,216 @@
+"""
+Recurring runs of scheduled tools, stored in Redis through RedBeat.
+
+Celery beat runs with `redbeat.RedBeatScheduler` (see celery_app.py), which
+keeps its entries in Redis and picks up added or removed entries on its next
+tick, so recurring schedules can be managed at runtime without restarting
+beat. Entries created here are named `tool:<tool name>:<id>` to tell them
+apart from the static entries of `beat_schedule`.
+"""
+
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from celery import Task
+from celery.schedules import crontab, schedule
+from redbeat import RedBeatSchedulerEntry
+from redbeat.schedulers import ensure_conf, get_redis
+
+from saaga_mcp_base.lib.scheduler.core.celery_app import app
+
+ENTRY_PREFIX = "tool:"
+
+_INTERVAL_UNITS = {
+    "s": 1,
+    "sec": 1,
+    "second": 1,
+    "m": 60,
+    "min": 60,
+    "minute": 60,
+    "h": 3600,
+    "hr": 3600,
+    "hour": 3600,
+    "d": 86400,
+    "day": 86400,
+}
+_INTERVAL_RE = re.compile(
+    r"^(?:every\s+)?(\d+(?:\.\d+)?)\s*([a-z]+?)s?$", re.IGNORECASE
+)
+
+
+def parse_recurrence(recurrence: str) -> Union[crontab, schedule]:
+    """
+    Parse a recurrence into a Celery schedule.
+
+    Args:
+        recurrence: A 5-field cron expression ("*/5 * * * *", evaluated in
+            CELERY.TIMEZONE) or an interval ("every 5 minutes", "30s", "2h")
+
+    Returns:
+        The crontab or interval schedule
+    """
+    value = recurrence.strip()
+    fields = value.split()
+    if len(fields) == 5:
+        minute, hour, day_of_month, month_of_year, day_of_week = fields
+        try:
+            return crontab(
+                minute=minute,
+                hour=hour,
+                day_of_month=day_of_month,
+                month_of_year=month_of_year,
+                day_of_week=day_of_week,
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression '{recurrence}': {e}")
+
+    match = _INTERVAL_RE.match(value)
+    unit = _INTERVAL_UNITS.get(match.group(2).lower()) if match else None
+    if unit is None or float(match.group(1)) <= 0:
+        raise ValueError(
+            "recurrence must be a cron expression ('*/5 * * * *') "
+            "or an interval ('every 5 minutes', '30s', '2h')"
+        )
+    return schedule(run_every=timedelta(seconds=float(match.group(1)) * unit))
+
+
+def _next_run(entry: RedBeatSchedulerEntry) -> Optional[str]:
+    """ISO time of the entry's next run, None when it is never due again.
+
+    Taken from the entry rather than its RedBeat score, which is truncated to
+    the second while crontab puts runs a few microseconds before one.
+    """
+    due_at = entry.due_at
+    if due_at is None:
+        return None
+    return datetime.fromtimestamp(round(due_at.timestamp()), timezone.utc).isoformat()
+
+
+def _describe(entry_schedule: Any) -> str:
+    if isinstance(entry_schedule, crontab):
+        return " ".join(
+            str(part)
+            for part in (
+                entry_schedule._orig_minute,
+                entry_schedule._orig_hour,
+                entry_schedule._orig_day_of_month,
+                entry_schedule._orig_month_of_year,
+                entry_schedule._orig_day_of_week,
+            )
+        )
+    if isinstance(entry_schedule, schedule):
+        return f"every {entry_schedule.run_every.total_seconds():g}s"
+    return str(entry_schedule)
+
+
+def add_recurring(
+    task: Task,
+    args: Sequence[Any],
+    kwargs: Dict[str, Any],
+    recurrence: str,
+) -> Dict[str, Any]:
+    """
+    Run a task on a recurring schedule.
+
+    The first run is the next one after now, e.g. in 5 minutes for
+    "every 5 minutes".
+
+    Args:
+        task: The Celery task to run
+        args: Positional arguments of every run
+        kwargs: Keyword arguments of every run
+        recurrence: Cron expression or interval (see `parse_recurrence`)
+
+    Returns:
+        Dictionary with the schedule id and the time of the next run
+    """
+    ensure_conf(app)
+    tool = task.name.rsplit(".", 1)[-1]
+    entry = RedBeatSchedulerEntry(
+        name=f"{ENTRY_PREFIX}{tool}:{uuid.uuid4().hex}",
+        task=task.name,
+        schedule=parse_recurrence(recurrence),
+        args=list(args),
+        kwargs=kwargs,
+        # Beat publishes by name, as it does not import the tool's module
+        options={"queue": task.queue} if task.queue else {},
+        app=app,
+    )
+    entry.last_run_at = datetime.now(timezone.utc)
+    entry.save()
+    return {
+        "schedule_id": entry.name,
+        "recurrence": recurrence,
+        "next_run": _next_run(entry),
+    }
+
+
+def remove_recurring(schedule_id: str) -> bool:
+    """
+    Stop a recurring schedule.
+
+    Args:
+        schedule_id: Id returned by `add_recurring`
+
+    Returns:
+        True if the schedule existed
+    """
+    if not schedule_id.startswith(ENTRY_PREFIX):
+        return False
+    ensure_conf(app)
+    key = RedBeatSchedulerEntry.generate_key(app, schedule_id)
+    with get_redis(app).pipeline() as pipe:
+        pipe.zrem(app.redbeat_conf.schedule_key, key)
+        pipe.delete(key)
+        removed, _ = pipe.execute()
+    return bool(removed)
+
+
+def list_recurring(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Recurring schedules ordered by their next run.
+
+    Args:
+        limit: Maximum number of schedules to return
+
+    Returns:
+        List of {"schedule_id", "task", "recurrence", "next_run", "kwargs"}
+        dictionaries
+    """
+    conf = ensure_conf(app)
+    client = get_redis(app)
+    entry_prefix = conf.key_prefix + ENTRY_PREFIX
+    keys = [
+        key
+        for key in client.zrange(conf.schedule_key, 0, -1)
+        if key.startswith(entry_prefix)
+    ][:limit]
+    if not keys:
+        return []
+
+    with client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.hmget(key, "definition", "meta")
+        stored = pipe.execute()
+
+    schedules = []
+    for definition, meta in stored:
+        if not definition:
+            continue
+        # As RedBeatSchedulerEntry.from_key, without a round trip per entry
+        definition = RedBeatSchedulerEntry.decode_definition(definition)
+        meta = RedBeatSchedulerEntry.decode_meta(meta)
+        entry = RedBeatSchedulerEntry(app=app, **definition, **meta)
+        entry.last_run_at = meta["last_run_at"]
+        schedules.append(
+            {
+                "schedule_id": entry.name,
+                "task": entry.task,
+                "recurrence": _describe(entry.schedule),
+                "next_run": _next_run(entry),
+                "kwargs": entry.kwargs,
+            }
+        )
+    return schedules
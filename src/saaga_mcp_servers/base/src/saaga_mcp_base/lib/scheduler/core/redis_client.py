@@ -1,13 +1,28 @@
 """
 Redis client utility for direct Redis operations.
+
+Clients share a connection pool sized from `RedisSettings`. The pool is created
+on first use, so importing this module does not open a socket.
 """
 
-import os
+import asyncio
+import threading
 import redis
-from typing import Any, Optional, Union
+import redis.asyncio
+from typing import Any, Dict, List, Mapping, Optional
 from saaga_mcp_base.config.env import REDIS
 
 
+def _pool_kwargs() -> Dict[str, Any]:
+    """Connection pool options from RedisSettings."""
+    return {
+        "max_connections": REDIS.MAX_CONNECTIONS,
+        "socket_timeout": REDIS.SOCKET_TIMEOUT,
+        "socket_connect_timeout": REDIS.SOCKET_CONNECT_TIMEOUT,
+        "health_check_interval": REDIS.HEALTH_CHECK_INTERVAL,
+    }
+
+
 class RedisClient:
     """
     Redis client for direct Redis operations.
@@ -21,7 +36,27 @@ class RedisClient:
             url: Redis URL. If None, uses REDIS.URL environment variable or default.
         """
         self.redis_url = url or REDIS.URL
-        self.client = redis.from_url(self.redis_url)
+        self._pool: Optional[redis.ConnectionPool] = None
+        self._client: Optional[redis.Redis] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> redis.ConnectionPool:
+        """The connection pool, created on first use."""
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = redis.ConnectionPool.from_url(
+                        self.redis_url, **_pool_kwargs()
+                    )
+        return self._pool
+
+    @property
+    def client(self) -> redis.Redis:
+        """The underlying redis client, created on first use."""
+        if self._client is None:
+            self._client = redis.Redis(connection_pool=self.pool)
+        return self._client
 
     def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
         """
@@ -73,6 +108,53 @@ class RedisClient:
         """
         return bool(self.client.exists(key))
 
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get several values in one round trip.
+
+        Args:
+            keys: Redis keys
+
+        Returns:
+            List[Optional[bytes]]: Values in the order of keys, None for missing keys
+        """
+        if not keys:
+            return []
+        return self.client.mget(keys)
+
+    def mset(self, mapping: Mapping[str, Any], ex: Optional[int] = None) -> bool:
+        """
+        Set several key-value pairs in one round trip.
+
+        Args:
+            mapping: Keys and values to store
+            ex: Expiration time in seconds, applied to every key
+
+        Returns:
+            bool: True if successful
+        """
+        if not mapping:
+            return True
+        if ex is None:
+            return self.client.mset(mapping)
+        # MSET has no expiry option; set each key with EX in one pipeline
+        with self.client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ex)
+            return all(pipe.execute())
+
+    def pipeline(self, transaction: bool = True) -> redis.client.Pipeline:
+        """
+        Create a pipeline that sends queued commands in one round trip.
+
+        Args:
+            transaction: Wrap the commands in MULTI/EXEC
+
+        Returns:
+            Pipeline: Use as a context manager and call execute()
+        """
+        return self.client.pipeline(transaction=transaction)
+
     def publish(self, channel: str, message: str) -> int:
         """
         Publish a message to a Redis channel.
@@ -97,6 +179,188 @@ class RedisClient:
         pubsub.subscribe(channel)
         return pubsub
 
+    def close(self) -> None:
+        """Disconnect every pooled connection."""
+        if self._pool is not None:
+            self._pool.disconnect()
+
+
+class AsyncRedisClient:
+    """
+    Async Redis client for use from async MCP tools.
+
+    Pooled connections are bound to the event loop they were created on, so
+    each running event loop gets a client and connection pool of its own. An
+    instance can be shared by the server loop and the loops of offloaded tools
+    or Celery workers.
+    """
+
+    def __init__(self, url: Optional[str] = None):
+        """
+        Initialize async Redis client.
+
+        Args:
+            url: Redis URL. If None, uses REDIS.URL environment variable or default.
+        """
+        self.redis_url = url or REDIS.URL
+        self._clients: Dict[asyncio.AbstractEventLoop, redis.asyncio.Redis] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self) -> redis.asyncio.Redis:
+        """A new client with a connection pool of its own."""
+        pool = redis.asyncio.ConnectionPool.from_url(self.redis_url, **_pool_kwargs())
+        return redis.asyncio.Redis(connection_pool=pool)
+
+    @property
+    def pool(self) -> redis.asyncio.ConnectionPool:
+        """The connection pool of the running event loop."""
+        return self.client.connection_pool
+
+    @property
+    def client(self) -> redis.asyncio.Redis:
+        """The client of the running event loop, created on first use.
+
+        Raises:
+            RuntimeError: If called without a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            with self._lock:
+                # Forget the clients of loops that were closed
+                for closed in [key for key in self._clients if key.is_closed()]:
+                    del self._clients[closed]
+                client = self._clients[loop] = self._connect()
+        return client
+
+    async def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        """
+        Set a key-value pair in Redis.
+
+        Args:
+            key: Redis key
+            value: Value to store
+            ex: Expiration time in seconds
+
+        Returns:
+            bool: True if successful
+        """
+        return await self.client.set(key, value, ex=ex)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a value from Redis.
+
+        Args:
+            key: Redis key
+
+        Returns:
+            Optional[bytes]: Value or None if key doesn't exist
+        """
+        return await self.client.get(key)
+
+    async def delete(self, key: str) -> int:
+        """
+        Delete a key from Redis.
+
+        Args:
+            key: Redis key
+
+        Returns:
+            int: Number of keys deleted
+        """
+        return await self.client.delete(key)
+
+    async def exists(self, key: str) -> bool:
+        """
+        Check if a key exists in Redis.
+
+        Args:
+            key: Redis key
+
+        Returns:
+            bool: True if key exists
+        """
+        return bool(await self.client.exists(key))
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        Get several values in one round trip.
+
+        Args:
+            keys: Redis keys
+
+        Returns:
+            List[Optional[bytes]]: Values in the order of keys, None for missing keys
+        """
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
+    async def mset(self, mapping: Mapping[str, Any], ex: Optional[int] = None) -> bool:
+        """
+        Set several key-value pairs in one round trip.
+
+        Args:
+            mapping: Keys and values to store
+            ex: Expiration time in seconds, applied to every key
+
+        Returns:
+            bool: True if successful
+        """
+        if not mapping:
+            return True
+        if ex is None:
+            return await self.client.mset(mapping)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ex)
+            return all(await pipe.execute())
+
+    def pipeline(self, transaction: bool = True) -> redis.asyncio.client.Pipeline:
+        """
+        Create a pipeline that sends queued commands in one round trip.
+
+        Args:
+            transaction: Wrap the commands in MULTI/EXEC
+
+        Returns:
+            Pipeline: Use as an async context manager and await execute()
+        """
+        return self.client.pipeline(transaction=transaction)
+
+    async def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message to a Redis channel.
+
+        Args:
+            channel: Channel name
+            message: Message to publish
+
+        Returns:
+            int: Number of clients that received the message
+        """
+        return await self.client.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> redis.asyncio.client.PubSub:
+        """
+        Subscribe to a Redis channel.
+
+        Args:
+            channel: Channel name
+        """
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(channel)
+        return pubsub
+
+    async def close(self) -> None:
+        """Disconnect the pooled connections of the running event loop."""
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.connection_pool.disconnect()
+
 
-# Singleton instance for easy import
+# Singleton instances for easy import. No connection is made until first use.
 redis_client = RedisClient()
+async_redis_client = AsyncRedisClient()
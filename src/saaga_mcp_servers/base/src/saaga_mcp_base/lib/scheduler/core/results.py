@@ -0,0 +1,150 @@
+"""
+Compact storage and bulk retrieval of scheduled tool results.
+
+Results are kept in the Redis result backend for CELERY.RESULT_EXPIRES seconds.
+To keep large email or report payloads out of Redis memory, `compact_result`
+(applied by the scheduled tool's Celery task) replaces a result by:
+
+- a zlib-compressed copy when its JSON is larger than
+  CELERY.RESULT_COMPRESS_THRESHOLD bytes
+- a reference to a gzip file in CELERY.RESULT_SPILL_DIR when it is larger than
+  CELERY.RESULT_SPILL_THRESHOLD bytes (the worker and the MCP server must
+  share the filesystem, as they do when started by the supervisor)
+
+`fetch_results` reads many results with one MGET and expands them again.
+Spilled files are deleted once their backend entry has expired; expanding a
+result whose file is gone raises `ResultExpiredError`.
+"""
+
+import base64
+import gzip
+import json
+import os
+import time
+import zlib
+from typing import Any, Dict, List
+
+from saaga_mcp_base.config.env import CELERY
+from saaga_mcp_base.lib.scheduler.core.celery_app import app
+
+# Key marking a compacted result
+MARKER = "__saaga_result__"
+
+# Spilled files are pruned at most this often, in seconds
+_PRUNE_INTERVAL = 3600
+_last_prune = 0.0
+
+
+class ResultExpiredError(LookupError):
+    """Raised when the file of a spilled result has been pruned or removed"""
+
+
+def _prune_spilled(directory: str) -> None:
+    """Delete spilled results whose backend entry has expired."""
+    global _last_prune
+    now = time.time()
+    if now - _last_prune < _PRUNE_INTERVAL:
+        return
+    _last_prune = now
+    cutoff = now - CELERY.RESULT_EXPIRES
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def compact_result(result: Any, task_id: str) -> Any:
+    """
+    Compress or spill a task result that is too large to keep in Redis as is.
+
+    Args:
+        result: The JSON serializable task result
+        task_id: Id of the task, used to name spilled files
+
+    Returns:
+        The result itself, or a marker dictionary that `expand_result` reverses
+    """
+    compress_threshold = CELERY.RESULT_COMPRESS_THRESHOLD
+    spill_threshold = CELERY.RESULT_SPILL_THRESHOLD
+    if not compress_threshold and not spill_threshold:
+        return result
+    try:
+        data = json.dumps(result).encode()
+    except (TypeError, ValueError):
+        # Left to the result serializer
+        return result
+
+    if spill_threshold and len(data) > spill_threshold:
+        directory = os.path.abspath(CELERY.RESULT_SPILL_DIR)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{task_id}.json.gz")
+        with gzip.open(path, "wb") as f:
+            f.write(data)
+        _prune_spilled(directory)
+        return {MARKER: "file", "path": path, "size": len(data)}
+
+    if compress_threshold and len(data) > compress_threshold:
+        compressed = base64.b64encode(zlib.compress(data)).decode()
+        return {MARKER: "zlib", "data": compressed, "size": len(data)}
+
+    return result
+
+
+def expand_result(result: Any) -> Any:
+    """Reverse `compact_result`."""
+    if not isinstance(result, dict) or MARKER not in result:
+        return result
+    kind = result[MARKER]
+    if kind == "zlib":
+        return json.loads(zlib.decompress(base64.b64decode(result["data"])))
+    if kind == "file":
+        try:
+            with gzip.open(result["path"], "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            raise ResultExpiredError(
+                f"The result ({result.get('size')} bytes) was stored in "
+                f"{result['path']}, which no longer exists. Spilled results are "
+                f"deleted {CELERY.RESULT_EXPIRES} seconds after they are stored."
+            ) from None
+    return result
+
+
+def fetch_results(task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the results of many tasks with a single MGET.
+
+    Args:
+        task_ids: Ids of the tasks
+
+    Returns:
+        Dictionary of task id to {"status", "result", "date_done"} (plus
+        "error" for failed tasks). Tasks without a stored result are PENDING.
+    """
+    backend = app.backend
+    keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+    values = backend.mget(keys) if keys else []
+
+    results = {}
+    for task_id, value in zip(task_ids, values):
+        if value is None:
+            results[task_id] = {"status": "PENDING", "result": None}
+            continue
+        meta = backend.decode_result(value)
+        entry = {"status": meta["status"], "date_done": meta.get("date_done")}
+        if meta["status"] == "SUCCESS":
+            try:
+                entry["result"] = expand_result(meta["result"])
+            except (ResultExpiredError, OSError, ValueError, zlib.error) as e:
+                entry["result"] = None
+                entry["error"] = str(e)
+        elif meta["status"] in ("FAILURE", "REVOKED"):
+            entry["result"] = None
+            entry["error"] = str(meta["result"])
+        else:
+            entry["result"] = meta.get("result")
+        results[task_id] = entry
+    return results
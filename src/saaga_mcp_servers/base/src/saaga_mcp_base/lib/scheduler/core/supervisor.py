@@ -0,0 +1,335 @@
+"""
+Asyncio supervisor for the scheduler services (Redis, Celery worker, Celery
+beat and Flower).
+
+Each service is started as a subprocess and is only reported as running once
+its readiness probe succeeds (Redis PING, Celery `inspect ping`, Flower HTTP).
+Services that only depend on Redis are started concurrently once Redis is
+ready. A monitor task per service notices crashes as they happen and restarts
+the service with exponential backoff.
+"""
+
+import asyncio
+import socket
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from saaga_mcp_base.config.env import CELERY, FLOWER, settings
+from saaga_mcp_base.lib.logging import logger
+from saaga_mcp_base.lib.scheduler.core.processes import (
+    redis_ping,
+    redis_url_port,
+    start_celery_beat,
+    start_celery_cpu_worker,
+    start_celery_io_worker,
+    start_flower,
+    start_redis,
+)
+
+# Seconds the backoff resets after, once a restarted service stays up
+_STABLE_AFTER = 60
+
+
+@dataclass
+class ServiceSpec:
+    """How to start a service and tell when it is ready."""
+
+    name: str
+    start: Callable[[], subprocess.Popen]
+    # Returns True once the service is ready. None means ready once started.
+    probe: Optional[Callable[[], Awaitable[bool]]] = None
+    depends_on: Tuple[str, ...] = ()
+    # Use an instance that already answers the probe instead of starting one
+    reuse_existing: bool = False
+
+
+@dataclass
+class ManagedService:
+    """Runtime state of a supervised service."""
+
+    spec: ServiceSpec
+    process: Optional[subprocess.Popen] = None
+    state: str = "stopped"
+    started_at: Optional[float] = None
+    restarts: int = 0
+    last_error: Optional[str] = None
+    monitor: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def status(self) -> Dict[str, Any]:
+        uptime = None
+        if self.running and self.started_at is not None:
+            uptime = round(time.monotonic() - self.started_at, 1)
+        return {
+            "state": self.state,
+            "pid": self.process.pid if self.running else None,
+            "uptime_seconds": uptime,
+            "restarts": self.restarts,
+            "last_error": self.last_error,
+        }
+
+
+async def _redis_probe(port: int) -> bool:
+    return await asyncio.to_thread(redis_ping, port)
+
+
+async def _worker_probe(queue: str) -> bool:
+    from saaga_mcp_base.lib.scheduler.core.celery_app import app
+
+    # Workers are named after their queue (see start_celery_cpu_worker)
+    destination = [f"{queue}@{socket.gethostname()}"]
+
+    def ping() -> bool:
+        replies = app.control.inspect(timeout=1, destination=destination).ping()
+        return bool(replies)
+
+    try:
+        return await asyncio.to_thread(ping)
+    except Exception:
+        return False
+
+
+async def _flower_probe(port: int) -> bool:
+    def get() -> bool:
+        url = f"http://localhost:{port}/healthcheck"
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return True
+        except urllib.error.HTTPError:
+            # Flower answered (e.g. 401 with basic auth), so it is serving
+            return True
+        except OSError:
+            return False
+
+    return await asyncio.to_thread(get)
+
+
+def default_services(
+    redis_port: Optional[int] = None,
+    worker_concurrency: int = 4,
+    flower_port: Optional[int] = None,
+) -> List[ServiceSpec]:
+    """Specs of the scheduler services."""
+    redis_port = redis_port or redis_url_port()
+    flower_port = flower_port or FLOWER.PORT
+    return [
+        ServiceSpec(
+            "redis",
+            lambda: start_redis(port=redis_port, daemonize=False, wait_ready=False),
+            lambda: _redis_probe(redis_port),
+            reuse_existing=True,
+        ),
+        ServiceSpec(
+            "celery_worker",
+            lambda: start_celery_cpu_worker(concurrency=worker_concurrency),
+            lambda: _worker_probe(CELERY.CPU_QUEUE),
+            depends_on=("redis",),
+        ),
+        ServiceSpec(
+            "celery_io_worker",
+            start_celery_io_worker,
+            lambda: _worker_probe(CELERY.IO_QUEUE),
+            depends_on=("redis",),
+        ),
+        ServiceSpec("celery_beat", start_celery_beat, depends_on=("redis",)),
+        ServiceSpec(
+            "flower",
+            lambda: start_flower(port=flower_port, daemonize=False),
+            lambda: _flower_probe(flower_port),
+            depends_on=("redis",),
+            reuse_existing=True,
+        ),
+    ]
+
+
+class Supervisor:
+    """Starts, health checks and restarts a set of services."""
+
+    def __init__(self):
+        self.services: Dict[str, ManagedService] = {}
+
+    def configure(self, specs: List[ServiceSpec]) -> None:
+        """Set the service specs. Running services keep their state."""
+        for spec in specs:
+            service = self.services.get(spec.name)
+            if service is None:
+                self.services[spec.name] = ManagedService(spec)
+            else:
+                service.spec = spec
+
+    async def _wait_ready(self, service: ManagedService) -> bool:
+        """Poll the service's probe until it succeeds, it exits, or time is up."""
+        deadline = time.monotonic() + settings.scheduler_startup_timeout
+        while time.monotonic() < deadline:
+            if not service.running:
+                service.last_error = (
+                    f"exited during startup (code {service.process.returncode})"
+                )
+                return False
+            if service.spec.probe is None or await service.spec.probe():
+                return True
+            await asyncio.sleep(settings.scheduler_probe_interval)
+        service.last_error = "readiness probe timed out"
+        return False
+
+    async def _launch(self, service: ManagedService) -> bool:
+        """Start the service's process and wait until it is ready."""
+        name = service.spec.name
+        service.state = "starting"
+        try:
+            service.process = await asyncio.to_thread(service.spec.start)
+        except Exception as e:
+            service.state = "failed"
+            service.last_error = str(e)
+            logger.error(f"Failed to start {name}: {e}")
+            return False
+        if service.process is None:
+            service.state = "failed"
+            service.last_error = "start returned no process"
+            return False
+
+        service.started_at = time.monotonic()
+        if not await self._wait_ready(service):
+            service.state = "failed"
+            logger.error(f"{name} did not become ready: {service.last_error}")
+            await asyncio.to_thread(self._terminate, service.process)
+            return False
+
+        service.state = "running"
+        service.last_error = None
+        logger.info(
+            f"{name} ready (PID: {service.process.pid}) after "
+            f"{time.monotonic() - service.started_at:.2f}s"
+        )
+        return True
+
+    async def _monitor(self, service: ManagedService) -> None:
+        """Restart the service with exponential backoff whenever it exits."""
+        name = service.spec.name
+        backoff = settings.scheduler_restart_backoff
+        attempts = 0
+        while True:
+            while service.running:
+                await asyncio.sleep(settings.scheduler_probe_interval)
+            if service.state == "running":
+                service.last_error = f"exited (code {service.process.returncode})"
+                logger.warning(f"{name} {service.last_error}, restarting")
+            if (
+                service.started_at is not None
+                and time.monotonic() - service.started_at > _STABLE_AFTER
+            ):
+                # It ran stably, so this is a new failure rather than a crash loop
+                backoff = settings.scheduler_restart_backoff
+                attempts = 0
+            max_restarts = settings.scheduler_max_restarts
+            if max_restarts and attempts >= max_restarts:
+                service.state = "failed"
+                logger.error(f"{name} failed {attempts} restarts in a row, giving up")
+                return
+            service.state = "restarting"
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, settings.scheduler_restart_max_backoff)
+            attempts += 1
+            service.restarts += 1
+            await self._launch(service)
+
+    async def _available(self, service: ManagedService) -> bool:
+        """Whether the service is running, here or (if reusable) elsewhere."""
+        if service.running:
+            return True
+        probe = service.spec.probe
+        return service.spec.reuse_existing and probe is not None and await probe()
+
+    async def _start_service(self, service: ManagedService) -> str:
+        if service.running:
+            return "already_running"
+        if await self._available(service):
+            service.state = "external"
+            return "already_running (not managed)"
+        ok = await self._launch(service)
+        if service.monitor is None or service.monitor.done():
+            service.monitor = asyncio.create_task(self._monitor(service))
+        if ok:
+            return f"started (PID: {service.process.pid})"
+        return f"failed: {service.last_error}"
+
+    async def start(self, names: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Start services, each as soon as the services it depends on are ready.
+
+        Args:
+            names: Services to start. Defaults to all configured services.
+
+        Returns:
+            Dictionary with the start result of each service
+        """
+        names = names or list(self.services)
+        results: Dict[str, str] = {}
+        ready: Dict[str, asyncio.Event] = {name: asyncio.Event() for name in names}
+
+        async def run(name: str) -> None:
+            service = self.services[name]
+            for dependency in service.spec.depends_on:
+                if dependency in ready:
+                    await ready[dependency].wait()
+                if not await self._available(self.services[dependency]):
+                    results[name] = f"skipped: {dependency} is not running"
+                    ready[name].set()
+                    return
+            results[name] = await self._start_service(service)
+            ready[name].set()
+
+        await asyncio.gather(*(run(name) for name in names))
+        return {name: results[name] for name in names}
+
+    @staticmethod
+    def _terminate(process: subprocess.Popen, timeout: float = 10) -> str:
+        if process.poll() is not None:
+            return f"already_stopped_or_not_running (code: {process.returncode})"
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+            return "stopped"
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            return "killed"
+
+    async def stop(self) -> Dict[str, str]:
+        """
+        Stop every supervised service concurrently, without restarting them.
+
+        Returns:
+            Dictionary with the stop result of each service
+        """
+
+        async def stop_one(service: ManagedService) -> str:
+            if service.monitor is not None:
+                service.monitor.cancel()
+                service.monitor = None
+            if service.process is None:
+                return "not_started"
+            result = await asyncio.to_thread(self._terminate, service.process)
+            service.state = "stopped"
+            service.started_at = None
+            logger.info(f"{service.spec.name} {result}")
+            return result
+
+        services = list(self.services.values())
+        results = await asyncio.gather(*(stop_one(s) for s in services))
+        return {s.spec.name: r for s, r in zip(services, results)}
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """State, PID, uptime and restart count of each service."""
+        return {name: service.status() for name, service in self.services.items()}
+
+
+# Supervisor used by the scheduler service tools
+supervisor = Supervisor()
@@ -0,0 +1,111 @@
+"""
+MCP tools for managing tasks created by scheduled tools.
+
+The scheduler core (Celery, RedBeat, Redis) is imported when a tool is first
+called rather than when the tools are registered.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+from saaga_mcp_base.lib.logging import logger
+
+
+async def revoke_scheduled_tasks(
+    task_ids: List[str], terminate: bool = False
+) -> Dict[str, Any]:
+    """
+    Cancel scheduled tasks in bulk.
+
+    Runs still waiting in the delayed-task store are removed from it, and all
+    ids are revoked with a single broadcast to the workers, so runs already
+    handed to a worker are discarded when they come due.
+
+    Args:
+        task_ids: Task ids returned when the tasks were scheduled.
+        terminate: Also terminate runs of these tasks that are already executing.
+
+    Returns:
+        A dictionary with the number of revoked task ids.
+    """
+    if not task_ids:
+        return {"status": "no_task_ids", "revoked": 0}
+
+    from saaga_mcp_base.lib.scheduler.core import delayed
+    from saaga_mcp_base.lib.scheduler.core.celery_app import app
+
+    removed = await asyncio.to_thread(delayed.cancel, task_ids)
+    await asyncio.to_thread(app.control.revoke, task_ids, terminate=terminate)
+    logger.info(f"Revoked {len(task_ids)} scheduled tasks (terminate={terminate})")
+    return {
+        "status": "revoked",
+        "revoked": len(task_ids),
+        "removed_from_store": removed,
+    }
+
+
+async def list_upcoming_runs(limit: int = 50) -> Dict[str, Any]:
+    """
+    List the next runs of scheduled tools, earliest first.
+
+    Args:
+        limit: Maximum number of runs of each kind to return.
+
+    Returns:
+        A dictionary with the recurring schedules (with their next run) and the
+        one-off runs waiting in the delayed-task store. One-off runs due within
+        the next few minutes are already queued on a worker and not listed.
+    """
+    from saaga_mcp_base.lib.scheduler.core import delayed, recurrence
+
+    recurring = await asyncio.to_thread(recurrence.list_recurring, limit)
+    one_off = await asyncio.to_thread(delayed.upcoming, limit)
+    return {"recurring": recurring, "one_off": one_off}
+
+
+async def cancel_recurring_schedule(schedule_id: str) -> Dict[str, Any]:
+    """
+    Stop a recurring schedule created with a scheduled tool's recurrence parameter.
+
+    Args:
+        schedule_id: Id returned when the schedule was created.
+
+    Returns:
+        A dictionary with the cancellation status.
+    """
+    from saaga_mcp_base.lib.scheduler.core import recurrence
+
+    removed = await asyncio.to_thread(recurrence.remove_recurring, schedule_id)
+    if not removed:
+        return {"status": "not_found", "schedule_id": schedule_id}
+    logger.info(f"Cancelled recurring schedule {schedule_id}")
+    return {"status": "cancelled", "schedule_id": schedule_id}
+
+
+async def get_scheduled_results(task_ids: List[str]) -> Dict[str, Any]:
+    """
+    Get the status and results of many scheduled tasks at once.
+
+    All results are read from the result backend in a single round trip, and
+    compressed or spilled results are expanded.
+
+    Args:
+        task_ids: Task ids returned when the tasks were scheduled.
+
+    Returns:
+        A dictionary with the status, result and completion time of each task.
+        Tasks that have not finished (or whose result has expired) are PENDING.
+    """
+    if not task_ids:
+        return {"status": "no_task_ids", "results": {}}
+
+    from saaga_mcp_base.lib.scheduler.core import results
+
+    fetched = await asyncio.to_thread(results.fetch_results, task_ids)
+    done = sum(1 for r in fetched.values() if r["status"] == "SUCCESS")
+    return {
+        "status": "ok",
+        "completed": done,
+        "pending": sum(1 for r in fetched.values() if r["status"] == "PENDING"),
+        "results": fetched,
+    }
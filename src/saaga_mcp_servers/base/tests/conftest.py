@@ -0,0 +1,36 @@
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from saaga_mcp_base.config.env import settings
+from saaga_mcp_base.lib import logging
+from saaga_mcp_base.lib.scheduler.core.redis_client import (
+    async_redis_client,
+    redis_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def log_database(monkeypatch, tmp_path):
+    """Log to a database of the test's own, closed after the test."""
+    path = str(tmp_path / "logs.sqlite3")
+    monkeypatch.setattr(settings, "sqldb_path", path)
+    monkeypatch.setattr(logging, "db_sink", None)
+    yield path
+    if logging.db_sink is not None:
+        logging.db_sink.close()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Point the shared Redis clients at one in-memory server."""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis_client, "_client", fakeredis.FakeRedis(server=server))
+    # A client for each event loop, like the real async client
+    monkeypatch.setattr(async_redis_client, "_clients", {})
+    monkeypatch.setattr(
+        async_redis_client,
+        "_connect",
+        lambda: fakeredis.aioredis.FakeRedis(server=server),
+    )
+    return server
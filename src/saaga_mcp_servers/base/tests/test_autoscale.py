@@ -0,0 +1,86 @@
+import pytest
+from celery.worker import state
+
+from saaga_mcp_base.lib.scheduler.core import autoscale
+from saaga_mcp_base.lib.scheduler.core.autoscale import QueueDepthAutoscaler
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakePool:
+    def __init__(self):
+        self.num_processes = 0
+
+    def grow(self, n):
+        self.num_processes += n
+
+    def maintain_pool(self):
+        pass
+
+
+def make_autoscaler(monkeypatch, depth):
+    clock = Clock()
+    monkeypatch.setattr(autoscale, "monotonic", clock)
+    monkeypatch.setattr(state, "all_total_count", [0])
+    monkeypatch.setattr(state, "active_requests", set())
+    monkeypatch.setattr(state, "reserved_requests", set())
+    monkeypatch.setattr(QueueDepthAutoscaler, "queue_depth", lambda self: depth)
+    return QueueDepthAutoscaler(pool=FakePool(), max_concurrency=50), clock
+
+
+def test_every_waiting_task_gets_a_process_until_a_rate_is_known(monkeypatch):
+    autoscaler, _ = make_autoscaler(monkeypatch, depth=40)
+
+    assert autoscaler.task_rate is None
+    assert autoscaler.qty == 40
+
+
+def test_fast_tasks_need_fewer_processes_than_waiting_tasks(monkeypatch):
+    monkeypatch.setattr(autoscale.CELERY, "AUTOSCALE_TARGET_LATENCY", 10.0)
+    autoscaler, clock = make_autoscaler(monkeypatch, depth=40)
+
+    # One process finished 20 tasks in a second
+    clock.now += 1
+    state.all_total_count[0] += 20
+    autoscaler.sample_rate()
+
+    assert autoscaler.task_rate == 20
+    assert autoscaler.qty == 1
+
+
+def test_slow_tasks_get_a_process_each(monkeypatch):
+    monkeypatch.setattr(autoscale.CELERY, "AUTOSCALE_TARGET_LATENCY", 10.0)
+    autoscaler, clock = make_autoscaler(monkeypatch, depth=40)
+    state.active_requests.update({"a", "b"})
+
+    # Two busy processes finished nothing in five seconds
+    for _ in range(5):
+        autoscaler.sample_rate()
+        clock.now += 1
+    autoscaler.sample_rate()
+
+    assert autoscaler.task_rate == 0
+    assert autoscaler.qty == 42
+
+
+def test_rate_is_sampled_on_the_periodic_tick_only(monkeypatch):
+    autoscaler, clock = make_autoscaler(monkeypatch, depth=40)
+
+    # Task messages arriving in a burst do not sample the rate
+    for _ in range(10):
+        clock.now += 0.01
+        state.all_total_count[0] += 1
+        autoscaler.maybe_scale(req=object())
+    assert autoscaler.task_rate is None
+    assert autoscaler.pool.num_processes == 40
+
+    # The tick measures over the whole interval since the last tick
+    clock.now += 0.9
+    autoscaler.maybe_scale()
+    assert autoscaler.task_rate == pytest.approx(10)
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+from mcp.server.fastmcp import Context
+
+from saaga_mcp_base.lib import cache
+
+
+@pytest.fixture(autouse=True)
+def local_cache_only(monkeypatch):
+    monkeypatch.setattr(cache, "_redis", lambda: None)
+    monkeypatch.setattr(cache, "_local", cache._LocalLRU(16))
+
+
+def test_key_ignores_context_and_is_namespaced():
+    calls = []
+
+    @cache.cached_tool
+    async def list_things(user_id: str, ctx: Context = None) -> str:
+        calls.append(user_id)
+        return user_id
+
+    cached = cache.cache(list_things, namespace="server_a")
+
+    async def run():
+        await cached("a", ctx=object())
+        await cached("a", ctx=object())
+
+    asyncio.run(run())
+
+    assert calls == ["a"]
+    assert all(
+        key.startswith("saaga:cache:server_a:list_things:")
+        for key in cache._local._entries
+    )
+
+
+def test_invalidates_drops_cache_in_same_namespace():
+    calls = []
+
+    @cache.cached_tool(key="{user_id}")
+    async def list_items(user_id: str) -> int:
+        calls.append(user_id)
+        return len(calls)
+
+    @cache.invalidates("list_items")
+    async def add_item(user_id: str) -> str:
+        return "ok"
+
+    cached = cache.cache(list_items, namespace="server_b")
+    writer = cache.cache(add_item, namespace="server_b")
+
+    async def run():
+        first = await cached("a")
+        await writer("a")
+        return first, await cached("a")
+
+    assert asyncio.run(run()) == (1, 2)
@@ -0,0 +1,140 @@
+import contextlib
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from saaga_mcp_base.config.env import CELERY
+from saaga_mcp_base.lib.scheduler.core import delayed
+from saaga_mcp_base.lib.scheduler.core.celery_app import app
+from saaga_mcp_base.lib.scheduler.core.redis_client import redis_client
+
+
+@app.task(name="tests.delayed.echo", queue="io")
+def echo(value):
+    return value
+
+
+class Clock:
+    def __init__(self):
+        self.now = datetime.now(timezone.utc).timestamp()
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(fake_redis, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(delayed, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Tasks published by dispatch_due_tasks, as send_task keyword arguments."""
+    sent = []
+
+    def send_task(name, **options):
+        options.pop("producer")
+        sent.append(dict(options, name=name))
+
+    monkeypatch.setattr(app, "producer_or_acquire", contextlib.nullcontext)
+    monkeypatch.setattr(app, "send_task", send_task)
+    return sent
+
+
+def in_hours(clock: Clock, hours: float) -> datetime:
+    return datetime.fromtimestamp(clock.now, timezone.utc) + timedelta(hours=hours)
+
+
+def stored_ids() -> list:
+    return [
+        task_id.decode()
+        for task_id in redis_client.client.zrange(CELERY.DELAYED_KEY, 0, -1)
+    ]
+
+
+def test_far_runs_wait_in_the_store_until_cancelled(clock):
+    later = delayed.schedule(echo, kwargs={"value": 2}, eta=in_hours(clock, 2))
+    sooner = delayed.schedule(echo, kwargs={"value": 1}, eta=in_hours(clock, 1))
+
+    runs = delayed.upcoming()
+    assert [run["task_id"] for run in runs] == [sooner, later]
+    assert runs[0]["task"] == "tests.delayed.echo"
+    assert runs[0]["kwargs"] == {"value": 1}
+    assert runs[0]["eta"] == in_hours(clock, 1).isoformat()
+
+    assert delayed.cancel([sooner, "unknown"]) == 1
+    assert [run["task_id"] for run in delayed.upcoming()] == [later]
+    assert redis_client.client.hkeys(delayed.TASKS_KEY) == [later.encode()]
+
+
+def test_due_runs_are_published_then_removed(clock, sent):
+    first = delayed.schedule(echo, kwargs={"value": 1}, eta=in_hours(clock, 1))
+    second = delayed.schedule(echo, kwargs={"value": 2}, eta=in_hours(clock, 2))
+
+    assert delayed.dispatch_due_tasks() == 0
+
+    clock.now += 3600
+    assert delayed.dispatch_due_tasks() == 1
+    assert sent == [
+        {
+            "name": "tests.delayed.echo",
+            "args": (),
+            "kwargs": {"value": 1},
+            "task_id": first,
+            "queue": "io",
+            "eta": in_hours(clock, 0),
+        }
+    ]
+    assert stored_ids() == [second]
+    assert not redis_client.client.zcard(delayed.INFLIGHT_KEY)
+    assert not redis_client.client.hexists(delayed.TASKS_KEY, first)
+
+
+def test_runs_that_fail_to_publish_stay_scheduled(clock, sent, monkeypatch):
+    task_ids = delayed.schedule_many(
+        echo, [((), {"value": i}, in_hours(clock, 1 + i / 60)) for i in range(3)]
+    )
+    publish = app.send_task
+
+    def fail_on_second(name, **options):
+        if len(sent) == 1:
+            raise ConnectionError("broker went away")
+        publish(name, **options)
+
+    monkeypatch.setattr(app, "send_task", fail_on_second)
+    clock.now += 2 * 3600
+
+    with pytest.raises(ConnectionError):
+        delayed.dispatch_due_tasks()
+
+    assert [options["task_id"] for options in sent] == task_ids[:1]
+    assert stored_ids() == task_ids[1:]
+    assert not redis_client.client.zcard(delayed.INFLIGHT_KEY)
+    # At their original time
+    assert redis_client.client.zscore(CELERY.DELAYED_KEY, task_ids[1]) == (
+        pytest.approx(in_hours(clock, -1 + 1 / 60).timestamp())
+    )
+
+
+def test_abandoned_claims_are_published_after_the_timeout(clock, sent):
+    task_id = delayed.schedule(echo, kwargs={"value": 1}, eta=in_hours(clock, 1))
+    clock.now += 3600
+    # A dispatcher claims the run and dies before publishing it
+    assert [run[0] for run in delayed.claim_due(clock.now, 10)] == [task_id]
+
+    assert delayed.dispatch_due_tasks() == 0
+    clock.now += CELERY.DELAYED_CLAIM_TIMEOUT + 1
+    assert delayed.dispatch_due_tasks() == 1
+
+    assert [options["task_id"] for options in sent] == [task_id]
+    assert not redis_client.client.zcard(delayed.INFLIGHT_KEY)
+
+
+def test_dispatcher_runs_on_the_io_queue():
+    entry = app.conf.beat_schedule["dispatch-delayed-tasks"]
+
+    assert delayed.dispatch_due_tasks.queue == CELERY.IO_QUEUE
+    assert entry["options"]["queue"] == CELERY.IO_QUEUE
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from saaga_mcp_base.lib.scheduler.core import event_loop
+
+
+@pytest.fixture
+def worker_loop():
+    """The worker loop as started by the worker_process_init signal."""
+    event_loop._on_worker_process_init()
+    loop = event_loop._loop
+    yield loop
+    event_loop.stop_worker_loop()
+
+
+def test_coroutines_share_the_worker_loop(worker_loop):
+    state = {}
+
+    async def remember_loop():
+        state["loop"] = asyncio.get_running_loop()
+        # Loop state such as a lock survives until the next task
+        state["lock"] = asyncio.Lock()
+        return 1
+
+    async def reuse_loop():
+        async with state["lock"]:
+            return asyncio.get_running_loop()
+
+    assert event_loop.run_coroutine(remember_loop(), timeout=5) == 1
+    assert event_loop.run_coroutine(reuse_loop(), timeout=5) is worker_loop
+    assert state["loop"] is worker_loop
+    assert event_loop.start_worker_loop() is worker_loop
+
+
+def test_timed_out_coroutine_is_cancelled(worker_loop):
+    cancelled = asyncio.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def was_cancelled():
+        await asyncio.wait_for(cancelled.wait(), timeout=5)
+        return True
+
+    with pytest.raises(TimeoutError):
+        event_loop.run_coroutine(hang(), timeout=0.1)
+    assert event_loop.run_coroutine(was_cancelled(), timeout=5)
+
+
+def test_shutdown_cancels_pending_tasks_and_closes_the_loop(worker_loop):
+    thread = event_loop._thread
+    cancelled = []
+
+    async def background():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def start_background():
+        # Left running after the Celery task that started it returned
+        return asyncio.get_running_loop().create_task(background())
+
+    task = event_loop.run_coroutine(start_background(), timeout=5)
+    event_loop._on_worker_process_shutdown()
+
+    assert cancelled == [True]
+    assert task.cancelled()
+    assert not thread.is_alive()
+    assert worker_loop.is_closed()
+    assert event_loop._loop is None
+
+    # A new loop is started on next use
+    async def running_loop():
+        return asyncio.get_running_loop()
+
+    assert event_loop.run_coroutine(running_loop(), timeout=5) is not worker_loop
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+
+from saaga_mcp_base.config.env import settings
+from saaga_mcp_base.lib import exceptions
+from saaga_mcp_base.lib.exceptions import exception_handler
+from saaga_mcp_base.lib.logging import logger, read_errors
+
+
+@pytest.fixture(autouse=True)
+def logged_errors(monkeypatch):
+    """Error records logged during the test."""
+    monkeypatch.setattr(exceptions, "_last_logged", {})
+    records = []
+    handler = logger.add(
+        lambda message: records.append(message.record["message"]), level="ERROR"
+    )
+    yield records
+    logger.remove(handler)
+
+
+@exception_handler
+async def lookup(key: str) -> str:
+    return {"known": "value"}[key]
+
+
+@exception_handler
+async def divide(a: int, b: int) -> float:
+    return a / b
+
+
+def call(*calls):
+    async def run():
+        return [await tool(*args) for tool, *args in calls]
+
+    return asyncio.run(run())
+
+
+def test_errors_from_the_same_site_share_a_group():
+    results = call((lookup, "a"), (lookup, "b"), (divide, 1, 0), (lookup, "c"))
+
+    assert results[0]["Fingerprint"] == results[1]["Fingerprint"]
+    assert results[2]["Fingerprint"] != results[0]["Fingerprint"]
+
+    groups = asyncio.run(read_errors())
+    assert [(group["tool"], group["count"]) for group in groups] == [
+        ("lookup", 3),
+        ("divide", 1),
+    ]
+    lookup_group = groups[0]
+    assert lookup_group["fingerprint"] == results[0]["Fingerprint"]
+    assert lookup_group["exception_type"] == "KeyError"
+    # The latest message is kept
+    assert lookup_group["message"] == "'c'"
+    assert lookup_group["first_seen"] <= lookup_group["last_seen"]
+
+
+def test_read_errors_filters_by_tool_and_limits():
+    call((divide, 1, 0), (lookup, "a"))
+
+    assert [group["tool"] for group in asyncio.run(read_errors(limit=1))] == ["lookup"]
+    assert [group["tool"] for group in asyncio.run(read_errors(tool="divide"))] == [
+        "divide"
+    ]
+
+
+def test_repeated_errors_are_logged_once_per_interval(logged_errors, monkeypatch):
+    monkeypatch.setattr(settings, "error_log_interval", 0.2)
+
+    call((lookup, "a"), (lookup, "b"), (divide, 1, 0))
+    assert len(logged_errors) == 2
+
+    time.sleep(0.2)
+    call((lookup, "c"))
+    assert len(logged_errors) == 3
+    assert all(record.startswith("Error ") for record in logged_errors)
+
+    # Throttled occurrences are still counted
+    counts = {group["tool"]: group["count"] for group in asyncio.run(read_errors())}
+    assert counts == {"lookup": 3, "divide": 1}
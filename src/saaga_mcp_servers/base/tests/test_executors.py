@@ -0,0 +1,114 @@
+import asyncio
+import contextvars
+import os
+import threading
+
+import pytest
+
+from saaga_mcp_base.lib.executors import (
+    blocking,
+    cpu_timer,
+    get_executor,
+    is_blocking,
+    offload,
+    reset_cpu_timer,
+    run_on_caller_loop,
+    shutdown_executors,
+)
+
+request_id: contextvars.ContextVar = contextvars.ContextVar("request_id")
+
+
+@pytest.fixture(autouse=True)
+def executors():
+    yield
+    shutdown_executors()
+
+
+def thread_and_request() -> tuple:
+    return threading.current_thread().name, request_id.get(None)
+
+
+@blocking(pool="single", max_workers=1)
+def in_single_pool() -> str:
+    return threading.current_thread().name
+
+
+@blocking(pool="cpu", cpu_bound=True)
+def in_process(n: int) -> tuple:
+    return os.getpid(), sum(i * i for i in range(n))
+
+
+async def current_loop():
+    return asyncio.get_running_loop()
+
+
+@blocking(pool="loops", max_workers=1)
+async def worker_and_caller_loops():
+    return asyncio.get_running_loop(), await run_on_caller_loop(current_loop())
+
+
+def test_only_sync_and_marked_tools_are_blocking():
+    async def plain():
+        pass
+
+    assert is_blocking(thread_and_request)
+    assert is_blocking(worker_and_caller_loops)
+    assert not is_blocking(plain)
+
+
+def test_offloaded_calls_see_the_callers_context():
+    async def run():
+        request_id.set("abc")
+        return await offload(thread_and_request)()
+
+    thread, seen = asyncio.run(run())
+
+    assert thread.startswith("saaga-tool-default")
+    assert seen == "abc"
+
+
+def test_tools_run_in_their_pool():
+    async def run():
+        return await asyncio.gather(*(offload(in_single_pool)() for _ in range(3)))
+
+    names = asyncio.run(run())
+
+    assert {name.split("_")[0] for name in names} == {"saaga-tool-single"}
+    assert len(set(names)) == 1
+    assert get_executor("single")._max_workers == 1
+
+
+def test_cpu_bound_tools_run_in_a_process():
+    async def run():
+        timer, token = cpu_timer()
+        try:
+            return await offload(in_process)(200_000), timer
+        finally:
+            reset_cpu_timer(token)
+
+    (pid, total), timer = asyncio.run(run())
+
+    assert pid != os.getpid()
+    assert total == sum(i * i for i in range(200_000))
+    assert timer.measured
+
+
+def test_blocking_async_tools_keep_their_worker_loop():
+    async def run():
+        first = await offload(worker_and_caller_loops)()
+        second = await offload(worker_and_caller_loops)()
+        return asyncio.get_running_loop(), first, second
+
+    caller, (first_worker, first_caller), (second_worker, _) = asyncio.run(run())
+
+    assert first_worker is not caller
+    assert second_worker is first_worker
+    assert first_caller is caller
+
+
+def test_run_on_caller_loop_needs_an_offloaded_tool():
+    coroutine = current_loop()
+    with pytest.raises(RuntimeError):
+        asyncio.run(run_on_caller_loop(coroutine))
+    coroutine.close()
@@ -0,0 +1,392 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from saaga_mcp_base.config.env import settings
+from saaga_mcp_base.lib import logging
+from saaga_mcp_base.lib.exceptions import exception_handler
+from saaga_mcp_base.lib.executors import offload
+from saaga_mcp_base.lib.logging import (
+    _INSERT_LOG_SQL,
+    logger,
+    RESULT_SIZE_MAX_ITEMS,
+    BatchedDbSink,
+    ToolCall,
+    _result_size,
+    _update_tool_blocks,
+    get_connection,
+    get_contiguous_tool_blocks,
+    get_db_sink,
+    install_db_logging,
+    prune_logs,
+    read_logs,
+    stream_contiguous_tool_blocks,
+    tool_logger,
+    tool_stats,
+)
+
+
+def tool_call(index: int) -> ToolCall:
+    return ToolCall(
+        tool=f"tool_{index}",
+        timestamp="2026-01-01T00:00:00+00:00",
+        wall_time_ms=1.0,
+        cpu_time_ms=1.0,
+        exception_type=None,
+        result_size=None,
+    )
+
+
+class SlowSink(BatchedDbSink):
+    """Writer that falls behind, so the queue is never empty"""
+
+    def _write(self, batch):
+        time.sleep(0.01)
+        super()._write(batch)
+
+
+def count_tool_calls(db_path: str) -> int:
+    with closing(sqlite3.connect(db_path)) as conn:
+        return conn.execute("SELECT count(*) FROM tool_calls").fetchone()[0]
+
+
+def test_flush_returns_under_sustained_logging(tmp_path):
+    db_path = str(tmp_path / "logs.sqlite3")
+    get_connection(db_path)
+    sink = SlowSink(db_path, batch_size=50, flush_interval=0.05, max_queue_size=100)
+    for index in range(10):
+        sink.record_tool_call(tool_call(index))
+
+    stop = threading.Event()
+
+    def keep_logging():
+        index = 10
+        while not stop.is_set():
+            sink.record_tool_call(tool_call(index))
+            index += 1
+
+    producer = threading.Thread(target=keep_logging)
+    producer.start()
+    try:
+        started = time.monotonic()
+        assert sink.flush(timeout=10)
+        assert time.monotonic() - started < 5
+        # Everything enqueued before the flush has been written
+        assert count_tool_calls(db_path) >= 10
+    finally:
+        stop.set()
+        producer.join()
+        sink.close()
+
+
+def test_result_size_estimates_without_serializing():
+    result = {"Status": "Success", "items": [{"id": 1, "ok": True}, "text"]}
+
+    assert _result_size("abc") == 3
+    assert _result_size(result) == len(json.dumps(result, separators=(",", ":")))
+    assert _result_size(list(range(RESULT_SIZE_MAX_ITEMS))) is None
+    assert _result_size({"value": object()}) is None
+
+
+def spin(seconds: float) -> dict:
+    deadline = time.thread_time() + seconds
+    while time.thread_time() < deadline:
+        pass
+    return {"done": True}
+
+
+async def nap() -> str:
+    await asyncio.sleep(0.01)
+    return "rested"
+
+
+async def fail() -> str:
+    raise KeyError("missing")
+
+
+def read_tool_calls(db_path: str) -> dict:
+    get_db_sink().flush()
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.row_factory = sqlite3.Row
+        return {
+            row["tool"]: dict(row) for row in conn.execute("SELECT * FROM tool_calls")
+        }
+
+
+def test_tool_calls_rows(log_database):
+    async def run():
+        await tool_logger(offload(spin))(0.05)
+        await tool_logger(nap)()
+        await tool_logger(exception_handler(fail))()
+
+    asyncio.run(run())
+    rows = read_tool_calls(log_database)
+
+    # CPU time is measured in the worker thread of offloaded tools
+    assert rows["spin"]["cpu_time_ms"] >= 45
+    assert rows["spin"]["wall_time_ms"] >= rows["spin"]["cpu_time_ms"] * 0.9
+    assert rows["spin"]["result_size"] == len('{"done":true}')
+    assert rows["spin"]["exception_type"] is None
+    # and not at all for tools running on the event loop
+    assert rows["nap"]["cpu_time_ms"] is None
+    assert rows["nap"]["wall_time_ms"] >= 10
+    assert rows["nap"]["result_size"] == len("rested")
+    assert rows["fail"]["exception_type"] == "KeyError"
+    assert rows["fail"]["result_size"] is None
+
+
+def test_tool_stats_percentiles():
+    sink = get_db_sink()
+    for index in range(1, 101):
+        sink.record_tool_call(
+            ToolCall(
+                tool="ranked",
+                timestamp=time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()),
+                wall_time_ms=float(index),
+                cpu_time_ms=2.0 if index % 2 else None,
+                exception_type="ValueError" if index > 98 else None,
+                result_size=10,
+            )
+        )
+
+    (stats,) = asyncio.run(tool_stats(window_minutes=5))
+
+    assert stats["calls"] == 100
+    assert stats["errors"] == 2
+    assert stats["exception_types"] == {"ValueError": 2}
+    assert (stats["p50_ms"], stats["p95_ms"], stats["p99_ms"]) == (50, 95, 99)
+    assert stats["max_ms"] == 100
+    assert stats["mean_cpu_ms"] == 2.0
+    assert stats["mean_result_size"] == 10
+
+
+def ago(**delta) -> str:
+    return (datetime.now(timezone.utc) - timedelta(**delta)).isoformat()
+
+
+def write_logs(db_path: str, tools, timestamp: str = None):
+    """Insert one log row per tool the way the log writer does."""
+    timestamp = timestamp or ago()
+    rows = [
+        (tool, None, False, timestamp, "INFO", f"{tool} {index}", "f", "f.py", 1)
+        for index, tool in enumerate(tools)
+    ]
+    conn = get_connection(db_path)
+    with conn:
+        cursor = conn.cursor()
+        cursor.executemany(_INSERT_LOG_SQL, rows)
+        cursor.execute("SELECT last_insert_rowid()")
+        _update_tool_blocks(cursor, rows, cursor.fetchone()[0] - len(rows) + 1)
+
+
+def test_connections_are_kept_per_database(tmp_path):
+    first = get_connection(str(tmp_path / "first.sqlite3"))
+    second = get_connection(str(tmp_path / "nested" / "second.sqlite3"))
+
+    assert second is not first
+    assert get_connection(str(tmp_path / "first.sqlite3")) is first
+    assert (tmp_path / "nested" / "second.sqlite3").exists()
+
+
+def tool_blocks(limit: int):
+    async def collect():
+        streamed = [block async for block in stream_contiguous_tool_blocks(limit=limit)]
+        assert streamed == await get_contiguous_tool_blocks(limit=limit)
+        return [
+            (block["tool"], [entry["id"] for entry in block["logs"]])
+            for block in streamed
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_tool_blocks_are_newest_first(log_database):
+    write_logs(log_database, ["a", "a", None, "b", "b", "b"])
+    write_logs(log_database, ["b", "a"])
+
+    # Entries without a tool belong to no block
+    assert tool_blocks(limit=100) == [("a", [8]), ("b", [4, 5, 6, 7]), ("a", [1, 2])]
+    # The oldest block is cut to the newest entries that fit within the limit
+    assert tool_blocks(limit=6) == [("a", [8]), ("b", [4, 5, 6, 7]), ("a", [2])]
+    assert tool_blocks(limit=5) == [("a", [8]), ("b", [4, 5, 6, 7])]
+
+
+def test_tool_blocks_of_an_empty_range(log_database):
+    assert tool_blocks(limit=100) == []
+
+    write_logs(log_database, [None, "a"])
+
+    assert tool_blocks(limit=0) == []
+    assert tool_blocks(limit=1) == [("a", [2])]
+
+
+def select(db_path: str, query: str) -> list:
+    with closing(sqlite3.connect(db_path)) as conn:
+        return conn.execute(query).fetchall()
+
+
+def test_prune_keeps_the_newest_rows(log_database):
+    write_logs(log_database, ["a"] * 4 + ["b"] * 6)
+    for index in range(5):
+        get_connection(log_database).execute(
+            "INSERT INTO tool_calls (tool, timestamp) VALUES (?, ?)",
+            (f"tool_{index}", ago()),
+        )
+    get_connection(log_database).commit()
+
+    assert prune_logs(log_database, max_rows=3, max_age_days=0) == 7
+
+    assert select(log_database, "SELECT id FROM logs") == [(8,), (9,), (10,)]
+    assert select(log_database, "SELECT tool FROM tool_calls") == [
+        ("tool_2",),
+        ("tool_3",),
+        ("tool_4",),
+    ]
+    # The block of "a" is gone and the one of "b" starts at the cut-off
+    assert select(
+        log_database, "SELECT tool, start_id, end_id, count FROM tool_blocks"
+    ) == [("b", 8, 10, 3)]
+
+
+@pytest.fixture
+def local_time_ahead_of_utc():
+    saved = os.environ.get("TZ")
+    os.environ["TZ"] = "Asia/Tokyo"
+    time.tzset()
+    yield
+    if saved is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = saved
+    time.tzset()
+
+
+def test_prune_drops_rows_older_than_max_age(log_database, local_time_ahead_of_utc):
+    # A cut-off in local time would also take the 23 hour old rows
+    write_logs(log_database, ["a"] * 3, timestamp=ago(days=3))
+    write_logs(log_database, ["a"] * 2, timestamp=ago(hours=23))
+    conn = get_connection(log_database)
+    with conn:
+        conn.executemany(
+            "INSERT INTO tool_calls (tool, timestamp) VALUES (?, ?)",
+            [("old", ago(days=3)), ("new", ago(hours=1))],
+        )
+        conn.executemany(
+            "INSERT INTO error_groups (fingerprint, last_seen) VALUES (?, ?)",
+            [("old", ago(days=3)), ("new", ago(hours=1))],
+        )
+
+    assert prune_logs(log_database, max_rows=0, max_age_days=1) == 3
+
+    assert select(log_database, "SELECT id FROM logs") == [(4,), (5,)]
+    assert select(log_database, "SELECT tool FROM tool_calls") == [("new",)]
+    assert select(log_database, "SELECT fingerprint FROM error_groups") == [("new",)]
+    assert select(log_database, "SELECT start_id, count FROM tool_blocks") == [(4, 2)]
+
+
+def test_prune_deletes_in_chunks(log_database):
+    write_logs(log_database, ["a"] * 10)
+    statements = []
+    get_connection(log_database).set_trace_callback(statements.append)
+    try:
+        deleted = prune_logs(log_database, max_rows=2, max_age_days=0, chunk_size=3)
+    finally:
+        get_connection(log_database).set_trace_callback(None)
+
+    assert deleted == 8
+    # Chunks of 3, 3 and 2 rows, the short one ending the run
+    chunks = [s for s in statements if s.startswith("DELETE FROM logs")]
+    assert len(chunks) == 3
+    assert select(log_database, "SELECT id FROM logs") == [(9,), (10,)]
+
+
+def test_writer_thread_prunes_on_schedule(log_database, monkeypatch):
+    runs = []
+    monkeypatch.setattr(
+        logging,
+        "prune_logs",
+        lambda db_path: runs.append((db_path, threading.current_thread().name)),
+    )
+    monkeypatch.setattr(settings, "log_retention_interval", 0.5)
+    sink = BatchedDbSink(log_database, flush_interval=0.01)
+
+    def write_batch():
+        sink.record_tool_call(tool_call(0))
+        sink.flush()
+        # The next flush is handled after the retention check of this batch
+        sink.flush()
+
+    try:
+        write_batch()
+        assert runs == [(log_database, "saaga-log-writer")]
+        write_batch()
+        assert len(runs) == 1
+        time.sleep(0.5)
+        write_batch()
+        assert len(runs) == 2
+    finally:
+        sink.close()
+
+
+def connect_in_new_thread(db_path: str):
+    thread = threading.Thread(target=get_connection, args=(db_path,))
+    thread.start()
+    thread.join()
+
+
+def test_tool_blocks_are_backfilled_once_per_database(log_database):
+    # A database written before tool_blocks existed
+    write_logs(log_database, ["a", "a", "b"])
+    with closing(sqlite3.connect(log_database)) as conn, conn:
+        conn.execute("DROP TABLE tool_blocks")
+        conn.execute("DROP TABLE meta")
+
+    connect_in_new_thread(log_database)
+    assert select(log_database, "SELECT tool, start_id, end_id FROM tool_blocks") == [
+        ("a", 1, 2),
+        ("b", 3, 3),
+    ]
+
+    # Later connections trust the flag instead of looking at the tables again
+    with closing(sqlite3.connect(log_database)) as conn, conn:
+        conn.execute("DELETE FROM tool_blocks")
+    connect_in_new_thread(log_database)
+    assert select(log_database, "SELECT count(*) FROM tool_blocks") == [(0,)]
+
+
+@tool_logger
+async def first():
+    logger.info("first")
+
+
+@tool_logger
+async def second():
+    logger.info("second")
+
+
+def test_read_logs_tags_entries_with_their_tool_block():
+    install_db_logging()
+
+    async def run():
+        await first()
+        await first()
+        logger.info("between tool calls")
+        await second()
+        await first()
+        return await read_logs(n=10)
+
+    entries = asyncio.run(run())
+
+    assert [(entry["tool"], entry["block_id"]) for entry in entries] == [
+        ("first", 3),
+        ("second", 2),
+        ("first", 1),
+        ("first", 1),
+    ]
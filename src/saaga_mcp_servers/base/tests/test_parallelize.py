@@ -0,0 +1,124 @@
+import asyncio
+
+from saaga_mcp_base.lib import parallelize as parallelize_module
+from saaga_mcp_base.lib.exceptions import exception_handler
+from saaga_mcp_base.lib.parallelize import parallelize
+
+
+async def echo(value: int, delay: float = 0) -> int:
+    await asyncio.sleep(delay)
+    return value
+
+
+def test_results_keep_input_order_under_concurrency():
+    # Later items finish first
+    kwargs_list = [{"value": i, "delay": 0.05 - i * 0.01} for i in range(5)]
+
+    async def run():
+        streamed = [item async for item in parallelize(echo).stream(kwargs_list)]
+        return streamed, await parallelize(echo)(kwargs_list)
+
+    streamed, results = asyncio.run(run())
+
+    expected = [{"Status": "Success", "Result": i} for i in range(5)]
+    assert results == expected
+    assert streamed == expected
+
+
+def test_max_concurrency_bounds_calls_in_flight():
+    in_flight = 0
+    peak = 0
+
+    async def tracked(value: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return value
+
+    results = asyncio.run(
+        parallelize(max_concurrency=3)(tracked)([{"value": i} for i in range(10)])
+    )
+
+    assert peak == 3
+    assert [item["Result"] for item in results] == list(range(10))
+
+
+def test_timeouts_and_exceptions_become_status_objects():
+    async def flaky(value: int) -> int:
+        if value == 1:
+            raise ValueError("bad value")
+        if value == 2:
+            await asyncio.sleep(1)
+        return value
+
+    @exception_handler
+    async def handled(value: int) -> int:
+        raise KeyError(value)
+
+    results = asyncio.run(
+        parallelize(timeout=0.05)(flaky)([{"value": i} for i in range(4)])
+    )
+    (handled_result,) = asyncio.run(parallelize(handled)([{"value": 7}]))
+
+    assert results == [
+        {"Status": "Success", "Result": 0},
+        {"Status": "Exception", "Message": "bad value", "ExceptionType": "ValueError"},
+        {"Status": "Timeout", "Message": "Call exceeded 0.05 seconds"},
+        {"Status": "Success", "Result": 3},
+    ]
+    # exception_handler's status object is passed through as is
+    assert handled_result["Status"] == "Exception"
+    assert handled_result["ExceptionType"] == "KeyError"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limit_spaces_out_calls(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(parallelize_module, "monotonic", clock)
+    started = []
+    sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        # Time passes only while the limiter waits
+        clock.now += delay
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    async def record(value: int) -> int:
+        started.append(clock.now)
+        return value
+
+    limited = parallelize(max_concurrency=1, rate_limit=4)(record)
+    asyncio.run(limited([{"value": i} for i in range(5)]))
+    # Calls that come in after a pause do not wait
+    clock.now += 10
+    asyncio.run(limited([{"value": 5}]))
+
+    assert started == [100.0, 100.25, 100.5, 100.75, 101.0, 111.0]
+
+
+def test_rate_limit_applies_across_concurrent_calls(monkeypatch):
+    monkeypatch.setattr(parallelize_module, "monotonic", Clock())
+    waits = []
+    sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        waits.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    asyncio.run(parallelize(rate_limit=2)(echo)([{"value": i} for i in range(5)]))
+
+    # All five calls start at once, so each waits half a second longer
+    assert [w for w in waits if w] == [0.5, 1.0, 1.5, 2.0]
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+
+import pytest
+from mcp.shared.memory import (
+    create_connected_server_and_client_session as connected_session,
+)
+
+from saaga_mcp_base import blocking, create_mcp, report_progress, streams_progress
+from saaga_mcp_base.lib import progress
+from saaga_mcp_base.lib.scheduler.core.redis_client import redis_client
+
+
+@pytest.fixture(autouse=True, params=["in_process", "redis"])
+def relay(request, monkeypatch):
+    """Threads that published to Redis with a blocking call, None without Redis."""
+    if request.param == "in_process":
+        # Relay through the in-process queue, as when Redis is unreachable
+        async def unreachable(channel):
+            return None
+
+        monkeypatch.setattr(progress, "_subscribe", unreachable)
+        return None
+
+    request.getfixturevalue("fake_redis")
+    blocking_publishers = []
+    publish = redis_client.publish
+
+    def record_publish(channel, message):
+        blocking_publishers.append(threading.current_thread())
+        return publish(channel, message)
+
+    monkeypatch.setattr(redis_client, "publish", record_publish)
+    return blocking_publishers
+
+
+@streams_progress
+async def count_to(n: int) -> str:
+    for i in range(n):
+        report_progress(i + 1, n, message=f"step {i + 1}")
+    return "done"
+
+
+@streams_progress
+def count_to_in_thread(n: int) -> str:
+    for i in range(n):
+        report_progress(i + 1, n, partial={"i": i})
+    return "done"
+
+
+@blocking
+@streams_progress
+async def count_to_on_worker_loop(n: int) -> str:
+    for i in range(n):
+        report_progress(i + 1, n)
+    return "done"
+
+
+def call_with_progress(tool: str, n: int):
+    mcp = create_mcp(
+        "progress_test", [count_to, count_to_in_thread, count_to_on_worker_loop]
+    )
+    notifications = []
+    messages = []
+
+    async def on_progress(progress_value, total, message=None):
+        notifications.append((progress_value, total))
+
+    async def on_log(params):
+        messages.append(params.data)
+
+    async def run():
+        async with connected_session(
+            mcp._mcp_server, logging_callback=on_log
+        ) as client:
+            return await client.call_tool(tool, {"n": n}, progress_callback=on_progress)
+
+    result = asyncio.run(run())
+    return result.content[0].text, notifications, messages
+
+
+def test_progress_notifications_reach_the_client(relay):
+    text, notifications, messages = call_with_progress("count_to", 3)
+
+    assert text == "done"
+    assert notifications == [(1, 3), (2, 3), (3, 3)]
+    assert messages == ["step 1", "step 2", "step 3"]
+    # Events of an async tool are published without blocking the event loop
+    assert not relay
+
+
+def test_progress_from_offloaded_tool_reaches_the_client(relay):
+    text, notifications, messages = call_with_progress("count_to_in_thread", 2)
+
+    assert text == "done"
+    assert notifications == [(1, 2), (2, 2)]
+    assert messages == ['{"i": 0}', '{"i": 1}']
+    if relay is not None:
+        # Published from the worker thread
+        assert len(relay) == 2
+        assert threading.main_thread() not in relay
+
+
+def test_progress_from_offloaded_async_tool_reaches_the_client(relay):
+    text, notifications, _ = call_with_progress("count_to_on_worker_loop", 2)
+
+    assert text == "done"
+    assert notifications == [(1, 2), (2, 2)]
+    if relay is not None:
+        # Published right away, the worker loop stops when the tool returns
+        assert len(relay) == 2
+        assert threading.main_thread() not in relay
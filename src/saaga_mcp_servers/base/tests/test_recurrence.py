@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import fakeredis
+import pytest
+from celery.schedules import crontab, schedule
+from redbeat import RedBeatSchedulerEntry
+
+from saaga_mcp_base.lib.scheduler.core import recurrence
+from saaga_mcp_base.lib.scheduler.core.celery_app import app
+
+
+@app.task(name="tests.recurrence.poll", queue="io")
+def poll(query):
+    return query
+
+
+@pytest.fixture(autouse=True)
+def redbeat_redis(monkeypatch):
+    """Keep RedBeat's entries in an in-memory Redis."""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(app, "redbeat_redis", client, raising=False)
+    return client
+
+
+@pytest.mark.parametrize(
+    "value, seconds",
+    [
+        ("every 5 minutes", 300),
+        ("30s", 30),
+        ("2h", 7200),
+        ("Every 1.5 hours", 5400),
+        ("1 day", 86400),
+    ],
+)
+def test_intervals(value, seconds):
+    parsed = recurrence.parse_recurrence(value)
+
+    assert isinstance(parsed, schedule)
+    assert parsed.run_every == timedelta(seconds=seconds)
+
+
+def test_cron_expressions():
+    parsed = recurrence.parse_recurrence(" */15 9-17 * * mon-fri ")
+
+    assert isinstance(parsed, crontab)
+    assert parsed.minute == {0, 15, 30, 45}
+    assert parsed.hour == set(range(9, 18))
+    assert parsed.day_of_week == {1, 2, 3, 4, 5}
+
+
+@pytest.mark.parametrize(
+    "value", ["", "every 0 minutes", "5 fortnights", "soon", "* * * *"]
+)
+def test_invalid_recurrences(value):
+    with pytest.raises(ValueError, match="cron expression"):
+        recurrence.parse_recurrence(value)
+
+
+def test_invalid_cron_field():
+    with pytest.raises(
+        ValueError, match="Invalid cron expression '61 \\* \\* \\* \\*'"
+    ):
+        recurrence.parse_recurrence("61 * * * *")
+
+
+def test_recurring_schedules_are_added_listed_and_removed():
+    before = datetime.now(timezone.utc)
+    hourly = recurrence.add_recurring(poll, [], {"query": "a"}, "every 1 hour")
+    minutely = recurrence.add_recurring(poll, [], {"query": "b"}, "every 1 minute")
+    # Static beat entries are not tool schedules
+    RedBeatSchedulerEntry(
+        "static", "tests.recurrence.poll", schedule(timedelta(seconds=10)), app=app
+    ).save()
+
+    assert hourly["schedule_id"].startswith("tool:poll:")
+    next_run = datetime.fromisoformat(minutely["next_run"])
+    assert timedelta(seconds=59) <= next_run - before <= timedelta(seconds=62)
+
+    schedules = recurrence.list_recurring()
+    assert [entry["schedule_id"] for entry in schedules] == [
+        minutely["schedule_id"],
+        hourly["schedule_id"],
+    ]
+    assert schedules[1] == {
+        "schedule_id": hourly["schedule_id"],
+        "task": "tests.recurrence.poll",
+        "recurrence": "every 3600s",
+        "next_run": hourly["next_run"],
+        "kwargs": {"query": "a"},
+    }
+    assert len(recurrence.list_recurring(limit=1)) == 1
+    # Beat publishes to the tool's queue
+    entry = RedBeatSchedulerEntry.from_key(
+        RedBeatSchedulerEntry.generate_key(app, hourly["schedule_id"]), app=app
+    )
+    assert entry.options == {"queue": "io"}
+
+    assert recurrence.remove_recurring(hourly["schedule_id"])
+    assert not recurrence.remove_recurring(hourly["schedule_id"])
+    assert not recurrence.remove_recurring("static")
+    assert [entry["schedule_id"] for entry in recurrence.list_recurring()] == [
+        minutely["schedule_id"]
+    ]
+
+
+def test_cron_schedules_are_listed_by_expression():
+    added = recurrence.add_recurring(poll, ["x"], {}, "0 9 * * 1")
+
+    (listed,) = recurrence.list_recurring()
+
+    assert listed["recurrence"] == "0 9 * * 1"
+    next_run = datetime.fromisoformat(added["next_run"])
+    assert (next_run.weekday(), next_run.hour, next_run.minute) == (0, 9, 0)
+    assert next_run.second == 0
+    assert listed["next_run"] == added["next_run"]
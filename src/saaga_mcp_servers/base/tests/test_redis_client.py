@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+import pytest
+
+from saaga_mcp_base.lib.scheduler.core.redis_client import (
+    async_redis_client,
+    redis_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def server(fake_redis):
+    return fake_redis
+
+
+def test_mget_and_mset():
+    assert redis_client.mset({"a": 1, "b": "two"})
+    assert redis_client.mget(["a", "missing", "b"]) == [b"1", None, b"two"]
+    # Empty batches make no round trip
+    assert redis_client.mset({})
+    assert redis_client.mget([]) == []
+
+
+def test_mset_with_expiry_sets_every_key():
+    assert redis_client.mset({"a": 1, "b": 2}, ex=60)
+    assert redis_client.mget(["a", "b"]) == [b"1", b"2"]
+    assert 0 < redis_client.client.ttl("a") <= 60
+    assert 0 < redis_client.client.ttl("b") <= 60
+
+
+def test_pipeline_sends_queued_commands():
+    with redis_client.pipeline() as pipe:
+        pipe.set("a", 1).incr("a").get("a")
+        assert pipe.execute() == [True, 2, b"2"]
+
+
+def test_async_helpers():
+    async def run():
+        assert await async_redis_client.mset({"a": 1, "b": 2}, ex=60)
+        values = await async_redis_client.mget(["a", "missing", "b"])
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.incr("a").ttl("b")
+            incremented, ttl = await pipe.execute()
+        assert await async_redis_client.mget([]) == []
+        return values, incremented, ttl
+
+    values, incremented, ttl = asyncio.run(run())
+
+    assert values == [b"1", None, b"2"]
+    assert incremented == 2
+    assert 0 < ttl <= 60
+    # Sync and async clients see the same data
+    assert redis_client.get("a") == b"2"
+
+
+def test_async_client_per_event_loop():
+    clients = []
+
+    async def use_client():
+        await async_redis_client.set("key", "value")
+        # Same client for every call on a loop
+        assert async_redis_client.client is async_redis_client.client
+        clients.append(async_redis_client.client)
+        return await async_redis_client.get("key")
+
+    assert asyncio.run(use_client()) == b"value"
+    # Another loop in another thread, while the first one is closed
+    results = []
+    thread = threading.Thread(target=lambda: results.append(asyncio.run(use_client())))
+    thread.start()
+    thread.join()
+
+    assert results == [b"value"]
+    assert clients[0] is not clients[1]
+    # The client of the closed loop was dropped
+    assert list(async_redis_client._clients.values()) == [clients[1]]
+
+
+def test_async_client_needs_a_running_loop():
+    with pytest.raises(RuntimeError):
+        async_redis_client.client
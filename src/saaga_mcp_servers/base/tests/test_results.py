@@ -0,0 +1,136 @@
+import os
+import time
+
+import fakeredis
+import pytest
+
+from saaga_mcp_base.config.env import CELERY
+from saaga_mcp_base.lib.scheduler.core import results
+from saaga_mcp_base.lib.scheduler.core.celery_app import app
+from saaga_mcp_base.lib.scheduler.core.results import (
+    MARKER,
+    ResultExpiredError,
+    compact_result,
+    expand_result,
+    fetch_results,
+)
+
+
+@pytest.fixture(autouse=True)
+def spill_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "results"
+    monkeypatch.setattr(CELERY, "RESULT_SPILL_DIR", str(directory))
+    monkeypatch.setattr(results, "_last_prune", 0.0)
+    return directory
+
+
+def payload(size: int) -> dict:
+    """A result whose JSON is a little over size bytes."""
+    return {"Status": "Success", "body": "x" * size}
+
+
+def test_small_results_are_kept_inline():
+    result = payload(1000)
+
+    assert compact_result(result, "task") is result
+    assert expand_result(result) is result
+
+
+def test_results_over_the_compress_threshold_are_compressed(spill_dir):
+    result = payload(CELERY.RESULT_COMPRESS_THRESHOLD)
+
+    compacted = compact_result(result, "task")
+
+    assert compacted[MARKER] == "zlib"
+    assert compacted["size"] > CELERY.RESULT_COMPRESS_THRESHOLD
+    assert len(compacted["data"]) < 10_000
+    assert expand_result(compacted) == result
+    assert not spill_dir.exists()
+
+
+def test_results_over_the_spill_threshold_are_written_to_disk(spill_dir):
+    result = payload(CELERY.RESULT_SPILL_THRESHOLD)
+
+    compacted = compact_result(result, "task-1")
+
+    assert compacted[MARKER] == "file"
+    assert compacted["path"] == str(spill_dir / "task-1.json.gz")
+    assert expand_result(compacted) == result
+
+
+def test_thresholds_of_zero_disable_compaction(monkeypatch):
+    monkeypatch.setattr(CELERY, "RESULT_COMPRESS_THRESHOLD", 0)
+    monkeypatch.setattr(CELERY, "RESULT_SPILL_THRESHOLD", 0)
+    result = payload(CELERY.RESULT_SPILL_THRESHOLD)
+
+    assert compact_result(result, "task") is result
+
+
+def test_missing_spill_files_raise_a_clear_error():
+    compacted = compact_result(payload(CELERY.RESULT_SPILL_THRESHOLD), "gone")
+    os.remove(compacted["path"])
+
+    with pytest.raises(ResultExpiredError, match="no longer exists") as raised:
+        expand_result(compacted)
+    assert not isinstance(raised.value, OSError)
+
+
+def test_expired_spill_files_are_pruned(spill_dir, monkeypatch):
+    spill_dir.mkdir()
+    expired = spill_dir / "expired.json.gz"
+    recent = spill_dir / "recent.json.gz"
+    for path in (expired, recent):
+        path.write_bytes(b"")
+    old = time.time() - CELERY.RESULT_EXPIRES - 60
+    os.utime(expired, (old, old))
+
+    compact_result(payload(CELERY.RESULT_SPILL_THRESHOLD), "new")
+
+    assert sorted(path.name for path in spill_dir.iterdir()) == [
+        "new.json.gz",
+        "recent.json.gz",
+    ]
+
+    # Pruning runs at most once per interval
+    os.utime(recent, (old, old))
+    compact_result(payload(CELERY.RESULT_SPILL_THRESHOLD), "newer")
+    assert recent.exists()
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = app.backend
+    monkeypatch.setattr(backend, "client", fakeredis.FakeRedis(), raising=False)
+    return backend
+
+
+def test_fetch_results_expands_every_state(backend):
+    large = payload(CELERY.RESULT_SPILL_THRESHOLD)
+    medium = payload(CELERY.RESULT_COMPRESS_THRESHOLD)
+    backend.store_result("inline", {"n": 1}, "SUCCESS")
+    backend.store_result("compressed", compact_result(medium, "compressed"), "SUCCESS")
+    backend.store_result("spilled", compact_result(large, "spilled"), "SUCCESS")
+    expired = compact_result(large, "expired")
+    os.remove(expired["path"])
+    backend.store_result("expired", expired, "SUCCESS")
+    backend.store_result("failed", ValueError("boom"), "FAILURE")
+
+    fetched = fetch_results(
+        ["inline", "compressed", "spilled", "expired", "failed", "unknown"]
+    )
+
+    assert fetched["inline"]["result"] == {"n": 1}
+    assert fetched["inline"]["date_done"]
+    assert fetched["compressed"]["result"] == medium
+    assert fetched["spilled"]["result"] == large
+    assert fetched["expired"]["status"] == "SUCCESS"
+    assert fetched["expired"]["result"] is None
+    assert "no longer exists" in fetched["expired"]["error"]
+    assert fetched["failed"] == {
+        "status": "FAILURE",
+        "date_done": fetched["failed"]["date_done"],
+        "result": None,
+        "error": "boom",
+    }
+    assert fetched["unknown"] == {"status": "PENDING", "result": None}
+    assert fetch_results([]) == {}
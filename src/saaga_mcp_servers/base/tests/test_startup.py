@@ -0,0 +1,79 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Import time of saaga_mcp_base itself, with the third-party packages it always
+# needs already imported. About 30 ms when measured; setting up the scheduler
+# and log database at import took about 250 ms.
+IMPORT_BUDGET_US = 100_000
+PRELOADED = "import loguru, mcp.server.fastmcp, pydantic_settings"
+
+LAZY_PACKAGES = ("celery", "kombu", "redbeat", "redis")
+
+
+def import_in_subprocess(
+    cwd: Path, code: str = "", prelude: str = ""
+) -> subprocess.CompletedProcess:
+    source = f"{prelude}\nimport saaga_mcp_base\n{code}"
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", source],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def cumulative_import_time(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+@pytest.fixture
+def workdir(tmp_path: Path) -> Path:
+    # The log database path is relative, so it would be created here
+    return tmp_path
+
+
+def test_import_within_budget(workdir):
+    result = import_in_subprocess(workdir, prelude=PRELOADED)
+    elapsed = cumulative_import_time(result.stderr, "saaga_mcp_base")
+    assert elapsed < IMPORT_BUDGET_US, f"import took {elapsed / 1000:.0f} ms"
+
+
+def test_import_does_not_load_scheduler_backends(workdir):
+    result = import_in_subprocess(
+        workdir, "import sys\nprint(' '.join({m.split('.')[0] for m in sys.modules}))"
+    )
+    loaded = set(result.stdout.split()) & set(LAZY_PACKAGES)
+    assert not loaded, f"imported at startup: {sorted(loaded)}"
+
+
+def test_log_database_opened_on_first_record(workdir):
+    import_in_subprocess(workdir)
+    assert not (workdir / ".db").exists()
+
+    import_in_subprocess(
+        workdir,
+        "from saaga_mcp_base import logger\n"
+        "from saaga_mcp_base.lib import logging\n"
+        "logging.install_db_logging()\n"
+        "logger.info('first record')\n"
+        "logging.db_sink.flush()",
+    )
+    assert list((workdir / ".db").iterdir())
+
+
+def test_import_leaves_loguru_handlers_alone(workdir):
+    result = import_in_subprocess(
+        workdir, "from loguru import logger\nlogger.info('still on stderr')"
+    )
+    assert "still on stderr" in result.stderr
+    assert not (workdir / ".db").exists()
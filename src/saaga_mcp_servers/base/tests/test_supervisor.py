@@ -0,0 +1,185 @@
+import asyncio
+import itertools
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from saaga_mcp_base.config.env import settings
+from saaga_mcp_base.lib.scheduler.core import supervisor as supervisor_module
+from saaga_mcp_base.lib.scheduler.core.supervisor import (
+    ManagedService,
+    ServiceSpec,
+    Supervisor,
+)
+
+_pids = itertools.count(1000)
+
+
+class FakeProcess:
+    """A process that exits with code 1 once it has run for lifetime seconds."""
+
+    def __init__(self, clock, lifetime: float):
+        self.clock = clock
+        self.ends_at = clock() + lifetime
+        self.pid = next(_pids)
+        self.returncode = None
+
+    def poll(self):
+        if self.returncode is None and self.clock() >= self.ends_at:
+            self.returncode = 1
+        return self.returncode
+
+    def terminate(self):
+        if self.returncode is None:
+            self.returncode = -15
+
+    kill = terminate
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that asyncio.sleep advances instantly."""
+    clock = Clock()
+    clock.sleeps = []
+    sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        clock.sleeps.append(delay)
+        clock.now += delay
+        await sleep(0)
+
+    monkeypatch.setattr(supervisor_module, "time", SimpleNamespace(monotonic=clock))
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(settings, "scheduler_probe_interval", 0.5)
+    monkeypatch.setattr(settings, "scheduler_restart_backoff", 1)
+    monkeypatch.setattr(settings, "scheduler_restart_max_backoff", 4)
+    return clock
+
+
+def crashing_service(clock, lifetimes):
+    """A service whose successive processes run for the given lifetimes."""
+    lifetimes = iter(lifetimes)
+    starts = []
+
+    def start():
+        process = FakeProcess(clock, next(lifetimes))
+        starts.append(process)
+        return process
+
+    service = ManagedService(ServiceSpec("flaky", start))
+    service.starts = starts
+    return service
+
+
+def supervise(service: ManagedService) -> None:
+    """Launch the service and monitor it until the supervisor gives up."""
+    supervisor = Supervisor()
+
+    async def run():
+        await supervisor._launch(service)
+        await supervisor._monitor(service)
+
+    asyncio.run(run())
+
+
+def restart_delays(clock) -> list:
+    """The sleeps that are not probe intervals."""
+    interval = settings.scheduler_probe_interval
+    return [delay for delay in clock.sleeps if delay not in (0, interval)]
+
+
+def test_crash_loops_back_off_until_max_restarts(clock, monkeypatch):
+    monkeypatch.setattr(settings, "scheduler_max_restarts", 4)
+    service = crashing_service(clock, [0] * 10)
+
+    supervise(service)
+
+    # Doubling up to the maximum backoff
+    assert restart_delays(clock) == [1, 2, 4, 4]
+    assert service.restarts == 4
+    assert len(service.starts) == 5
+    assert service.state == "failed"
+    assert service.last_error == "exited during startup (code 1)"
+
+
+def test_backoff_resets_after_a_stable_run(clock, monkeypatch):
+    monkeypatch.setattr(settings, "scheduler_max_restarts", 3)
+    # The third process runs longer than _STABLE_AFTER before crashing
+    stable = supervisor_module._STABLE_AFTER + 60
+    service = crashing_service(clock, [0, 0, stable, 0, 0, 0, 0])
+
+    supervise(service)
+
+    assert restart_delays(clock) == [1, 2, 1, 2, 4]
+    assert service.restarts == 5
+    assert service.state == "failed"
+
+
+def test_services_start_once_their_dependencies_are_ready(monkeypatch):
+    monkeypatch.setattr(settings, "scheduler_probe_interval", 0.01)
+    events = []
+
+    def starter(name):
+        def start():
+            events.append(("start", name))
+            return FakeProcess(time.monotonic, 3600)
+
+        return start
+
+    def probe(name, ready_after):
+        calls = itertools.count(1)
+
+        async def ready():
+            if next(calls) < ready_after:
+                return False
+            events.append(("ready", name))
+            return True
+
+        return ready
+
+    def broken():
+        raise OSError("no such binary")
+
+    supervisor = Supervisor()
+    supervisor.configure(
+        [
+            ServiceSpec("redis", starter("redis"), probe("redis", 3)),
+            ServiceSpec(
+                "worker", starter("worker"), probe("worker", 2), depends_on=("redis",)
+            ),
+            ServiceSpec("beat", starter("beat"), depends_on=("redis",)),
+            ServiceSpec("database", broken),
+            ServiceSpec("reports", starter("reports"), depends_on=("database",)),
+        ]
+    )
+
+    async def run():
+        try:
+            return await supervisor.start(), supervisor.status()
+        finally:
+            await supervisor.stop()
+
+    results, status = asyncio.run(run())
+
+    redis_ready = events.index(("ready", "redis"))
+    assert events.index(("start", "worker")) > redis_ready
+    assert events.index(("start", "beat")) > redis_ready
+    assert results["redis"].startswith("started (PID: ")
+    assert results["worker"].startswith("started (PID: ")
+    assert results["database"] == "failed: no such binary"
+    assert results["reports"] == "skipped: database is not running"
+    assert ("start", "reports") not in events
+    assert status["worker"]["state"] == "running"
+    assert status["database"]["last_error"] == "no such binary"
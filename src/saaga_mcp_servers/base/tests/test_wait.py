@@ -0,0 +1,106 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from mcp.types import CallToolResult, TextContent
+
+from saaga_mcp_base.lib.datetime.tools.wiat import wait, wait_until
+
+
+class StubContext:
+    """Context whose server returns the given results of the polled tool."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+        self.progress = []
+        self.fastmcp = SimpleNamespace(call_tool=self.call_tool)
+
+    async def call_tool(self, name, arguments):
+        self.calls.append((name, arguments))
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def report_progress(self, progress, total):
+        self.progress.append((progress, total))
+
+
+def text(value: str):
+    return [TextContent(type="text", text=value)]
+
+
+def poll(ctx, **kwargs):
+    options = dict(initial_interval_seconds=0.01, max_interval_seconds=0.01)
+    options.update(kwargs)
+    return asyncio.run(wait_until("check", {"id": 1}, ctx=ctx, **options))
+
+
+def test_wait_until_contains_is_met():
+    ctx = StubContext(text("pending"), text("pending"), text("status: done"))
+
+    outcome = poll(ctx, contains="done")
+
+    assert outcome["status"] == "condition_met"
+    assert outcome["attempts"] == 3
+    assert outcome["result"] == "status: done"
+    assert ctx.calls == [("check", {"id": 1})] * 3
+    assert len(ctx.progress) == 2
+
+
+def test_wait_until_non_empty_result_is_met():
+    ctx = StubContext(text("[]"), text(""), text('[{"id": 1}]'))
+
+    outcome = poll(ctx)
+
+    assert outcome["status"] == "condition_met"
+    assert outcome["attempts"] == 3
+
+
+def test_wait_until_stops_on_an_exception_result():
+    failure = {
+        "Status": "Exception",
+        "Message": "mailbox unavailable",
+        "ExceptionType": "RuntimeError",
+    }
+    ctx = StubContext(text(json.dumps(failure)), text("done"))
+
+    outcome = poll(ctx)
+
+    assert outcome["status"] == "error"
+    assert outcome["error"] == "mailbox unavailable"
+    assert outcome["attempts"] == 1
+
+
+def test_wait_until_stops_on_an_error_result_or_raise():
+    error_result = CallToolResult(content=text("bad arguments"), isError=True)
+
+    outcome = poll(StubContext(error_result))
+    assert outcome["status"] == "error"
+    assert outcome["error"] == "bad arguments"
+
+    outcome = poll(StubContext(ValueError("Unknown tool: check")))
+    assert outcome["status"] == "error"
+    assert outcome["error"] == "Unknown tool: check"
+
+
+def test_wait_until_times_out():
+    ctx = StubContext(text("pending"))
+
+    outcome = poll(ctx, contains="done", timeout_minutes=0.001)
+
+    assert outcome["status"] == "timeout"
+    assert outcome["attempts"] > 1
+    assert outcome["elapsed_seconds"] >= 0.06
+    assert "error" not in outcome
+
+
+def test_wait_reports_progress():
+    ctx = StubContext()
+
+    message = asyncio.run(wait(0.001, progress_interval_seconds=0.02, ctx=ctx))
+
+    assert message == "Waited for 0.001 minutes (0.06 seconds)"
+    assert ctx.progress
+    assert all(total == 0.06 for _, total in ctx.progress)
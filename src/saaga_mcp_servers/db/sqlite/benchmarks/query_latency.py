@@ -0,0 +1,136 @@
+"""
+Per-query latency of SqliteDatabase compared with a connection per query.
+
+Builds (or reuses) a database of roughly --size-mb megabytes and runs the same
+point lookups, indexed range scans and small aggregates through:
+
+- "per-query connection": the previous behaviour of _execute_query, which
+  opened a new sqlite3 connection for every query and closed it afterwards
+- "persistent connection": SqliteDatabase, which keeps one tuned connection
+
+Usage:
+    uv run python benchmarks/query_latency.py --db-path /tmp/bench.db --size-mb 1024
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable
+
+from mcp_server_sqlite.server import SqliteDatabase
+
+BATCH_ROWS = 100_000
+
+
+def build_database(db_path: str, size_mb: int) -> int:
+    """Fill the events table until the file reaches size_mb. Returns the row count."""
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "id INTEGER PRIMARY KEY, user_id INTEGER, kind TEXT, "
+            "payload TEXT, created_at REAL)"
+        )
+        rows = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        target = size_mb * 1024 * 1024
+        rng = random.Random(0)
+        while os.path.getsize(db_path) < target:
+            batch = [
+                (
+                    rows + i,
+                    rng.randrange(100_000),
+                    rng.choice(("click", "view", "purchase", "signup")),
+                    os.urandom(96).hex(),
+                    time.time(),
+                )
+                for i in range(BATCH_ROWS)
+            ]
+            with conn:
+                conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?)", batch)
+            rows += BATCH_ROWS
+            print(f"  {rows:,} rows, {os.path.getsize(db_path) / 2**20:,.0f} MB", end="\r")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_events_user ON events (user_id)")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    print()
+    return rows
+
+
+def per_query_connection(db_path: str) -> Callable[[str], list[dict[str, Any]]]:
+    def execute(query: str) -> list[dict[str, Any]]:
+        with closing(sqlite3.connect(db_path)) as conn:
+            conn.row_factory = sqlite3.Row
+            with closing(conn.cursor()) as cursor:
+                cursor.execute(query)
+                return [dict(row) for row in cursor.fetchall()]
+
+    return execute
+
+
+def workloads(rows: int, count: int) -> dict[str, list[str]]:
+    rng = random.Random(1)
+    return {
+        "point lookup": [
+            f"SELECT * FROM events WHERE id = {rng.randrange(rows)}" for _ in range(count)
+        ],
+        "indexed range": [
+            f"SELECT id, kind FROM events WHERE user_id = {rng.randrange(100_000)} LIMIT 50"
+            for _ in range(count)
+        ],
+        "small aggregate": [
+            f"SELECT kind, COUNT(*) FROM events WHERE id BETWEEN {start} AND {start + 1000} GROUP BY kind"
+            for start in (rng.randrange(rows - 1000) for _ in range(count))
+        ],
+    }
+
+
+def measure(execute: Callable[[str], Any], queries: list[str]) -> list[float]:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        execute(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> float:
+    timings = sorted(timings)
+    p50 = statistics.median(timings)
+    p95 = timings[int(len(timings) * 0.95)]
+    print(f"    {name:<24} p50 {p50:8.3f} ms   p95 {p95:8.3f} ms   mean {statistics.fmean(timings):8.3f} ms")
+    return p50
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db-path", default="./benchmark.db")
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    db_path = str(Path(args.db_path).expanduser())
+    print(f"Preparing {db_path} ({args.size_mb} MB)")
+    rows = build_database(db_path, args.size_mb)
+
+    baseline = per_query_connection(db_path)
+    db = SqliteDatabase(db_path)
+    try:
+        for name, queries in workloads(rows, args.queries).items():
+            # Warm the OS page cache so both runs read from memory
+            measure(baseline, queries[:100])
+            measure(db._execute_query, queries[:100])
+            print(f"{name}:")
+            before = report("per-query connection", measure(baseline, queries))
+            after = report("persistent connection", measure(db._execute_query, queries))
+            print(f"    speedup (p50)            {before / after:.1f}x")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,36 @@ def main():
     parser.add_argument('--db-path', 
                        default="./sqlite_mcp_server.db",
                        help='Path to SQLite database file')
+    parser.add_argument('--cache-size',
+                       type=int,
+                       default=server.DEFAULT_CACHE_SIZE,
+                       help='SQLite page cache size (PRAGMA cache_size; negative values are KiB)')
+    parser.add_argument('--mmap-size',
+                       type=int,
+                       default=server.DEFAULT_MMAP_SIZE,
+                       help='Bytes of the database to memory-map (PRAGMA mmap_size)')
+    parser.add_argument('--statement-cache-size',
+                       type=int,
+                       default=server.DEFAULT_STATEMENT_CACHE_SIZE,
+                       help='Prepared statements cached per connection')
+    parser.add_argument('--readers',
+                       type=int,
+                       default=server.DEFAULT_READERS,
+                       help='Threads running read queries concurrently')
+    parser.add_argument('--query-timeout',
+                       type=float,
+                       default=server.DEFAULT_QUERY_TIMEOUT,
+                       help='Seconds before a query is interrupted (0 disables the limit)')
     
     args = parser.parse_args()
-    asyncio.run(server.main(args.db_path))
+    asyncio.run(server.main(
+        args.db_path,
+        cache_size=args.cache_size,
+        mmap_size=args.mmap_size,
+        statement_cache_size=args.statement_cache_size,
+        readers=args.readers,
+        query_timeout=args.query_timeout,
+    ))
 
 
 # Optionally expose other important items at package level
@@ -2,14 +2,26 @@ import os
 import sys
 import sqlite3
 import logging
+import asyncio
+import threading
+import time
+import base64
+import csv
+import itertools
+import hashlib
+import io
+import json
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
+from dataclasses import dataclass, field
 from pathlib import Path
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 from pydantic import AnyUrl
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
 
 # reconfigure UnicodeEncodeError prone default (i.e. windows-1252) to utf-8
 if sys.platform == "win32" and os.environ.get('PYTHONIOENCODING') is None:
@@ -101,19 +113,246 @@ The provided XML tags are for the assistants understanding. Implore to make all
 Start your first message fully in character with something like "Oh, Hey there! I see you've chosen the topic {topic}. Let's get started! 🚀"
 """
 
+# Connection tuning, applied to every connection the server opens.
+# Negative cache_size values are in KiB rather than pages.
+DEFAULT_CACHE_SIZE = -64_000  # 64 MB page cache
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+# Threads running read queries concurrently (WAL allows many readers)
+DEFAULT_READERS = 4
+# Seconds a query may run before it is interrupted (0 disables the limit)
+DEFAULT_QUERY_TIMEOUT = 30.0
+# SQLite VM instructions between timeout/cancellation checks
+PROGRESS_INTERVAL = 1000
+
+
+# read_query paging: rows per page and the approximate size of a page's rows
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10_000
+DEFAULT_MAX_BYTES = 1_000_000
+# Rows pulled from the cursor at a time
+FETCH_BATCH_SIZE = 256
+# Seconds a paged query's cursor stays open for its next page, and how many
+# are kept. An open cursor pins its WAL snapshot, so both are kept small.
+CURSOR_TTL = 300.0
+MAX_OPEN_CURSORS = 8
+OUTPUT_FORMATS = ("json", "csv")
+# Rows per executemany call of bulk_insert and load_csv
+DEFAULT_BATCH_SIZE = 10_000
+
+T = TypeVar("T")
+
+
+class QueryTimeoutError(Exception):
+    """Raised when a query runs longer than its timeout and is interrupted"""
+
+
+@dataclass
+class ResultPage:
+    """One page of read_query results"""
+
+    offset: int = 0
+    columns: list[str] = field(default_factory=list)
+    # JSON-encoded rows, or the whole page as CSV
+    rows: list[str] = field(default_factory=list)
+    csv: str = ""
+    row_count: int = 0
+    # "rows" or "bytes" when the page stopped before the end of the results
+    truncated: str | None = None
+    next_token: str | None = None
+
+    def metadata(self) -> dict[str, Any]:
+        return {
+            "row_count": self.row_count,
+            "offset": self.offset,
+            "truncated": self.truncated is not None,
+            "truncated_by": self.truncated,
+            "next_token": self.next_token,
+        }
+
+    def to_json(self) -> str:
+        """Columns once, then each row as an array"""
+        # Rows are already encoded, so they are spliced in rather than re-encoded
+        metadata = json.dumps(self.metadata())
+        return f'{{"columns":{json.dumps(self.columns)},"rows":[{",".join(self.rows)}],{metadata[1:]}'
+
+
+def _query_fingerprint(query: str) -> str:
+    return hashlib.sha256(query.strip().encode()).hexdigest()[:16]
+
+
+def _encode_token(query: str, offset: int, cursor_id: str) -> str:
+    token = json.dumps({"q": _query_fingerprint(query), "o": offset, "c": cursor_id})
+    return base64.urlsafe_b64encode(token.encode()).decode()
+
+
+def _decode_token(token: str, query: str) -> tuple[int, str | None]:
+    """Offset of the page a continuation token points to, and the id of its open cursor"""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token.encode()))
+        offset = int(data["o"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid continuation token") from e
+    if data.get("q") != _query_fingerprint(query) or offset < 0:
+        raise ValueError("Continuation token does not belong to this query")
+    return offset, data.get("c")
+
+
+@dataclass
+class _OpenCursor:
+    """A read_query cursor, kept open between pages on its own connection"""
+
+    conn: sqlite3.Connection
+    query: str
+    # Rows read so far, i.e. the offset of the next page
+    offset: int = 0
+    cursor: sqlite3.Cursor | None = None
+    columns: list[str] = field(default_factory=list)
+    # Rows fetched beyond the end of the last page
+    pending: list[tuple[Any, ...]] = field(default_factory=list)
+    expires: float = 0.0
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+def _csv_value(value: Any) -> Any:
+    return base64.b64encode(value).decode() if isinstance(value, bytes) else value
+
+
+# A batch statement: SQL, or {"query": ..., "params": ...} or
+# {"query": ..., "param_sets": [...]}
+Statement = str | dict[str, Any]
+
+
+def _parse_statement(statement: Statement) -> tuple[str, Any, Any]:
+    """(query, params, param_sets) of a batch statement"""
+    if isinstance(statement, str):
+        return statement, (), None
+    if not isinstance(statement, dict) or not isinstance(statement.get("query"), str):
+        raise ValueError(f"Invalid statement, expected SQL or an object with a query: {statement!r}")
+    return statement["query"], statement.get("params") or (), statement.get("param_sets")
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a table or column name for use in SQL"""
+    if not name or "\x00" in name:
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _batches(rows: Iterable[Sequence[Any]], size: int) -> Iterator[list[Sequence[Any]]]:
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, size)):
+        yield batch
+
+
 class SqliteDatabase:
-    def __init__(self, db_path: str):
+    """SQLite access for the MCP server.
+
+    Queries run off the event loop: reads on a pool of reader threads and
+    writes on a single writer thread, which serializes them. Every thread keeps
+    its own long-lived connection, so the page, schema and statement caches
+    survive between queries. Reader connections are opened with
+    ``query_only`` so they can never write.
+
+    A paged read keeps its cursor open on a connection of its own until the
+    last page is read, or for CURSOR_TTL seconds, so every page continues
+    where the previous one stopped.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+        readers: int = DEFAULT_READERS,
+        query_timeout: float = DEFAULT_QUERY_TIMEOUT,
+    ):
         self.db_path = str(Path(db_path).expanduser())
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+        self.mmap_size = mmap_size
+        self.statement_cache_size = statement_cache_size
+        self.query_timeout = query_timeout
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._cursors: dict[str, _OpenCursor] = {}
+        # Connections of closed cursors, reused by the next paged reads
+        self._idle_cursor_connections: list[sqlite3.Connection] = []
+        self._cursors_lock = threading.Lock()
+        self._reader_pool = ThreadPoolExecutor(
+            max_workers=max(1, readers),
+            thread_name_prefix="sqlite-reader",
+            initializer=self._mark_read_only,
+        )
+        self._writer_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite-writer"
+        )
         self._init_database()
         self.insights: list[str] = []
 
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection with the server's pragmas applied"""
+        conn = sqlite3.connect(
+            self.db_path,
+            cached_statements=self.statement_cache_size,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers run concurrently with a writer, and NORMAL only
+        # syncs on checkpoints instead of on every commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size={int(self.cache_size)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _mark_read_only(self):
+        self._local.read_only = True
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """The connection of the calling thread, opened on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect(read_only=getattr(self._local, "read_only", False))
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
     def _init_database(self):
         """Initialize connection to the SQLite database"""
         logger.debug("Initializing database connection")
-        with closing(sqlite3.connect(self.db_path)) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.close()
+        # The writer opens its connection first, which switches the database to WAL
+        self._writer_pool.submit(self._thread_connection).result()
+
+    def close(self):
+        """Stop the query threads and close their connections"""
+        self._reader_pool.shutdown(wait=True, cancel_futures=True)
+        self._writer_pool.shutdown(wait=True, cancel_futures=True)
+        with self._cursors_lock:
+            cursors = list(self._cursors.values())
+            self._cursors.clear()
+        for entry in cursors:
+            self._release_cursor(entry)
+        with self._cursors_lock:
+            for conn in self._idle_cursor_connections:
+                conn.close()
+            self._idle_cursor_connections.clear()
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
 
     def _synthesize_memo(self) -> str:
         """Synthesizes business insights into a formatted memo"""
@@ -134,35 +373,535 @@ class SqliteDatabase:
         logger.debug("Generated basic memo format")
         return memo
 
-    def _execute_query(self, query: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        """Execute a SQL query and return results as a list of dictionaries"""
-        logger.debug(f"Executing query: {query}")
-        try:
-            with closing(sqlite3.connect(self.db_path)) as conn:
-                conn.row_factory = sqlite3.Row
-                with closing(conn.cursor()) as cursor:
-                    if params:
-                        cursor.execute(query, params)
-                    else:
-                        cursor.execute(query)
+    def _interruptible(
+        self,
+        work: Callable[[sqlite3.Connection], T],
+        timeout: float | None = None,
+        cancelled: threading.Event | None = None,
+        connection: sqlite3.Connection | None = None,
+    ) -> T:
+        """Run ``work`` with ``connection``, or the calling thread's connection
 
-                    if query.strip().upper().startswith(('INSERT', 'UPDATE', 'DELETE', 'CREATE', 'DROP', 'ALTER')):
-                        conn.commit()
-                        affected = cursor.rowcount
-                        logger.debug(f"Write query affected {affected} rows")
-                        return [{"affected_rows": affected}]
+        The running statement is interrupted once ``work`` has run for
+        ``timeout`` seconds or ``cancelled`` is set.
+        """
+        conn = connection or self._thread_connection()
+        deadline = time.monotonic() + timeout if timeout else None
+        if deadline is not None or cancelled is not None:
+            def should_interrupt() -> bool:
+                # A true return value makes SQLite abort the running statement
+                return (cancelled is not None and cancelled.is_set()) or (
+                    deadline is not None and time.monotonic() > deadline
+                )
 
-                    results = [dict(row) for row in cursor.fetchall()]
-                    logger.debug(f"Read query returned {len(results)} rows")
-                    return results
+            conn.set_progress_handler(should_interrupt, PROGRESS_INTERVAL)
+        try:
+            return work(conn)
         except Exception as e:
             logger.error(f"Database error executing query: {e}")
+            # Don't leave a failed write's transaction open on the shared connection
+            if conn.in_transaction:
+                conn.rollback()
+            if deadline is not None and time.monotonic() > deadline and isinstance(e, sqlite3.OperationalError):
+                raise QueryTimeoutError(f"Query interrupted after exceeding the {timeout}s timeout") from e
+            raise
+        finally:
+            conn.set_progress_handler(None, 0)
+
+    async def _submit(
+        self,
+        work: Callable[[sqlite3.Connection], T],
+        write: bool = False,
+        timeout: float | None = None,
+        connection: sqlite3.Connection | None = None,
+        on_cancelled: Callable[[], None] | None = None,
+    ) -> T:
+        """Run ``work`` on the reader pool, or on the writer thread if ``write``
+
+        ``on_cancelled`` is called once ``work`` has stopped after the call was
+        cancelled, or right away if it never started.
+        """
+        if timeout is None:
+            timeout = self.query_timeout
+        pool = self._writer_pool if write else self._reader_pool
+        cancelled = threading.Event()
+        future = pool.submit(self._interruptible, work, timeout, cancelled, connection)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Interrupt the statement if it is already running on its thread
+            cancelled.set()
+            if on_cancelled is not None:
+                future.add_done_callback(lambda _: on_cancelled())
+            raise
+
+    def _run_query(
+        self, conn: sqlite3.Connection, query: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        logger.debug(f"Executing query: {query}")
+        with closing(conn.cursor()) as cursor:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+
+            # Rows come first: a write with RETURNING only completes once they are read
+            results = (
+                [dict(row) for row in cursor.fetchall()]
+                if cursor.description is not None
+                else None
+            )
+            # Any write or schema change, including one that returned rows, is
+            # committed so the writer connection never holds the write lock
+            if conn.in_transaction:
+                conn.commit()
+
+            if results is None:
+                affected = cursor.rowcount
+                logger.debug(f"Write query affected {affected} rows")
+                return [{"affected_rows": affected}]
+
+            logger.debug(f"Query returned {len(results)} rows")
+            return results
+
+    def _execute_query(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        cancelled: threading.Event | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute a SQL query on the calling thread's connection and return results as a list of dictionaries"""
+        return self._interruptible(
+            lambda conn: self._run_query(conn, query, params), timeout, cancelled
+        )
+
+    async def execute(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        write: bool = False,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run a query on the reader pool, or on the writer thread if ``write``
+
+        Args:
+            query: SQL statement
+            params: Statement parameters
+            write: Whether the statement modifies the database
+            timeout: Seconds before the query is interrupted. Defaults to the
+                database's query_timeout; 0 disables the limit.
+        """
+        return await self._submit(
+            lambda conn: self._run_query(conn, query, params), write, timeout
+        )
+
+    def _cursor_connection(self) -> sqlite3.Connection:
+        """A read-only connection for a paged read's cursor"""
+        with self._cursors_lock:
+            if self._idle_cursor_connections:
+                return self._idle_cursor_connections.pop()
+        return self._connect(read_only=True)
+
+    def _release_cursor(self, entry: _OpenCursor):
+        """Close a paged read's cursor and keep its connection for reuse"""
+        if entry.cursor is not None:
+            entry.cursor.close()
+        with self._cursors_lock:
+            if len(self._idle_cursor_connections) < MAX_OPEN_CURSORS:
+                self._idle_cursor_connections.append(entry.conn)
+                return
+        entry.conn.close()
+
+    def _close_cursor(self, entry: _OpenCursor):
+        """Close a paged read's cursor and its connection"""
+        if entry.cursor is not None:
+            entry.cursor.close()
+        entry.conn.close()
+
+    def _keep_cursor(self, cursor_id: str, entry: _OpenCursor):
+        """Keep a cursor open for its next page, closing the oldest beyond MAX_OPEN_CURSORS"""
+        entry.expires = time.monotonic() + CURSOR_TTL
+        with self._cursors_lock:
+            self._cursors[cursor_id] = entry
+            evicted = sorted(self._cursors.items(), key=lambda item: item[1].expires)
+            evicted = evicted[: max(0, len(evicted) - MAX_OPEN_CURSORS)]
+            for evicted_id, _ in evicted:
+                del self._cursors[evicted_id]
+        for _, evicted_entry in evicted:
+            self._release_cursor(evicted_entry)
+
+    def _take_cursor(self, cursor_id: str, query: str, offset: int) -> _OpenCursor | None:
+        """Remove the open cursor a token points to, if it is still at the token's offset"""
+        now = time.monotonic()
+        with self._cursors_lock:
+            expired = [key for key, entry in self._cursors.items() if entry.expires < now]
+            expired = [self._cursors.pop(key) for key in expired]
+            entry = self._cursors.get(cursor_id)
+            if entry is not None and (entry.query != query or entry.offset != offset):
+                # An earlier page asked for again; the cursor stays for the next one
+                entry = None
+            elif entry is not None:
+                del self._cursors[cursor_id]
+        for expired_entry in expired:
+            self._release_cursor(expired_entry)
+        return entry
+
+    def _read_page(
+        self,
+        entry: _OpenCursor,
+        page_size: int,
+        max_bytes: int,
+        output_format: str,
+    ) -> ResultPage:
+        """Read the next page of a SELECT's rows, encoding them as they are fetched"""
+        if entry.cursor is None:
+            logger.debug(f"Reading page at offset {entry.offset} of query: {entry.query}")
+            entry.cursor = entry.conn.cursor()
+            entry.cursor.row_factory = None
+            entry.cursor.execute(entry.query)
+            entry.columns = [column[0] for column in entry.cursor.description]
+            # A token whose cursor has expired: skip to its offset again
+            skip = entry.offset
+            while skip:
+                skipped = entry.cursor.fetchmany(min(skip, FETCH_BATCH_SIZE))
+                if not skipped:
+                    break
+                skip -= len(skipped)
+        page = ResultPage(offset=entry.offset, columns=entry.columns)
+        csv_buffer = io.StringIO()
+        csv_writer = csv.writer(csv_buffer)
+        size = 0
+        if output_format == "csv":
+            csv_writer.writerow(page.columns)
+            size = csv_buffer.tell()
+        rows, entry.pending = entry.pending, []
+        while not page.truncated:
+            if not rows:
+                rows = entry.cursor.fetchmany(FETCH_BATCH_SIZE)
+                if not rows:
+                    break
+            for index, row in enumerate(rows):
+                # The page is only truncated if another row follows it
+                if page.row_count == page_size:
+                    page.truncated = "rows"
+                    break
+                if output_format == "csv":
+                    csv_writer.writerow(_csv_value(value) for value in row)
+                    encoded = None
+                    row_size = csv_buffer.tell() - size
+                else:
+                    encoded = json.dumps(row, default=_json_value, separators=(",", ":"))
+                    row_size = len(encoded) + 1
+                # Always return at least one row so paging makes progress
+                if page.row_count and size + row_size > max_bytes:
+                    page.truncated = "bytes"
+                    break
+                if encoded is not None:
+                    page.rows.append(encoded)
+                size += row_size
+                page.row_count += 1
+            else:
+                rows = []
+                continue
+            # The rest of the fetched rows start the next page
+            entry.pending = rows[index:]
+        if output_format == "csv":
+            # Drop a row that was written before the byte cap was checked
+            page.csv = csv_buffer.getvalue()[:size] if page.truncated == "bytes" else csv_buffer.getvalue()
+        entry.offset += page.row_count
+        return page
+
+    async def read_page(
+        self,
+        query: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        continuation_token: str | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        output_format: str = "json",
+        timeout: float | None = None,
+    ) -> ResultPage:
+        """Read one page of a SELECT's results on the reader pool
+
+        The query runs as given, so the columns keep their names. Its cursor
+        stays open for the next page; a token whose cursor has expired runs
+        the query again and skips to the token's offset.
+
+        Args:
+            query: SELECT statement
+            page_size: Maximum rows in the page, up to MAX_PAGE_SIZE
+            continuation_token: ``next_token`` of the previous page of the same query
+            max_bytes: Approximate maximum size of the encoded rows
+            output_format: "json" or "csv"
+            timeout: Seconds before the query is interrupted
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"output_format must be one of {', '.join(OUTPUT_FORMATS)}")
+        offset, cursor_id = _decode_token(continuation_token, query) if continuation_token else (0, None)
+        page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+        max_bytes = max(1, int(max_bytes))
+        entry = self._take_cursor(cursor_id, query, offset) if cursor_id else None
+        if entry is None or cursor_id is None:
+            entry = _OpenCursor(conn=self._cursor_connection(), query=query, offset=offset)
+            cursor_id = secrets.token_urlsafe(12)
+        try:
+            page = await self._submit(
+                lambda conn: self._read_page(entry, page_size, max_bytes, output_format),
+                timeout=timeout,
+                connection=entry.conn,
+                # The reader thread may still be using the connection
+                on_cancelled=lambda: self._close_cursor(entry),
+            )
+        except Exception:
+            self._release_cursor(entry)
+            raise
+        if not page.truncated:
+            self._release_cursor(entry)
+            return page
+        page.next_token = _encode_token(query, entry.offset, cursor_id)
+        self._keep_cursor(cursor_id, entry)
+        return page
+
+    def _load_rows(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        batch_size: int,
+        fast: bool,
+        defer_indexes: bool,
+        create_table: bool = False,
+    ) -> dict[str, Any]:
+        """Insert rows in a single transaction, ``batch_size`` rows per executemany
+
+        With ``create_table``, a missing table is first created with untyped
+        columns, which keep the inserted values as they are.
+        """
+        if not columns:
+            raise ValueError("At least one column is required")
+        started = time.perf_counter()
+        sql = (
+            f"INSERT INTO {_quote_identifier(table)} "
+            f"({', '.join(_quote_identifier(column) for column in columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        if fast:
+            # Skips fsync until the load is done; a crash mid-load can corrupt
+            # the database, so it is opt-in
+            conn.execute("PRAGMA synchronous=OFF")
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            created = False
+            if create_table and not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone():
+                conn.execute(
+                    f"CREATE TABLE {_quote_identifier(table)} "
+                    f"({', '.join(_quote_identifier(column) for column in columns)})"
+                )
+                created = True
+            indexes = []
+            if defer_indexes:
+                # Explicit indexes only; those backing PRIMARY KEY/UNIQUE have no SQL
+                indexes = conn.execute(
+                    "SELECT name, sql FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                    (table,),
+                ).fetchall()
+                for name, _ in indexes:
+                    conn.execute(f"DROP INDEX {_quote_identifier(name)}")
+            inserted = 0
+            with closing(conn.cursor()) as cursor:
+                for batch in _batches(rows, max(1, batch_size)):
+                    cursor.executemany(sql, batch)
+                    inserted += len(batch)
+            # Building an index once over all rows is cheaper than updating it per row
+            for _, index_sql in indexes:
+                conn.execute(index_sql)
+            conn.commit()
+        except BaseException:
+            # The safety level can't be changed inside a transaction, so the
+            # failed load is rolled back before it is restored below
+            if conn.in_transaction:
+                conn.rollback()
             raise
+        finally:
+            if fast and not conn.in_transaction:
+                conn.execute("PRAGMA synchronous=NORMAL")
+        elapsed = time.perf_counter() - started
+        logger.debug(f"Loaded {inserted} rows into {table} in {elapsed:.3f}s")
+        return {
+            "table": table,
+            "inserted_rows": inserted,
+            "created_table": created,
+            "indexes_rebuilt": [name for name, _ in indexes],
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(inserted / elapsed) if elapsed else None,
+        }
 
-async def main(db_path: str):
+    async def bulk_insert(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fast: bool = False,
+        defer_indexes: bool = False,
+        timeout: float | None = 0,
+    ) -> dict[str, Any]:
+        """Insert many rows on the writer thread in one transaction
+
+        Args:
+            table: Existing table to insert into
+            columns: Columns the values of each row are for
+            rows: Rows of values, in column order
+            batch_size: Rows per executemany call
+            fast: Run the load with PRAGMA synchronous=OFF
+            defer_indexes: Drop the table's indexes during the load and
+                rebuild them afterwards, within the same transaction
+            timeout: Seconds before the load is interrupted and rolled back.
+                Defaults to no limit; None uses the database's query_timeout.
+        """
+        return await self._submit(
+            lambda conn: self._load_rows(conn, table, columns, rows, batch_size, fast, defer_indexes),
+            write=True,
+            timeout=timeout,
+        )
+
+    def _load_csv(
+        self,
+        conn: sqlite3.Connection,
+        path: str,
+        table: str,
+        delimiter: str,
+        batch_size: int,
+        fast: bool,
+        defer_indexes: bool,
+    ) -> dict[str, Any]:
+        with open(Path(path).expanduser(), newline="", encoding="utf-8") as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            columns = next(reader, None)
+            if not columns:
+                raise ValueError(f"{path} has no header row")
+            return self._load_rows(
+                conn, table, columns, reader, batch_size, fast, defer_indexes, create_table=True
+            )
+
+    async def load_csv(
+        self,
+        path: str,
+        table: str,
+        delimiter: str = ",",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fast: bool = False,
+        defer_indexes: bool = False,
+        timeout: float | None = 0,
+    ) -> dict[str, Any]:
+        """Stream a CSV file with a header row into a table on the writer thread
+
+        The table is created from the header if it does not exist. See
+        ``bulk_insert`` for the other arguments.
+        """
+        return await self._submit(
+            lambda conn: self._load_csv(conn, path, table, delimiter, batch_size, fast, defer_indexes),
+            write=True,
+            timeout=timeout,
+        )
+
+    def _run_batch(
+        self, conn: sqlite3.Connection, statements: list[Statement], atomic: bool
+    ) -> dict[str, Any]:
+        """Run statements in one transaction
+
+        With ``atomic``, the first failing statement rolls back the whole
+        batch. Otherwise every statement runs inside its own savepoint, so a
+        failing statement is undone on its own and the rest are committed.
+        """
+        parsed = [_parse_statement(statement) for statement in statements]
+        results: list[dict[str, Any]] = []
+        conn.execute("BEGIN IMMEDIATE")
+        with closing(conn.cursor()) as cursor:
+            for index, (query, params, param_sets) in enumerate(parsed):
+                result: dict[str, Any] = {"index": index}
+                if not atomic:
+                    cursor.execute("SAVEPOINT batch_statement")
+                try:
+                    if param_sets is not None:
+                        cursor.executemany(query, param_sets)
+                    else:
+                        cursor.execute(query, params)
+                    if cursor.description is not None:
+                        result["columns"] = [column[0] for column in cursor.description]
+                        rows = cursor.fetchmany(DEFAULT_PAGE_SIZE + 1)
+                        result["rows"] = [list(row) for row in rows[:DEFAULT_PAGE_SIZE]]
+                        result["truncated"] = len(rows) > DEFAULT_PAGE_SIZE
+                    result["rowcount"] = cursor.rowcount
+                except sqlite3.Error as e:
+                    if isinstance(e, sqlite3.OperationalError) and str(e) == "interrupted":
+                        # Timed out or cancelled: the whole batch is rolled back
+                        raise
+                    if atomic:
+                        conn.rollback()
+                        result["error"] = str(e)
+                        results.append(result)
+                        logger.debug(f"Batch rolled back at statement {index}: {e}")
+                        return {"status": "rolled_back", "failed_index": index, "results": results}
+                    cursor.execute("ROLLBACK TO batch_statement")
+                    result["error"] = str(e)
+                if not atomic:
+                    cursor.execute("RELEASE batch_statement")
+                results.append(result)
+        conn.commit()
+        failed = sum(1 for result in results if "error" in result)
+        logger.debug(f"Batch of {len(results)} statements committed ({failed} failed)")
+        return {"status": "committed", "failed": failed, "results": results}
+
+    async def execute_batch(
+        self,
+        statements: list[Statement],
+        atomic: bool = True,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Run many statements in one transaction on the writer thread
+
+        Args:
+            statements: SQL strings, or ``{"query", "params"}`` objects, or
+                ``{"query", "param_sets"}`` objects run with executemany
+            atomic: Roll back every statement if one fails, rather than only
+                the failing one
+            timeout: Seconds before the batch is interrupted and rolled back
+
+        Returns:
+            The batch status and, per statement, its rowcount (plus its rows for
+            statements that return any, or its error)
+        """
+        if not statements:
+            raise ValueError("No statements to execute")
+        return await self._submit(
+            lambda conn: self._run_batch(conn, statements, atomic),
+            write=True,
+            timeout=timeout,
+        )
+
+async def main(
+    db_path: str,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    mmap_size: int = DEFAULT_MMAP_SIZE,
+    statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    readers: int = DEFAULT_READERS,
+    query_timeout: float = DEFAULT_QUERY_TIMEOUT,
+):
     logger.info(f"Starting SQLite MCP Server with DB path: {db_path}")
 
-    db = SqliteDatabase(db_path)
+    db = SqliteDatabase(
+        db_path,
+        cache_size=cache_size,
+        mmap_size=mmap_size,
+        statement_cache_size=statement_cache_size,
+        readers=readers,
+        query_timeout=query_timeout,
+    )
     server = Server("sqlite-manager")
 
     # Register handlers
@@ -242,11 +981,20 @@ async def main(db_path: str):
         return [
             types.Tool(
                 name="read_query",
-                description="Execute a SELECT query on the SQLite database",
+                description=(
+                    "Execute a SELECT query on the SQLite database. Results are paged: "
+                    "the response has the column names once, each row as an array, and a "
+                    "next_token to pass back as continuation_token for the next page."
+                ),
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "query": {"type": "string", "description": "SELECT SQL query to execute"},
+                        "page_size": {"type": "integer", "description": f"Maximum rows to return (default {DEFAULT_PAGE_SIZE}, at most {MAX_PAGE_SIZE})"},
+                        "continuation_token": {"type": "string", "description": "next_token from the previous page of the same query"},
+                        "max_bytes": {"type": "integer", "description": f"Approximate maximum size of the returned rows (default {DEFAULT_MAX_BYTES})"},
+                        "format": {"type": "string", "enum": list(OUTPUT_FORMATS), "description": "json (column header plus array rows) or csv"},
+                        "timeout": {"type": "number", "description": "Seconds before the query is interrupted (0 for no limit)"},
                     },
                     "required": ["query"],
                 },
@@ -258,6 +1006,7 @@ async def main(db_path: str):
                     "type": "object",
                     "properties": {
                         "query": {"type": "string", "description": "SQL query to execute"},
+                        "timeout": {"type": "number", "description": "Seconds before the query is interrupted (0 for no limit)"},
                     },
                     "required": ["query"],
                 },
@@ -292,6 +1041,74 @@ async def main(db_path: str):
                     "required": ["table_name"],
                 },
             ),
+            types.Tool(
+                name="execute_batch",
+                description=(
+                    "Execute many SQL statements in one transaction. With atomic (the default) "
+                    "a failing statement rolls back the whole batch; otherwise only the failing "
+                    "statement is rolled back and the rest are committed."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "statements": {
+                            "type": "array",
+                            "description": "SQL strings, or objects with a query and either params (one set) or param_sets (executemany)",
+                            "items": {
+                                "anyOf": [
+                                    {"type": "string"},
+                                    {
+                                        "type": "object",
+                                        "properties": {
+                                            "query": {"type": "string"},
+                                            "params": {"type": ["array", "object"]},
+                                            "param_sets": {"type": "array", "items": {"type": ["array", "object"]}},
+                                        },
+                                        "required": ["query"],
+                                    },
+                                ]
+                            },
+                        },
+                        "atomic": {"type": "boolean", "description": "Roll back the whole batch if a statement fails (default true)"},
+                        "timeout": {"type": "number", "description": "Seconds before the batch is interrupted and rolled back (0 for no limit)"},
+                    },
+                    "required": ["statements"],
+                },
+            ),
+            types.Tool(
+                name="bulk_insert",
+                description="Insert many rows into an existing table in a single transaction",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table": {"type": "string", "description": "Table to insert into"},
+                        "columns": {"type": "array", "items": {"type": "string"}, "description": "Columns the row values are for"},
+                        "rows": {"type": "array", "items": {"type": "array"}, "description": "Rows of values, in column order"},
+                        "batch_size": {"type": "integer", "description": f"Rows per executemany call (default {DEFAULT_BATCH_SIZE})"},
+                        "fast": {"type": "boolean", "description": "Load with PRAGMA synchronous=OFF (faster, not crash safe)"},
+                        "defer_indexes": {"type": "boolean", "description": "Drop the table's indexes during the load and rebuild them afterwards"},
+                        "timeout": {"type": "number", "description": "Seconds before the load is interrupted and rolled back (default no limit)"},
+                    },
+                    "required": ["table", "columns", "rows"],
+                },
+            ),
+            types.Tool(
+                name="load_csv",
+                description="Load a CSV file with a header row into a table (created if missing) in a single transaction",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "path": {"type": "string", "description": "Path of the CSV file on the server"},
+                        "table": {"type": "string", "description": "Table to load into"},
+                        "delimiter": {"type": "string", "description": "Field delimiter (default ,)"},
+                        "batch_size": {"type": "integer", "description": f"Rows per executemany call (default {DEFAULT_BATCH_SIZE})"},
+                        "fast": {"type": "boolean", "description": "Load with PRAGMA synchronous=OFF (faster, not crash safe)"},
+                        "defer_indexes": {"type": "boolean", "description": "Drop the table's indexes during the load and rebuild them afterwards"},
+                        "timeout": {"type": "number", "description": "Seconds before the load is interrupted and rolled back (default no limit)"},
+                    },
+                    "required": ["path", "table"],
+                },
+            ),
             types.Tool(
                 name="append_insight",
                 description="Add a business insight to the memo",
@@ -312,7 +1129,7 @@ async def main(db_path: str):
         """Handle tool execution requests"""
         try:
             if name == "list_tables":
-                results = db._execute_query(
+                results = await db.execute(
                     "SELECT name FROM sqlite_master WHERE type='table'"
                 )
                 return [types.TextContent(type="text", text=str(results))]
@@ -320,7 +1137,7 @@ async def main(db_path: str):
             elif name == "describe_table":
                 if not arguments or "table_name" not in arguments:
                     raise ValueError("Missing table_name argument")
-                results = db._execute_query(
+                results = await db.execute(
                     f"PRAGMA table_info({arguments['table_name']})"
                 )
                 return [types.TextContent(type="text", text=str(results))]
@@ -343,19 +1160,63 @@ async def main(db_path: str):
             if name == "read_query":
                 if not arguments["query"].strip().upper().startswith("SELECT"):
                     raise ValueError("Only SELECT queries are allowed for read_query")
-                results = db._execute_query(arguments["query"])
-                return [types.TextContent(type="text", text=str(results))]
+                page = await db.read_page(
+                    arguments["query"],
+                    page_size=arguments.get("page_size", DEFAULT_PAGE_SIZE),
+                    continuation_token=arguments.get("continuation_token"),
+                    max_bytes=arguments.get("max_bytes", DEFAULT_MAX_BYTES),
+                    output_format=arguments.get("format", "json"),
+                    timeout=arguments.get("timeout"),
+                )
+                if arguments.get("format") == "csv":
+                    return [
+                        types.TextContent(type="text", text=page.csv),
+                        types.TextContent(type="text", text=json.dumps(page.metadata())),
+                    ]
+                return [types.TextContent(type="text", text=page.to_json())]
 
             elif name == "write_query":
                 if arguments["query"].strip().upper().startswith("SELECT"):
                     raise ValueError("SELECT queries are not allowed for write_query")
-                results = db._execute_query(arguments["query"])
+                results = await db.execute(arguments["query"], write=True, timeout=arguments.get("timeout"))
                 return [types.TextContent(type="text", text=str(results))]
 
+            elif name == "execute_batch":
+                result = await db.execute_batch(
+                    arguments["statements"],
+                    atomic=arguments.get("atomic", True),
+                    timeout=arguments.get("timeout"),
+                )
+                return [types.TextContent(type="text", text=json.dumps(result, default=_json_value))]
+
+            elif name == "bulk_insert":
+                result = await db.bulk_insert(
+                    arguments["table"],
+                    arguments["columns"],
+                    arguments["rows"],
+                    batch_size=arguments.get("batch_size", DEFAULT_BATCH_SIZE),
+                    fast=arguments.get("fast", False),
+                    defer_indexes=arguments.get("defer_indexes", False),
+                    timeout=arguments.get("timeout", 0),
+                )
+                return [types.TextContent(type="text", text=json.dumps(result))]
+
+            elif name == "load_csv":
+                result = await db.load_csv(
+                    arguments["path"],
+                    arguments["table"],
+                    delimiter=arguments.get("delimiter", ","),
+                    batch_size=arguments.get("batch_size", DEFAULT_BATCH_SIZE),
+                    fast=arguments.get("fast", False),
+                    defer_indexes=arguments.get("defer_indexes", False),
+                    timeout=arguments.get("timeout", 0),
+                )
+                return [types.TextContent(type="text", text=json.dumps(result))]
+
             elif name == "create_table":
                 if not arguments["query"].strip().upper().startswith("CREATE TABLE"):
                     raise ValueError("Only CREATE TABLE statements are allowed")
-                db._execute_query(arguments["query"])
+                await db.execute(arguments["query"], write=True)
                 return [types.TextContent(type="text", text="Table created successfully")]
 
             else:
@@ -366,17 +1227,20 @@ async def main(db_path: str):
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        logger.info("Server running with stdio transport")
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="sqlite",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            logger.info("Server running with stdio transport")
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="sqlite",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        db.close()
@@ -0,0 +1,185 @@
+import asyncio
+import json
+import sqlite3
+
+import pytest
+from mcp_server_sqlite.server import QueryTimeoutError, SqliteDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SqliteDatabase(str(tmp_path / "test.db"), readers=2)
+    asyncio.run(database.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)", write=True))
+    yield database
+    database.close()
+
+
+def test_write_with_returning_is_committed(db):
+    rows = asyncio.run(
+        db.execute("INSERT INTO items (id, name) VALUES (1, 'a') RETURNING id, name", write=True)
+    )
+
+    assert rows == [{"id": 1, "name": "a"}]
+    # The writer must not keep the write lock after returning rows
+    other = sqlite3.connect(db.db_path, timeout=0)
+    try:
+        other.execute("INSERT INTO items (id, name) VALUES (2, 'b')")
+        other.commit()
+    finally:
+        other.close()
+    assert asyncio.run(db.execute("SELECT count(*) AS n FROM items")) == [{"n": 2}]
+
+
+def test_failed_fast_load_rolls_back_and_restores_synchronous(db):
+    asyncio.run(db.execute("CREATE INDEX items_name ON items (name)", write=True))
+
+    # The duplicate id fails the load after the index was dropped
+    with pytest.raises(sqlite3.IntegrityError):
+        asyncio.run(
+            db.bulk_insert("items", ["id", "name"], [(1, "a"), (1, "b")], fast=True, defer_indexes=True)
+        )
+
+    assert asyncio.run(db.execute("SELECT count(*) AS n FROM items")) == [{"n": 0}]
+    assert asyncio.run(db.execute("PRAGMA synchronous", write=True)) == [{"synchronous": 1}]
+    indexes = asyncio.run(db.execute("SELECT name FROM sqlite_master WHERE type = 'index'"))
+    assert indexes == [{"name": "items_name"}]
+
+
+def test_load_csv_is_not_limited_by_query_timeout(tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text("id,name\n" + "".join(f"{i},{i}\n" for i in range(200_000)))
+    database = SqliteDatabase(str(tmp_path / "test.db"), query_timeout=0.001)
+    try:
+        result = asyncio.run(database.load_csv(str(path), "rows"))
+        assert result["inserted_rows"] == 200_000
+        assert result["created_table"]
+        # Other queries still get the database's timeout
+        with pytest.raises(QueryTimeoutError):
+            asyncio.run(database.execute("SELECT count(*) FROM rows a, rows b"))
+    finally:
+        database.close()
+
+
+def read_all(db, query, **kwargs):
+    pages = [asyncio.run(db.read_page(query, **kwargs))]
+    while pages[-1].next_token:
+        pages.append(asyncio.run(db.read_page(query, continuation_token=pages[-1].next_token, **kwargs)))
+    return pages
+
+
+def test_read_page_continues_from_open_cursor(db):
+    asyncio.run(db.bulk_insert("items", ["id", "name"], [(i, f"n{i}") for i in range(2500)]))
+
+    pages = read_all(db, "SELECT a.id, b.id, a.name FROM items a JOIN items b USING (id) ORDER BY a.id", page_size=1000)
+
+    assert [page.row_count for page in pages] == [1000, 1000, 500]
+    assert [page.offset for page in pages] == [0, 1000, 2000]
+    # Duplicate column names are kept as the query returns them
+    assert pages[0].columns == ["id", "id", "name"]
+    rows = [json.loads(row) for page in pages for row in page.rows]
+    assert rows == [[i, i, f"n{i}"] for i in range(2500)]
+    assert not db._cursors
+
+
+def test_read_page_reruns_query_for_expired_token(db):
+    asyncio.run(db.bulk_insert("items", ["id", "name"], [(i, f"n{i}") for i in range(10)]))
+    query = "SELECT id FROM items ORDER BY id"
+    first = asyncio.run(db.read_page(query, page_size=4, output_format="csv"))
+    for entry in db._cursors.values():
+        entry.expires = 0
+
+    second = asyncio.run(db.read_page(query, page_size=4, output_format="csv", continuation_token=first.next_token))
+
+    assert first.csv.split() == ["id", "0", "1", "2", "3"]
+    assert second.csv.split() == ["id", "4", "5", "6", "7"]
+    assert second.next_token
+
+
+def test_cancelled_read_page_closes_its_connection(db, monkeypatch):
+    connections = []
+    cursor_connection = db._cursor_connection
+
+    def track():
+        connections.append(cursor_connection())
+        return connections[-1]
+
+    monkeypatch.setattr(db, "_cursor_connection", track)
+    # Counts for a long time before returning its single row
+    query = "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT count(*) FROM n"
+
+    async def cancel_read():
+        task = asyncio.create_task(db.read_page(query, timeout=0))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Closed once the interrupted statement has returned on the reader thread
+        for _ in range(100):
+            try:
+                connections[0].execute("SELECT 1")
+            except sqlite3.ProgrammingError:
+                return
+            await asyncio.sleep(0.05)
+        pytest.fail("connection of the cancelled read is still open")
+
+    asyncio.run(cancel_read())
+    assert not db._cursors
+    assert connections[0] not in db._idle_cursor_connections
+
+
+def test_failed_write_is_rolled_back(db):
+    with pytest.raises(sqlite3.OperationalError):
+        asyncio.run(db.execute("INSERT INTO items (id, missing) VALUES (1, 'a')", write=True))
+
+    # The writer connection is left without an open transaction
+    asyncio.run(db.execute("INSERT INTO items (id, name) VALUES (1, 'a')", write=True))
+    assert asyncio.run(db.execute("SELECT name FROM items")) == [{"name": "a"}]
+
+
+def test_timed_out_write_is_rolled_back(db):
+    asyncio.run(db.bulk_insert("items", ["id", "name"], [(i, "a") for i in range(2000)]))
+
+    with pytest.raises(QueryTimeoutError):
+        asyncio.run(
+            db.execute(
+                "UPDATE items SET name = (SELECT count(*) FROM items a, items b)",
+                write=True,
+                timeout=0.05,
+            )
+        )
+
+    assert asyncio.run(db.execute("SELECT DISTINCT name FROM items")) == [{"name": "a"}]
+
+
+def test_atomic_batch_rolls_back_every_statement(db):
+    result = asyncio.run(
+        db.execute_batch(
+            [
+                "INSERT INTO items (id, name) VALUES (1, 'a')",
+                {"query": "INSERT INTO items (id, name) VALUES (?, ?)", "param_sets": [[2, "b"], [1, "c"]]},
+            ]
+        )
+    )
+
+    assert result["status"] == "rolled_back"
+    assert result["failed_index"] == 1
+    assert asyncio.run(db.execute("SELECT count(*) AS n FROM items")) == [{"n": 0}]
+
+
+def test_non_atomic_batch_rolls_back_only_failing_statement(db):
+    result = asyncio.run(
+        db.execute_batch(
+            [
+                {"query": "INSERT INTO items (id, name) VALUES (?, ?)", "params": [1, "a"]},
+                "INSERT INTO items (id, name) VALUES (1, 'b')",
+                "UPDATE items SET name = 'c' RETURNING id, name",
+            ],
+            atomic=False,
+        )
+    )
+
+    assert result["status"] == "committed"
+    assert result["failed"] == 1
+    assert "error" in result["results"][1]
+    assert result["results"][2]["rows"] == [[1, "c"]]
+    assert asyncio.run(db.execute("SELECT id, name FROM items")) == [{"id": 1, "name": "c"}]
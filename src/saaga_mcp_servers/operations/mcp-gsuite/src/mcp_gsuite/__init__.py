@@ -30,6 +30,8 @@ from mcp_gsuite.tools.auth import auth
 
 # from saaga_mcp_base.base.base_mcp import create_mcp
 from mcp.server.fastmcp import FastMCP
+from saaga_mcp_base.lib.cache import cache, uses_cache
+from saaga_mcp_base.lib.progress import is_streaming, relay_progress
 
 
 def main():
@@ -62,6 +64,13 @@ def main():
     mcp = FastMCP("mcp_gsuite")
     for tool in all_tools:
         logger.debug(f"Adding tool: {tool.__name__}")
+        # Progress of tools marked with @streams_progress is relayed to the
+        # client, and tools marked with @cached_tool are served from the
+        # saaga_mcp_base cache
+        if is_streaming(tool):
+            tool = relay_progress(tool)
+        if uses_cache(tool):
+            tool = cache(tool, namespace="mcp_gsuite")
         mcp.add_tool(tool)
 
     # mcp = create_mcp("mcp_gsuite", tools=all_tools)
@@ -7,6 +7,10 @@ import traceback
 from email.mime.text import MIMEText
 from typing import Tuple
 from loguru import logger  # Use this logger
+from saaga_mcp_base import report_progress
+
+# query_emails reports progress after this many fetched messages
+PROGRESS_EVERY = 10
 
 
 class GmailService:
@@ -177,7 +181,7 @@ class GmailService:
             parsed = []
 
             # Fetch full message details for each message
-            for msg in messages:
+            for index, msg in enumerate(messages, start=1):
                 txt = (
                     self.service.users()
                     .messages()
@@ -187,6 +191,11 @@ class GmailService:
                 parsed_message = self._parse_message(txt=txt, parse_body=False)
                 if parsed_message:
                     parsed.append(parsed_message)
+                # Only sent when called from a tool marked with @streams_progress
+                if index % PROGRESS_EVERY == 0 or index == len(messages):
+                    report_progress(
+                        index, len(messages), message=f"Fetched {index} emails"
+                    )
 
             return parsed
 
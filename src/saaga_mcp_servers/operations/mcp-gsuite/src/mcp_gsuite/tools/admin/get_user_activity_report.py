@@ -5,9 +5,11 @@ from datetime import datetime, timedelta
 from mcp_gsuite.lib.accounts import format_docstring_with_user_id_arg
 from googleapiclient.discovery import build
 from mcp_gsuite.lib.auth import credentials as cred_module
+from saaga_mcp_base import report_progress, streams_progress
 from loguru import logger
 
 
+@streams_progress
 @format_docstring_with_user_id_arg
 async def get_user_activity_report(
     user_id: str,
@@ -95,6 +97,11 @@ async def get_user_activity_report(
                         logger.info(
                             f"Retrieved {len(response['items'])} {app} activities"
                         )
+                        report_progress(
+                            len(all_activities) + min(len(activities), max_results),
+                            max_results * len(applications),
+                            message=f"Retrieved {len(activities)} {app} activities",
+                        )
 
                     # Check for next page
                     request = service.activities().list_next(request, response)
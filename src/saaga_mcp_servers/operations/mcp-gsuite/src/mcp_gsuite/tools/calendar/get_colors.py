@@ -1,10 +1,13 @@
 import json
 import asyncio
 from mcp_gsuite.lib.accounts import format_docstring_with_user_id_arg
+from saaga_mcp_base import cached_tool
 from ...lib import calendar
 from loguru import logger
 
 
+# The palette is fixed by Google, so it is kept for a day
+@cached_tool(ttl=86400, key="{user_id}")
 @format_docstring_with_user_id_arg
 async def get_calendar_colors(
     user_id: str,
@@ -2,10 +2,12 @@ import json
 import asyncio
 from typing import List, Dict, Any, Optional  # Added Optional for consistency
 from mcp_gsuite.lib.accounts import format_docstring_with_user_id_arg
+from saaga_mcp_base import cached_tool
 from ...lib import calendar  # calendar service
 from loguru import logger
 
 
+@cached_tool(key="{user_id}")
 @format_docstring_with_user_id_arg
 async def list_calendars(user_id: str) -> str:
     """
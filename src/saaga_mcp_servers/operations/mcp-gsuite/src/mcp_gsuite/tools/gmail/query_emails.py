@@ -2,10 +2,12 @@ import json
 import asyncio
 from typing import Optional
 from mcp_gsuite.lib.accounts import format_docstring_with_user_id_arg
+from saaga_mcp_base import streams_progress
 from ...lib import gmail
 from loguru import logger
 
 
+@streams_progress
 @format_docstring_with_user_id_arg
 async def query_gmail_emails(
     user_id: str,
@@ -33,6 +33,7 @@ import concurrent.futures
 
 from mcp.server.fastmcp import FastMCP
 from loguru import logger
+from saaga_mcp_base.lib.progress import relay_progress, report_progress, streams_progress
 
 from .lib.transcribe import transcribe_audiofile
 
@@ -50,6 +51,8 @@ transcriber_service = AssemblyAIService()
     description="Transcribe an audio or video file or process files in a directory recursively and return their text content. "
     "Supports multiple media formats.",
 )
+@relay_progress
+@streams_progress
 async def transcribe_file(
     input_path: str,
     language_code: str = DEFAULT_LANGUAGE,
@@ -114,11 +117,23 @@ async def transcribe_file(
             "data": [],
         }
 
+    transcribed = 0
+
+    async def transcribe(file_path: Path):
+        nonlocal transcribed
+        try:
+            return await transcribe_audiofile(str(file_path), language_code)
+        finally:
+            # Relayed to the client as a progress notification
+            transcribed += 1
+            report_progress(
+                transcribed,
+                len(files_to_process),
+                message=f"Transcribed {file_path.name}",
+            )
+
     # Create tasks for parallel transcription
-    tasks = [
-        transcribe_audiofile(str(file_path), language_code)
-        for file_path in files_to_process
-    ]
+    tasks = [transcribe(file_path) for file_path in files_to_process]
 
     # Run tasks concurrently, allowing exceptions to be returned
     transcription_results = await asyncio.gather(*tasks, return_exceptions=True)